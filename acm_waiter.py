@@ -0,0 +1,260 @@
+"""
+Wait for an ACM certificate without sleep-and-rerun loops.
+
+wait_for_issued() runs two tasks side by side:
+
+  - describe_certificate polling with exponential backoff and jitter
+  - a public DNS check of the validation CNAMEs (ACM cannot validate before
+    they resolve)
+
+The moment the CNAMEs become visible, the poller is woken and its backoff
+reset, because issuance normally follows within a few minutes. A poll that fails
+with a transient AWS error (throttling, network, 5xx) is reported and retried on
+the same backoff; only errors that cannot recover (access denied, unknown
+certificate, no credentials) end the wait by raising. The wait ends when the
+certificate is ISSUED, reaches a terminal failure status, or times out.
+Each issued certificate is appended to build/acm/issue-history.jsonl so later
+runs can show how long validation usually takes.
+
+  import asyncio
+  from acm_waiter import wait_for_issued, record_history
+  result = asyncio.run(wait_for_issued(acm, cert_arn))
+  if result.status == "ISSUED":
+      record_history(result)
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import namedtuple
+from datetime import timezone
+from pathlib import Path
+
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+# dns_probe installs dnspython when it is missing
+from dns_probe import make_resolver
+
+import dns.exception
+
+REPO_ROOT = Path(__file__).resolve().parent
+HISTORY_PATH = REPO_ROOT / "build" / "acm" / "issue-history.jsonl"
+
+BASE_DELAY = 5.0
+MAX_DELAY = 60.0
+DNS_CHECK_INTERVAL = 15.0
+# ACM gives up on DNS validation after 72 hours
+DEFAULT_TIMEOUT = 72 * 60 * 60
+RECORDS_TIMEOUT = 120.0
+FAILED_STATUSES = ("FAILED", "VALIDATION_TIMED_OUT", "REVOKED", "EXPIRED", "INACTIVE")
+# describe_certificate errors that retrying cannot fix
+FATAL_ERROR_CODES = (
+    "AccessDenied", "AccessDeniedException", "ResourceNotFoundException", "InvalidArnException",
+    "ValidationException", "UnrecognizedClientException", "InvalidClientTokenId",
+)
+
+WaitResult = namedtuple("WaitResult", ["status", "certificate", "waited", "dns_visible_after", "polls"])
+
+
+def validation_records(certificate):
+    """Distinct (name, type, value) validation records; ACM often shares one record between apex and www."""
+    records = []
+    for option in certificate.get("DomainValidationOptions", []):
+        record = option.get("ResourceRecord")
+        if record:
+            records.append((record["Name"].lower(), record["Type"], record["Value"].lower()))
+    return list(dict.fromkeys(records))
+
+
+def find_certificate(acm, domain):
+    """ARN of the newest certificate for `domain` (any status), or None."""
+    newest = None
+    for page in acm.get_paginator("list_certificates").paginate():
+        for summary in page.get("CertificateSummaryList", []):
+            if summary["DomainName"] == domain:
+                created = summary.get("CreatedAt")
+                if newest is None or (created and (newest[0] is None or created > newest[0])):
+                    newest = (created, summary["CertificateArn"])
+    return newest[1] if newest else None
+
+
+def backoff_delays(base=BASE_DELAY, maximum=MAX_DELAY):
+    """base, 2*base, 4*base, ... capped at `maximum`, each scaled by a random 50-100%."""
+    attempt = 0
+    while True:
+        yield min(maximum, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+        attempt += 1
+
+
+async def _describe(acm, cert_arn):
+    response = await asyncio.to_thread(acm.describe_certificate, CertificateArn=cert_arn)
+    return response["Certificate"]
+
+
+def is_fatal(error):
+    """True for AWS errors a later poll cannot recover from."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in FATAL_ERROR_CODES
+    return isinstance(error, NoCredentialsError)
+
+
+async def _poll(acm, cert_arn, on_event):
+    """The certificate, or None after reporting a transient error; fatal errors are raised."""
+    try:
+        return await _describe(acm, cert_arn)
+    except (ClientError, BotoCoreError) as e:
+        if is_fatal(e):
+            raise
+        on_event("error", f"describe_certificate failed, will retry: {e}")
+        return None
+
+
+async def wait_for_records(acm, cert_arn, timeout=RECORDS_TIMEOUT, on_event=None):
+    """
+    Certificate once ACM has generated a validation record for every DNS-validated
+    domain (it takes a few seconds after request_certificate). A certificate that
+    is no longer PENDING_VALIDATION is returned as is. Raises TimeoutError, or the
+    AWS error if it is fatal.
+    """
+    on_event = on_event or (lambda kind, message: None)
+    deadline = time.monotonic() + timeout
+    for delay in backoff_delays(base=1.0, maximum=10.0):
+        certificate = await _poll(acm, cert_arn, on_event)
+        if certificate and certificate.get("Status") != "PENDING_VALIDATION":
+            return certificate
+        options = certificate.get("DomainValidationOptions", []) if certificate else []
+        if options and all("ResourceRecord" in option or option.get("ValidationMethod") == "EMAIL"
+                           for option in options):
+            return certificate
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"No validation records for {cert_arn} after {timeout:.0f}s")
+        await asyncio.sleep(delay)
+
+
+async def _cname_visible(resolver, name, value):
+    try:
+        answer = await resolver.resolve(name, "CNAME", search=False)
+    except dns.exception.DNSException:
+        return False
+    return any(rdata.target.to_text().rstrip(".").lower() == value.rstrip(".") for rdata in answer)
+
+
+async def _watch_dns(records, visible, nameserver, port, on_event):
+    resolver = make_resolver(nameserver, port)
+    pending = set(records)
+    while pending:
+        checks = await asyncio.gather(*(_cname_visible(resolver, name, value) for name, _, value in pending))
+        for record, ok in zip(list(pending), checks):
+            if ok:
+                pending.discard(record)
+                on_event("dns", f"validation record resolves: {record[0]}")
+        if pending:
+            await asyncio.sleep(DNS_CHECK_INTERVAL)
+    visible.set()
+
+
+async def wait_for_issued(acm, cert_arn, timeout=DEFAULT_TIMEOUT, base_delay=BASE_DELAY, max_delay=MAX_DELAY,
+                          nameserver=None, port=53, on_event=None):
+    """
+    Poll until the certificate leaves PENDING_VALIDATION. `on_event(kind, message)`
+    is called for status changes ("status"), DNS progress ("dns") and transient
+    poll failures ("error"). Fatal AWS errors are raised (see is_fatal()), and
+    TimeoutError if ACM never generates the validation records.
+    """
+    on_event = on_event or (lambda kind, message: None)
+    started = time.monotonic()
+    certificate = await wait_for_records(acm, cert_arn, on_event=on_event)
+    visible = asyncio.Event()
+    records = validation_records(certificate)
+    # Nothing to watch for an email-validated or already decided certificate
+    dns_task = None
+    if records and certificate["Status"] == "PENDING_VALIDATION":
+        dns_task = asyncio.create_task(_watch_dns(records, visible, nameserver, port, on_event))
+    dns_visible_after = None
+    polls = 1
+    status = None
+    delays = backoff_delays(base_delay, max_delay)
+    try:
+        while True:
+            if certificate["Status"] != status:
+                status = certificate["Status"]
+                on_event("status", status)
+            if status == "ISSUED" or status in FAILED_STATUSES:
+                break
+            delay = next(delays)
+            if time.monotonic() - started + delay > timeout:
+                status = "TIMEOUT"
+                break
+            # Sleep for the backoff delay, or until the validation CNAMEs become visible
+            if dns_visible_after is None:
+                try:
+                    await asyncio.wait_for(visible.wait(), delay)
+                    dns_visible_after = time.monotonic() - started
+                    delays = backoff_delays(base_delay, max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(delay)
+            certificate = await _poll(acm, cert_arn, on_event) or certificate
+            polls += 1
+    finally:
+        if dns_task is not None:
+            dns_task.cancel()
+    return WaitResult(status, certificate, time.monotonic() - started, dns_visible_after, polls)
+
+
+# ---------------------------------------------------------------------------
+# Time-to-issue history
+# ---------------------------------------------------------------------------
+
+def _timestamp(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def record_history(result, path=HISTORY_PATH):
+    """
+    Append one issued certificate's timings (request -> issue, our wait, DNS
+    visibility) as a JSON line; certificates already in the history are skipped.
+    """
+    certificate = result.certificate
+    for entry in load_history(path):
+        if entry.get("certificate_arn") == certificate.get("CertificateArn"):
+            return entry
+    created, issued = _timestamp(certificate.get("CreatedAt")), _timestamp(certificate.get("IssuedAt"))
+    entry = {
+        "certificate_arn": certificate.get("CertificateArn"),
+        "domain": certificate.get("DomainName"),
+        "created_at": created,
+        "issued_at": issued,
+        "seconds_to_issue": issued - created if created and issued else None,
+        "waited": round(result.waited, 1),
+        "dns_visible_after": round(result.dns_visible_after, 1) if result.dns_visible_after is not None else None,
+        "polls": result.polls,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def load_history(path=HISTORY_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def history_summary(entries):
+    """(count, median, max) seconds from request to issue, or None without history."""
+    durations = [e["seconds_to_issue"] for e in entries if e.get("seconds_to_issue")]
+    if not durations:
+        return None
+    return len(durations), statistics.median(durations), max(durations)
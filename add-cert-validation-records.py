@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Add an ACM certificate's DNS validation records to its Route 53 hosted zone.
+
+Reads every DomainValidationOptions record (apex, www, ... deduplicated, since
+ACM often shares one record), compares them with the zone's current records and
+submits one change batch containing only the missing or changed CNAMEs. Then
+waits until Route 53 reports the change INSYNC. Safe to re-run.
+
+Usage:
+  python3 add-cert-validation-records.py --domain ffjconsulting.com
+  python3 add-cert-validation-records.py --cert-arn arn:aws:acm:... --zone-id Z0268429M8AW2ZUY4ECU
+  python3 add-cert-validation-records.py --domain ffjconsultingllc.com --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from acm_waiter import find_certificate, wait_for_records
+from route53_records import find_hosted_zone, sync_validation_records
+
+PROFILE = "my-sso"
+REGION = "us-east-1"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Add ACM DNS validation records to Route 53 (idempotent)")
+    ap.add_argument("--cert-arn", help="Certificate ARN (default: newest certificate for --domain)")
+    ap.add_argument("--domain", help="Certificate domain; also used to find the hosted zone")
+    ap.add_argument("--zone-id", help="Hosted zone id (default: looked up from the certificate's domain)")
+    ap.add_argument("--dry-run", action="store_true", help="Show the changes without submitting them")
+    ap.add_argument("--no-wait", action="store_true", help="Do not wait for the change to be INSYNC")
+    args = ap.parse_args()
+    if not args.cert_arn and not args.domain:
+        ap.error("--cert-arn or --domain is required")
+
+    import boto3
+    try:
+        session = boto3.Session(profile_name=PROFILE)
+        acm = session.client("acm", region_name=REGION)
+        route53 = session.client("route53", region_name=REGION)
+        cert_arn = args.cert_arn or find_certificate(acm, args.domain)
+    except Exception as e:
+        print(f"❌ Error connecting to AWS: {e}")
+        sys.exit(1)
+    if not cert_arn:
+        print(f"❌ No certificate found for {args.domain}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Adding SSL Certificate Validation Records")
+    print("=" * 60)
+    print(f"Certificate: {cert_arn}")
+
+    try:
+        certificate = asyncio.run(wait_for_records(acm, cert_arn))
+    except (TimeoutError, ClientError, BotoCoreError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    try:
+        zone_id = args.zone_id or find_hosted_zone(route53, args.domain or certificate["DomainName"])
+    except (ClientError, BotoCoreError) as e:
+        print(f"❌ Could not look up the hosted zone: {e}")
+        sys.exit(1)
+    if not zone_id:
+        print(f"❌ No public hosted zone for {args.domain or certificate['DomainName']}")
+        sys.exit(1)
+    print(f"Hosted zone: {zone_id}")
+    print("")
+
+    try:
+        planned, status = sync_validation_records(acm, route53, cert_arn, zone_id, certificate=certificate,
+                                                  dry_run=args.dry_run, wait=not args.no_wait)
+    except (ClientError, BotoCoreError) as e:
+        print(f"❌ Could not update the validation records: {e}")
+        sys.exit(1)
+    if status == "UNCHANGED":
+        print("✅ All validation records are already in the zone; nothing to change")
+        return
+    for change, reason in planned:
+        record_set = change["ResourceRecordSet"]
+        print(f"   {reason:8} {record_set['Name']} CNAME {record_set['ResourceRecords'][0]['Value']}")
+    print("")
+    if status == "DRY_RUN":
+        print(f"ℹ️  Dry run: {len(planned)} records would be submitted in one batch")
+    elif status == "INSYNC":
+        print(f"✅ {len(planned)} records added in one batch and in sync on all Route 53 servers")
+    elif status == "PENDING":
+        print(f"✅ {len(planned)} records submitted in one batch")
+    else:
+        print(f"⚠️  Change submitted but still {status}; Route 53 will finish propagating it")
+
+    if status != "DRY_RUN":
+        print("")
+        print("Wait for the certificate with:")
+        print(f"   python3 wait-for-certificate.py --cert-arn {cert_arn}")
+
+
+if __name__ == "__main__":
+    main()
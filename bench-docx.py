@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the resume .docx tooling.
+
+Generates synthetic documents (headings, bullets with many runs, large tables
+and embedded images) at several sizes, then times the operations our scripts
+perform on them:
+
+  open           python-docx Document() load (included in every case below)
+  extract        extract_docx.py text extraction
+  replace        fix-resume-date-docx.py date replacement over paragraphs and tables
+  anchor         locating the "Client: Nike" paragraph (add-fidelity-platform-bullets-docx.py)
+  insert_before  inserting the Fidelity bullets before that anchor
+  insert_after   inserting the healthcare bullets after the "SAIC" paragraph
+  md_to_docx     resume markdown of the same size rendered to .docx (resume_docx.py)
+  hyperlinks     one link per paragraph-size unit via resume_docx.add_hyperlinks()
+  hyperlinks_legacy  the same links via the old relate_to + parse_xml per link
+
+Each case runs in a fresh child process so wall time and peak RSS are not
+polluted by earlier cases. Results can be saved as a JSON baseline and later
+runs compared against it.
+
+Run from repo root:
+  python3 bench-docx.py                                  # 1k and 10k paragraphs
+  python3 bench-docx.py --sizes 1000,10000,100000 --save build/bench/docx-baseline.json
+  python3 bench-docx.py --compare build/bench/docx-baseline.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from repo_scripts import load_script
+
+REPO_ROOT = Path(__file__).resolve().parent
+CASES = ["open", "extract", "replace", "anchor", "insert_before", "insert_after", "md_to_docx",
+         "hyperlinks", "hyperlinks_legacy"]
+DEFAULT_SIZES = [1000, 10000]
+REGRESSION_TOLERANCE = 0.20
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+WORDS = ["Kubernetes", "Terraform", "Bedrock", "EventBridge", "Lambda", "modernization",
+         "pipelines", "microservices", "GenAI", "architecture", "Python", "Java"]
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ---------------------------------------------------------------------------
+# Synthetic documents
+# ---------------------------------------------------------------------------
+
+def _png(width, height, seed):
+    """A solid-colour RGB PNG built with zlib, so no imaging library is needed."""
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    pixel = bytes(((seed * 67) % 256, (seed * 131) % 256, (seed * 29) % 256))
+    raw = b"".join(b"\x00" + pixel * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 6))
+            + chunk(b"IEND", b""))
+
+
+def _run(text, bold=False):
+    rpr = "<w:rPr><w:b/></w:rPr>" if bold else ""
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _para(text_runs, style=None):
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{ppr}{''.join(text_runs)}</w:p>"
+
+
+def _sentence(n, words=8):
+    return " ".join(WORDS[(n + k) % len(WORDS)] for k in range(words))
+
+
+def make_document(path, paragraphs, runs_per_paragraph=6, table_every=2000, table_rows=40,
+                  table_cols=4, images=5):
+    """
+    Write a synthetic resume-like .docx with roughly `paragraphs` body paragraphs.
+
+    The skeleton (styles, images, relationships) comes from python-docx; the body
+    XML is generated directly so 100k-paragraph documents build in seconds.
+    """
+    from docx import Document
+    from docx.shared import Inches
+
+    skeleton = Document()
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in range(images):
+            img = Path(tmp) / f"img{n}.png"
+            img.write_bytes(_png(1200, 800, n + 1))
+            skeleton.add_picture(str(img), width=Inches(2))
+        skeleton_path = Path(tmp) / "skeleton.docx"
+        skeleton.save(str(skeleton_path))
+        with zipfile.ZipFile(skeleton_path) as zf:
+            parts = {info.filename: zf.read(info.filename) for info in zf.infolist()}
+
+    document_xml = parts["word/document.xml"].decode("utf-8")
+    body_start = document_xml.index("<w:body>") + len("<w:body>")
+    sect_start = document_xml.rindex("<w:sectPr")
+    picture_paragraphs = document_xml[body_start:sect_start]
+
+    body = [picture_paragraphs]
+    fidelity_at = int(paragraphs * 0.8)
+    saic_at = int(paragraphs * 0.9)
+    for n in range(paragraphs):
+        if n == fidelity_at:
+            body.append(_para([_run("FFJ Consulting LLC (Client: Fidelity) — St. Louis, MO")], "Heading3"))
+        elif n == fidelity_at + 20:
+            body.append(_para([_run("FFJ Consulting LLC (Client: Nike) — St. Louis, MO")], "Heading3"))
+        elif n == saic_at:
+            body.append(_para([_run("SAIC", True), _run(" — Senior Full-Stack Developer | 2015 – 2016")], "ListBullet"))
+        elif n % 50 == 0:
+            body.append(_para([_run(f"SECTION {n // 50}")], "Heading2"))
+        elif n % 97 == 0:
+            body.append(_para([_run("Senior Developer", True), _run(" | Mar 2017 – Nov 2017")]))
+        else:
+            runs = [_run(_sentence(n + r, 3) + " ", bold=(r % 3 == 0)) for r in range(runs_per_paragraph)]
+            body.append(_para(runs, "ListBullet"))
+        if table_every and n and n % table_every == 0:
+            row = "<w:tr>" + "".join(
+                f"<w:tc><w:p>{_run(_sentence(c, 4))}</w:p></w:tc>" for c in range(table_cols)
+            ) + "</w:tr>"
+            body.append(f"<w:tbl><w:tblPr/>{row * table_rows}</w:tbl>")
+
+    parts["word/document.xml"] = (
+        document_xml[:body_start] + "".join(body) + document_xml[sect_start:]
+    ).encode("utf-8")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+
+
+def make_markdown(path, paragraphs):
+    """Resume-style markdown with about `paragraphs` lines of content."""
+    lines = ["# SYNTHETIC RESUME", "", "**St. Louis, MO • 555-555-5555 • someone@example.com**", ""]
+    for n in range(paragraphs):
+        if n % 50 == 0:
+            lines += ["---", "", f"## SECTION {n // 50}", ""]
+        elif n % 10 == 0:
+            lines.append(f"### Role {n} — St. Louis, MO")
+        else:
+            lines.append(f"- **{WORDS[n % len(WORDS)]}** {_sentence(n)} [link](https://example.com/{n}) *{WORDS[(n + 3) % len(WORDS)]}*")
+    Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def legacy_add_hyperlink(paragraph, url, text):
+    """The per-link relate_to + string parse_xml approach the scripts used before resume_docx.HyperlinkWriter."""
+    from docx.oxml import parse_xml
+
+    r_id = paragraph.part.relate_to(
+        url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True
+    )
+    paragraph._p.append(parse_xml(
+        f'<w:hyperlink r:id="{r_id}" xmlns:w="{W_NS}" '
+        f'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<w:r><w:rPr><w:color w:val="0563C1"/><w:u w:val="single"/></w:rPr><w:t>{escape(text)}</w:t></w:r></w:hyperlink>'
+    ))
+
+
+def _link_targets(doc, count):
+    """`count` links spread over count/20 paragraphs; every URL is used about 4 times."""
+    paragraphs = [doc.add_paragraph() for _ in range(max(1, count // 20))]
+    distinct = max(1, count // 4)
+    return [(paragraphs[n % len(paragraphs)], f"https://example.com/article/{n % distinct}", f"link {n}")
+            for n in range(count)]
+
+
+# ---------------------------------------------------------------------------
+# Cases (each runs in its own child process)
+# ---------------------------------------------------------------------------
+
+def run_case(case, docx_path, md_path, out_dir):
+    from docx import Document
+
+    start = time.perf_counter()
+    if case == "open":
+        Document(docx_path)
+    elif case == "extract":
+        extract = load_script("extract_docx.py")
+        text = extract.extract_docx_text(docx_path)
+        if text.startswith("Error extracting content"):
+            raise RuntimeError(text)
+    elif case == "replace":
+        fix = load_script("fix-resume-date-docx.py")
+        doc = Document(docx_path)
+        for para in doc.paragraphs:
+            fix.replace_in_paragraph(para)
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    for para in cell.paragraphs:
+                        fix.replace_in_paragraph(para)
+    elif case == "anchor":
+        fid = load_script("add-fidelity-platform-bullets-docx.py")
+        doc = Document(docx_path)
+        if not any(fid.NEXT_SECTION_MARKER.lower() in (p.text or "").lower() for p in doc.paragraphs):
+            raise RuntimeError("anchor not found")
+    elif case == "insert_before":
+        fid = load_script("add-fidelity-platform-bullets-docx.py")
+        doc = Document(docx_path)
+        nike = next(p for p in doc.paragraphs if fid.NEXT_SECTION_MARKER.lower() in (p.text or "").lower())
+        for bullet in reversed(fid.BULLETS):
+            fid._insert_paragraph_before(nike, bullet)
+        doc.save(str(Path(out_dir) / "insert_before.docx"))
+    elif case == "insert_after":
+        hc = load_script("add-healthcare-experience-docx.py")
+        doc = Document(docx_path)
+        last = next(p for p in doc.paragraphs if "saic" in (p.text or "").lower())
+        for bullet in hc.HEALTHCARE_BULLETS:
+            last = hc._insert_paragraph_after(last, bullet)
+        doc.save(str(Path(out_dir) / "insert_after.docx"))
+    elif case == "md_to_docx":
+        from resume_docx import blocks_to_document
+        from resume_markdown import parse_resume
+        blocks_to_document(parse_resume(md_path)).save(str(Path(out_dir) / "md_to_docx.docx"))
+    elif case in ("hyperlinks", "hyperlinks_legacy"):
+        from resume_docx import add_hyperlinks
+        doc = Document()
+        size = int(Path(docx_path).stem.rsplit("_", 1)[-1])
+        links = _link_targets(doc, size)
+        start = time.perf_counter()  # time only the link insertion
+        if case == "hyperlinks":
+            add_hyperlinks(links)
+        else:
+            for paragraph, url, text in links:
+                legacy_add_hyperlink(paragraph, url, text)
+    else:
+        raise ValueError(f"unknown case: {case}")
+    return time.perf_counter() - start
+
+
+def _child(args):
+    seconds = run_case(args.case, args.docx, args.md, args.workdir)
+    print(json.dumps({"seconds": seconds, "peak_rss_mb": _peak_rss_mb()}))
+
+
+def _spawn_case(case, docx_path, md_path, workdir):
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--case", case,
+           "--docx", str(docx_path), "--md", str(md_path), "--workdir", str(workdir)]
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        return {"error": (result.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def compare(results, baseline, tolerance):
+    """Print per-case deltas against a baseline; returns the number of regressions."""
+    regressions = 0
+    print("")
+    print("=" * 70)
+    print(f"Comparison with baseline (regression threshold +{tolerance:.0%})")
+    print("=" * 70)
+    for key, now in results.items():
+        before = baseline.get("results", {}).get(key)
+        if not before or "seconds" not in before or "seconds" not in now:
+            print(f"  {key:28} (no baseline)")
+            continue
+        delta = (now["seconds"] - before["seconds"]) / before["seconds"] if before["seconds"] else 0.0
+        rss_delta = now["peak_rss_mb"] - before["peak_rss_mb"]
+        flag = "✅"
+        if delta > tolerance:
+            flag = "⚠️ "
+            regressions += 1
+        print(f"{flag} {key:28} {before['seconds']:8.3f}s → {now['seconds']:8.3f}s ({delta:+.0%})  "
+              f"RSS {rss_delta:+.1f} MB")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES), help="Paragraph counts, comma-separated")
+    ap.add_argument("--cases", default=",".join(CASES), help="Cases to run: " + ", ".join(CASES))
+    ap.add_argument("--runs-per-paragraph", type=int, default=6, help="Runs in each synthetic paragraph")
+    ap.add_argument("--images", type=int, default=5, help="Embedded images per document")
+    ap.add_argument("--save", help="Write results to this JSON baseline")
+    ap.add_argument("--compare", help="Compare results with this JSON baseline")
+    ap.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="Allowed slowdown before flagging")
+    # Internal: run a single case in this (child) process
+    ap.add_argument("--case", help=argparse.SUPPRESS)
+    ap.add_argument("--docx", help=argparse.SUPPRESS)
+    ap.add_argument("--md", help=argparse.SUPPRESS)
+    ap.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.case:
+        _child(args)
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        print(f"❌ Unknown case(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("Docx tooling benchmark")
+    print("=" * 70)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            docx_path = Path(workdir) / f"synthetic_{size}.docx"
+            md_path = Path(workdir) / f"synthetic_{size}.md"
+            start = time.perf_counter()
+            make_document(docx_path, size, runs_per_paragraph=args.runs_per_paragraph, images=args.images)
+            make_markdown(md_path, size)
+            print(f"\n📄 {size} paragraphs: {docx_path.stat().st_size / 1024:.0f} KB "
+                  f"(generated in {time.perf_counter() - start:.1f}s)")
+            for case in cases:
+                result = _spawn_case(case, docx_path, md_path, workdir)
+                results[f"{case}@{size}"] = result
+                if "error" in result:
+                    print(f"  ❌ {case:18} {result['error']}")
+                else:
+                    print(f"  {case:18} {result['seconds']:8.3f}s  peak RSS {result['peak_rss_mb']:7.1f} MB")
+
+    if args.save:
+        out = Path(args.save)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"\n💾 Baseline saved: {out}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: single-pass inline tokenizer (resume_markdown.py) vs the old
+re.search / re.split chain that add_inline_formatted() used to run per line.
+
+Generates a synthetic 10k-line resume-style markdown file and tokenizes every
+line with both implementations. No .docx is written, so only parsing is timed.
+
+Run from repo root: python3 bench-markdown-tokenizer.py [--lines 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from resume_markdown import tokenize_inline
+
+LINE_TEMPLATES = [
+    "- Led modernization of **{word}** systems into AWS cloud-native services using {word}, {word} and {word}.",
+    "**{word}:** {word}, {word}, {word}, {word}, {word}",
+    "- Built *{word}* pipelines with [{word}](https://example.com/{word}) and **{word}** automation.",
+    "Visit our website: [https://ffjconsultingllc.com/{word}](https://ffjconsultingllc.com/{word})",
+    "- Plain bullet about {word} and {word} with no inline formatting at all, just words.",
+    "**{word}**  ",
+]
+WORDS = ["Kubernetes", "Terraform", "Bedrock", "EventBridge", "Lambda", "Python", "Java", "GenAI", "EKS", "CDK"]
+
+
+def legacy_inline_tokens(line):
+    """The pre-tokenizer algorithm from sync-resume-md-to-docx.py, emitting (kind, text) pairs."""
+    out = []
+    rest = line
+    while True:
+        m = re.search(r'\[([^\]]+)\]\(([^)]+)\)', rest)
+        if not m:
+            break
+        before = rest[:m.start()]
+        link_text = m.group(1)
+        rest = rest[m.end():]
+        for part in re.split(r'\*\*([^*]+)\*\*', before):
+            if part:
+                out.append(("text", part))
+        out.append(("link", link_text))
+    for i, part in enumerate(re.split(r'\*\*([^*]+)\*\*', rest)):
+        if not part:
+            continue
+        if i % 2 == 1:
+            out.append(("bold", part))
+        else:
+            for j, seg in enumerate(re.split(r'\*([^*]+)\*', part)):
+                if not seg:
+                    continue
+                out.append(("italic" if j % 2 == 1 else "text", seg))
+    return out
+
+
+def make_lines(count, seed=42):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        template = rng.choice(LINE_TEMPLATES)
+        while "{word}" in template:
+            template = template.replace("{word}", rng.choice(WORDS), 1)
+        lines.append(template)
+    return lines
+
+
+def time_it(fn, lines, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            fn(line)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=10000, help="Number of markdown lines to generate")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per implementation (best is reported)")
+    args = ap.parse_args()
+
+    lines = make_lines(args.lines)
+
+    print("=" * 60)
+    print(f"Inline markdown tokenizer benchmark ({len(lines)} lines, best of {args.repeat})")
+    print("=" * 60)
+
+    legacy = time_it(legacy_inline_tokens, lines, args.repeat)
+    single_pass = time_it(tokenize_inline, lines, args.repeat)
+
+    print(f"Legacy re.search/re.split : {legacy * 1000:8.1f} ms")
+    print(f"Single-pass tokenizer     : {single_pass * 1000:8.1f} ms")
+    if single_pass > 0:
+        print(f"Speedup                   : {legacy / single_pass:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
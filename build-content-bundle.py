@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Compile the site's markdown content into fingerprinted JSON files.
+
+Reads frontend/src/data/articles.json and each article's contentFile, and writes
+to frontend/public/content-bundle/ (copied into dist/ by vite):
+
+  manifest.json                  small, never cached: article id -> file,
+                                 category id -> index file, page name -> file
+  article-<id>-<hash>.json       metadata + precomputed HTML, table of contents,
+                                 word count and reading time
+  category-<id>-<hash>.json      the category's published articles (metadata only)
+  page-resume-<hash>.json        resume.md, same shape as an article
+
+File names carry a content hash, so everything except the manifest is served as
+immutable: opening an article is one cacheable fetch instead of up to three
+sequential fallbacks. Articles whose status is "draft" are left out unless
+--include-drafts is given (for local previews).
+
+Run from repo root: python3 build-content-bundle.py [--out frontend/public/content-bundle] [--include-drafts]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import math
+import re
+import sys
+import time
+from pathlib import Path
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    import subprocess
+    print("Installing markdown-it-py...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "markdown-it-py", "--user", "--quiet"])
+    from markdown_it import MarkdownIt
+
+REPO_ROOT = Path(__file__).resolve().parent
+CONTENT_DIR = REPO_ROOT / "frontend" / "src" / "content"
+ARTICLES_JSON = REPO_ROOT / "frontend" / "src" / "data" / "articles.json"
+OUT_DIR = REPO_ROOT / "frontend" / "public" / "content-bundle"
+
+BUNDLE_VERSION = 1
+WORDS_PER_MINUTE = 230
+# Plain CommonMark with raw HTML off, as the react-markdown component rendered it
+MARKDOWN = MarkdownIt("commonmark", {"html": False})
+PAGES = {"resume": CONTENT_DIR / "resume.md"}
+WORD_RE = re.compile(r"\b\w[\w'’-]*\b")
+TAG_RE = re.compile(r"<[^>]+>")
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+SLUG_SPACE_RE = re.compile(r"[-\s]+")
+
+
+def _dump(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+
+def _fingerprinted(prefix, data):
+    return f"{prefix}-{hashlib.sha256(data.encode()).hexdigest()[:10]}.json"
+
+
+def _slug(title, seen):
+    """Heading id: lowercase words joined by "-", suffixed with _n when repeated."""
+    slug = SLUG_SPACE_RE.sub("-", SLUG_STRIP_RE.sub("", title).strip().lower())
+    n = seen.get(slug, 0)
+    seen[slug] = n + 1
+    return slug if n == 0 else f"{slug}_{n}"
+
+
+def _add_heading_ids(tokens):
+    """Give every heading an id; returns the [{level, id, title}] TOC, skipping the h1 (the article title)."""
+    toc, seen = [], {}
+    for n, token in enumerate(tokens):
+        if token.type != "heading_open":
+            continue
+        inline = tokens[n + 1]
+        title = "".join(child.content for child in inline.children or [] if child.type in ("text", "code_inline"))
+        token.attrSet("id", _slug(title, seen))
+        level = int(token.tag[1])
+        if level > 1:
+            toc.append({"level": level, "id": token.attrGet("id"), "title": title})
+    return toc
+
+
+def render(md_text):
+    """HTML, table of contents, word count and reading time for one markdown document."""
+    env = {}
+    tokens = MARKDOWN.parse(md_text, env)
+    toc = _add_heading_ids(tokens)
+    body = MARKDOWN.renderer.render(tokens, MARKDOWN.options, env)
+    words = len(WORD_RE.findall(html.unescape(TAG_RE.sub(" ", body))))
+    return {
+        "html": body,
+        "toc": toc,
+        "words": words,
+        "readingMinutes": max(1, math.ceil(words / WORDS_PER_MINUTE)),
+    }
+
+
+def compile_bundle(include_drafts=False):
+    """Return ({file name: json text}, manifest dict, skipped draft ids, missing content files)."""
+    articles = json.loads(ARTICLES_JSON.read_text(encoding="utf-8"))
+    files = {}
+    manifest = {"version": BUNDLE_VERSION, "articles": {}, "categories": {}, "pages": {}}
+    drafts, missing = [], []
+
+    for category in articles.get("categories", []):
+        entries = []
+        for article in category.get("articles", []):
+            if article.get("status") == "draft" and not include_drafts:
+                drafts.append(article["id"])
+                continue
+            content_file = article.get("contentFile")
+            path = CONTENT_DIR / content_file if content_file else None
+            if path is None or not path.exists():
+                missing.append(content_file or article["id"])
+                continue
+            meta = {key: article.get(key) for key in ("id", "title", "excerpt", "status", "author", "date", "tags")}
+            meta["category"] = category["id"]
+            rendered = render(path.read_text(encoding="utf-8"))
+            data = _dump({**meta, **rendered})
+            name = _fingerprinted(f"article-{article['id']}", data)
+            files[name] = data
+            manifest["articles"][article["id"]] = name
+            entries.append({**meta, "file": name, "words": rendered["words"],
+                            "readingMinutes": rendered["readingMinutes"]})
+
+        index = _dump({
+            "id": category["id"], "title": category.get("title"),
+            "description": category.get("description"), "articles": entries,
+        })
+        name = _fingerprinted(f"category-{category['id']}", index)
+        files[name] = index
+        manifest["categories"][category["id"]] = name
+
+    for page, path in PAGES.items():
+        if path.exists():
+            data = _dump({"id": page, **render(path.read_text(encoding="utf-8"))})
+            name = _fingerprinted(f"page-{page}", data)
+            files[name] = data
+            manifest["pages"][page] = name
+    return files, manifest, drafts, missing
+
+
+def write_bundle(out_dir, files, manifest):
+    """Write new files, replace the manifest if it changed, delete files no longer referenced."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, data in files.items():
+        path = out_dir / name
+        if not path.exists():
+            path.write_text(data + "\n", encoding="utf-8")
+            written += 1
+    manifest_text = _dump(manifest) + "\n"
+    manifest_path = out_dir / "manifest.json"
+    if not manifest_path.exists() or manifest_path.read_text(encoding="utf-8") != manifest_text:
+        manifest_path.write_text(manifest_text, encoding="utf-8")
+    removed = 0
+    for stale in out_dir.glob("*.json"):
+        if stale.name != "manifest.json" and stale.name not in files:
+            stale.unlink()
+            removed += 1
+    return written, removed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(OUT_DIR), help="Output directory (served at /content-bundle/)")
+    ap.add_argument("--include-drafts", action="store_true", help="Also compile draft articles")
+    args = ap.parse_args()
+
+    print("=" * 60)
+    print("Build content bundle")
+    print("=" * 60)
+    start = time.perf_counter()
+    try:
+        files, manifest, drafts, missing = compile_bundle(args.include_drafts)
+        written, removed = write_bundle(Path(args.out), files, manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not build the content bundle: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Articles  : {len(manifest['articles'])} published, {len(drafts)} drafts skipped")
+    print(f"Categories: {len(manifest['categories'])}   Pages: {', '.join(manifest['pages']) or '—'}")
+    print(f"Files     : {written} written, {len(files) - written} unchanged, {removed} removed")
+    for name in missing:
+        print(f"⚠️  Content file not found, article skipped: {name}")
+    print(f"✅ Content bundle ready in {elapsed:.0f} ms: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Build every resume artifact from one parse of frontend/src/content/resume.md.
+
+resume.md is parsed once into the block AST from resume_markdown.py; each output
+format is an emitter that takes that AST and writes one file. Emitters run
+concurrently in a thread pool, so a release costs one parse for all formats:
+
+  resume.docx   Word document (same rendering as sync-resume-md-to-docx.py)
+  resume.html   standalone static HTML page
+  resume.txt    ATS-friendly plain text
+  resume.json   JSON Resume (https://jsonresume.org/schema)
+
+Run from repo root: python3 build-resume-formats.py [--out build/resume] [--formats html,txt]
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from resume_markdown import parse_resume, sections
+
+REPO_ROOT = Path(__file__).resolve().parent
+MD_PATH = REPO_ROOT / "frontend" / "src" / "content" / "resume.md"
+OUT_DIR = REPO_ROOT / "build" / "resume"
+
+
+def plain(tokens):
+    """Visible text of a token stream."""
+    return "".join(tok.text for tok in tokens).strip()
+
+
+# ---------------------------------------------------------------------------
+# docx
+# ---------------------------------------------------------------------------
+
+def emit_docx(blocks, out_dir: Path) -> Path:
+    # Imported lazily so the other formats work without python-docx installed.
+    from resume_docx import blocks_to_document
+
+    out = out_dir / "resume.docx"
+    blocks_to_document(blocks).save(str(out))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+
+HTML_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+       max-width: 820px; margin: 2rem auto; padding: 0 1rem; line-height: 1.5; color: #222; }
+h1 { margin-bottom: 0.25rem; }
+h2 { border-bottom: 1px solid #ccc; padding-bottom: 0.2rem; margin-top: 1.75rem; }
+h3 { margin-bottom: 0.25rem; }
+a { color: #0563c1; }
+hr { border: 0; border-top: 1px solid #eee; }
+"""
+
+
+def _html_inline(tokens):
+    parts = []
+    for tok in tokens:
+        text = html.escape(tok.text)
+        if tok.kind == "code":
+            text = f"<code>{text}</code>"
+        if tok.italic:
+            text = f"<em>{text}</em>"
+        if tok.bold:
+            text = f"<strong>{text}</strong>"
+        if tok.url:
+            text = f'<a href="{html.escape(tok.url, quote=True)}">{text}</a>'
+        parts.append(text)
+    return "".join(parts)
+
+
+def emit_html(blocks, out_dir: Path) -> Path:
+    title = next((plain(b.tokens) for b in blocks if b.kind == "title"), "Resume")
+    body = []
+    depth = 0
+    for block in blocks:
+        if block.kind == "bullet":
+            while depth < block.level:
+                body.append("<ul>")
+                depth += 1
+            while depth > block.level:
+                body.append("</ul>")
+                depth -= 1
+            body.append(f"<li>{_html_inline(block.tokens)}</li>")
+            continue
+        if block.kind == "blank":
+            continue
+        while depth:
+            body.append("</ul>")
+            depth -= 1
+        if block.kind == "title":
+            body.append(f"<h1>{_html_inline(block.tokens)}</h1>")
+        elif block.kind == "heading":
+            body.append(f"<h{block.level}>{_html_inline(block.tokens)}</h{block.level}>")
+        elif block.kind == "rule":
+            body.append("<hr>")
+        elif block.kind == "note":
+            body.append(f"<p><em>{_html_inline(block.tokens)}</em></p>")
+        else:
+            body.append(f"<p>{_html_inline(block.tokens)}</p>")
+    body.extend("</ul>" for _ in range(depth))
+
+    page = (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f"<title>{html.escape(title)}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n"
+        + "\n".join(body)
+        + "\n</body>\n</html>\n"
+    )
+    out = out_dir / "resume.html"
+    out.write_text(page, encoding="utf-8")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# ATS plain text
+# ---------------------------------------------------------------------------
+
+def _ats_inline(tokens):
+    """Flatten formatting; keep link targets visible since ATS parsers drop hyperlinks."""
+    parts = []
+    for tok in tokens:
+        if tok.url and tok.url != tok.text:
+            parts.append(f"{tok.text} ({tok.url})")
+        else:
+            parts.append(tok.text)
+    # Typographic characters some applicant tracking systems mangle
+    text = "".join(parts).replace("•", "|").replace("‑", "-")
+    return text.strip()
+
+
+def emit_txt(blocks, out_dir: Path) -> Path:
+    lines = []
+    for block in blocks:
+        if block.kind in ("blank", "rule"):
+            if lines and lines[-1] != "":
+                lines.append("")
+        elif block.kind == "title":
+            lines.append(_ats_inline(block.tokens).upper())
+        elif block.kind == "heading" and block.level == 2:
+            if lines and lines[-1] != "":
+                lines.append("")
+            lines.append(_ats_inline(block.tokens).upper())
+        elif block.kind == "heading":
+            lines.append(_ats_inline(block.tokens))
+        elif block.kind == "bullet":
+            lines.append("  " * (block.level - 1) + "- " + _ats_inline(block.tokens))
+        else:
+            lines.append(_ats_inline(block.tokens))
+    out = out_dir / "resume.txt"
+    out.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# JSON Resume
+# ---------------------------------------------------------------------------
+
+MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+DATE_RANGE_RE = re.compile(r"(?P<start>[A-Za-z]{3}\w* \d{4}|\d{4})\s*[–-]\s*(?P<end>[A-Za-z]{3}\w* \d{4}|\d{4}|Present)", re.I)
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+PHONE_RE = re.compile(r"^\+?[\d\s().-]{7,}$")
+
+
+def _iso_date(text):
+    """'Apr 2022' -> '2022-04', '2016' -> '2016', 'Present' -> None."""
+    parts = text.split()
+    if len(parts) == 2 and parts[0][:3].lower() in MONTHS:
+        return f"{parts[1]}-{MONTHS[parts[0][:3].lower()]:02d}"
+    if text.isdigit():
+        return text
+    return None
+
+
+def _dates(text):
+    m = DATE_RANGE_RE.search(text)
+    if not m:
+        return {}
+    out = {"startDate": _iso_date(m.group("start"))}
+    end = _iso_date(m.group("end"))
+    if end:
+        out["endDate"] = end
+    return out
+
+
+def _basics(preamble):
+    basics = {}
+    paragraphs = [b for b in preamble if b.kind in ("title", "paragraph")]
+    for block in paragraphs:
+        text = plain(block.tokens)
+        if block.kind == "title":
+            basics["name"] = text.title()
+            continue
+        if "@" in text and "•" in text:
+            for part in (p.strip() for p in text.split("•")):
+                if EMAIL_RE.fullmatch(part):
+                    basics["email"] = part
+                elif PHONE_RE.match(part):
+                    basics["phone"] = part
+                elif part:
+                    city, _, region = part.partition(",")
+                    basics["location"] = {"city": city.strip(), "region": region.strip()}
+        elif "label" not in basics:
+            basics["label"] = text
+    return basics
+
+
+def _work(blocks):
+    work = []
+    entry = None
+    for block in blocks:
+        if block.kind == "heading" and block.level == 3:
+            name, _, location = plain(block.tokens).partition(" — ")
+            entry = {"name": name.strip(), "location": location.strip(), "highlights": []}
+            work.append(entry)
+        elif block.kind == "paragraph" and entry is not None and "position" not in entry:
+            position, _, when = plain(block.tokens).partition("|")
+            entry["position"] = position.strip()
+            entry.update(_dates(when))
+        elif block.kind == "bullet" and entry is not None:
+            text = plain(block.tokens)
+            # "**Company** — Role | 2016 – 2017" bullets are roles of their own
+            if block.level == 1 and block.tokens and block.tokens[0].bold and " — " in text:
+                name, _, rest = text.partition(" — ")
+                position, _, when = rest.partition("|")
+                work.append({"name": name.strip(), "position": position.strip(), "highlights": [], **_dates(when)})
+            elif block.level > 1 and work[-1] is not entry and not work[-1]["highlights"] and block.tokens[0].bold:
+                continue  # sub-heading bullet such as "General Healthcare Experience (Selected)"
+            else:
+                work[-1]["highlights"].append(text)
+    for item in work:
+        if not item.get("location"):
+            item.pop("location", None)
+    return [w for w in work if w.get("position") or w["highlights"]]
+
+
+def _skills(blocks):
+    skills = []
+    for block in blocks:
+        if block.kind == "paragraph" and block.tokens and block.tokens[0].bold:
+            name = block.tokens[0].text.rstrip(":").strip()
+            rest = "".join(t.text for t in block.tokens[1:])
+            keywords = [k.strip() for k in re.split(r"[,;]", rest) if k.strip()]
+            skills.append({"name": name, "keywords": keywords})
+    return skills
+
+
+def _education(blocks):
+    education = []
+    institution = None
+    for block in blocks:
+        if block.kind == "paragraph":
+            institution = plain(block.tokens)
+        elif block.kind == "bullet" and institution:
+            study_type, _, area = plain(block.tokens).partition(" ")
+            education.append({"institution": institution, "studyType": study_type, "area": area.strip()})
+    return education
+
+
+def build_json_resume(blocks):
+    grouped = sections(blocks)
+    resume = {
+        "$schema": "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json",
+        "basics": _basics(grouped[0][1]),
+    }
+    profiles = []
+    for heading, body in grouped[1:]:
+        key = heading.strip().upper()
+        bullets = [plain(b.tokens) for b in body if b.kind == "bullet"]
+        if key == "SUMMARY":
+            resume["basics"]["summary"] = " ".join(plain(b.tokens) for b in body if b.kind == "paragraph")
+        elif key in ("KEY SKILLS", "SKILLS"):
+            resume["skills"] = _skills(body)
+        elif key in ("PROFESSIONAL EXPERIENCE", "EXPERIENCE"):
+            resume["work"] = _work(body)
+        elif key == "EDUCATION":
+            resume["education"] = _education(body)
+        elif key in ("CERTIFICATIONS", "CERTIFICATES"):
+            resume["certificates"] = [{"name": b} for b in bullets]
+        elif key == "ADDITIONAL HIGHLIGHTS":
+            resume.setdefault("meta", {})["highlights"] = bullets
+        elif key == "ADDITIONAL RESOURCES":
+            label = None
+            for block in body:
+                for tok in block.tokens:
+                    if tok.url:
+                        profiles.append({"network": label or tok.url, "url": tok.url})
+                    elif tok.bold:
+                        label = tok.text.strip()
+    if profiles:
+        resume["basics"]["url"] = profiles[0]["url"]
+        resume["basics"]["profiles"] = profiles
+    return resume
+
+
+def emit_json(blocks, out_dir: Path) -> Path:
+    out = out_dir / "resume.json"
+    out.write_text(json.dumps(build_json_resume(blocks), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return out
+
+
+# Output formats by name; add an entry here to plug in another emitter.
+EMITTERS = {
+    "docx": emit_docx,
+    "html": emit_html,
+    "txt": emit_txt,
+    "json": emit_json,
+}
+
+
+def build(md_path: Path, out_dir: Path, formats):
+    """Parse once, then run the selected emitters concurrently. Returns {format: (path, seconds, error)}."""
+    blocks = parse_resume(md_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    def run(name):
+        start = time.perf_counter()
+        try:
+            path = EMITTERS[name](blocks, out_dir)
+            return name, path, time.perf_counter() - start, None
+        except Exception as e:
+            return name, None, time.perf_counter() - start, e
+
+    with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+        return {name: (path, secs, err) for name, path, secs, err in pool.map(run, formats)}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--md", default=str(MD_PATH), help="Resume markdown source")
+    ap.add_argument("--out", default=str(OUT_DIR), help="Output directory")
+    ap.add_argument("--formats", default=",".join(EMITTERS), help="Comma-separated formats: " + ", ".join(EMITTERS))
+    args = ap.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    if not formats:
+        ap.error("--formats needs at least one of: " + ", ".join(EMITTERS))
+    unknown = [f for f in formats if f not in EMITTERS]
+    if unknown:
+        print(f"❌ Unknown format(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    md_path = Path(args.md)
+    if not md_path.exists():
+        print(f"❌ Resume markdown not found: {md_path}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Build resume formats from resume.md")
+    print("=" * 60)
+
+    results = build(md_path, Path(args.out), formats)
+    failed = False
+    for name in formats:
+        path, secs, err = results[name]
+        if err:
+            failed = True
+            print(f"❌ {name:5} failed: {err}")
+        else:
+            print(f"✅ {name:5} {secs * 1000:7.1f} ms  {path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Build the site's full-text search index at deploy time.
+
+Indexed documents:
+  - every markdown file in frontend/src/content/ (article bodies and the resume)
+  - articles.json entries (title, excerpt, tags, plus the body of contentFile)
+  - tools.json and technologies.json entries
+
+Output goes to frontend/public/search/ and is copied into dist/ by vite:
+
+  manifest.json             small, never cached: doc list file + shard map
+  docs-<hash>.json          [{t: title, u: url, k: kind, s: snippet}, ...]
+  shard-<key>-<hash>.json   {term: [doc, weight, doc, weight, ...]}
+
+Terms are sharded by first character, and a shard larger than SHARD_BYTES is
+split by its first two characters, so a query (including a prefix query of two
+or more characters) only fetches the shards its terms fall in. File names carry
+a content hash: unchanged shards keep their name between deploys and stay in
+the browser / CloudFront cache. Articles whose status is "draft" are left out,
+as in the content bundle, unless --include-drafts is given (for local previews).
+
+Weights are BM25 scores (title x3, tags/category x2, body x1) scaled to integers.
+Rebuilds are incremental: per-document term counts are cached in
+build/search/state.json and only documents whose content changed are
+re-tokenized; shard files whose content is unchanged are not rewritten.
+
+Run from repo root: python3 build-search-index.py [--out frontend/public/search] [--force] [--include-drafts]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+FRONTEND_SRC = REPO_ROOT / "frontend" / "src"
+CONTENT_DIR = FRONTEND_SRC / "content"
+DATA_DIR = FRONTEND_SRC / "data"
+OUT_DIR = REPO_ROOT / "frontend" / "public" / "search"
+STATE_PATH = REPO_ROOT / "build" / "search" / "state.json"
+
+STATE_VERSION = 1
+SHARD_BYTES = 32 * 1024
+SNIPPET_CHARS = 160
+BM25_K1 = 1.2
+BM25_B = 0.75
+WEIGHT_SCALE = 100
+FIELD_BOOST = {"title": 3, "tags": 2, "body": 1}
+
+# Must match tokenize() in frontend/src/search.js
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in is it its of on or that the this to was "
+    "were what when where which who will with you your".split()
+)
+MARKDOWN_NOISE_RE = re.compile(r"```.*?```|`[^`]*`|!\[[^\]]*\]\([^)]*\)|\]\([^)]*\)|[#>*_\[\]|-]+", re.S)
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _plain(markdown):
+    return re.sub(r"\s+", " ", MARKDOWN_NOISE_RE.sub(" ", markdown)).strip()
+
+
+def _md_title(markdown, fallback):
+    for line in markdown.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return fallback
+
+
+# ---------------------------------------------------------------------------
+# Documents
+# ---------------------------------------------------------------------------
+
+def collect_documents(include_drafts=False):
+    """Yield dicts with id, kind, title, url, tags, body, snippet. Draft articles are skipped by default."""
+    articles = json.loads((DATA_DIR / "articles.json").read_text(encoding="utf-8"))
+    content_files = set()
+    for category in articles.get("categories", []):
+        for article in category.get("articles", []):
+            body = ""
+            content_file = article.get("contentFile")
+            if article.get("status") == "draft" and not include_drafts:
+                # Keep the draft's markdown out of the plain content pages below too
+                if content_file:
+                    content_files.add(content_file)
+                continue
+            if content_file and (CONTENT_DIR / content_file).exists():
+                content_files.add(content_file)
+                body = _plain((CONTENT_DIR / content_file).read_text(encoding="utf-8"))
+            yield {
+                "id": f"article:{article['id']}",
+                "kind": "article",
+                "title": article.get("title", article["id"]),
+                "url": f"/article/{article['id']}",
+                "tags": " ".join(article.get("tags", []) + [category.get("title", "")]),
+                "body": " ".join(filter(None, (article.get("excerpt", ""), body))),
+                "snippet": article.get("excerpt") or body[:SNIPPET_CHARS],
+            }
+
+    for md in sorted(CONTENT_DIR.glob("*.md")):
+        if md.name in content_files or md.name == "README.md":
+            continue
+        text = md.read_text(encoding="utf-8")
+        is_resume = md.stem == "resume"
+        body = _plain(text)
+        yield {
+            "id": f"content:{md.stem}",
+            "kind": "resume" if is_resume else "page",
+            "title": "Resume" if is_resume else _md_title(text, md.stem),
+            "url": "/resume" if is_resume else f"/content/{md.name}",
+            "tags": "",
+            "body": body,
+            "snippet": body[:SNIPPET_CHARS],
+        }
+
+    tools = json.loads((DATA_DIR / "tools.json").read_text(encoding="utf-8"))
+    for tool in tools.get("tools", []):
+        extra = [json.dumps(tool.get(key, ""), ensure_ascii=False) for key in ("features", "tutorials", "examples")]
+        yield {
+            "id": f"tool:{tool['id']}",
+            "kind": "tool",
+            "title": tool.get("name", tool["id"]),
+            "url": "/#tools",
+            "tags": tool.get("category", ""),
+            "body": " ".join([tool.get("description", "")] + extra),
+            "snippet": tool.get("description", ""),
+        }
+
+    technologies = json.loads((DATA_DIR / "technologies.json").read_text(encoding="utf-8"))
+    for tech in technologies.get("technologies", []):
+        sections = " ".join(f"{s.get('title', '')} {s.get('content', '')}" for s in tech.get("sections", []))
+        yield {
+            "id": f"technology:{tech['id']}",
+            "kind": "technology",
+            "title": tech.get("name", tech["id"]),
+            "url": "/#technologies",
+            "tags": " ".join(tech.get("products", [])),
+            "body": f"{tech.get('description', '')} {sections}",
+            "snippet": tech.get("description", ""),
+        }
+
+
+def _doc_hash(doc):
+    return hashlib.sha256(json.dumps(doc, sort_keys=True).encode()).hexdigest()
+
+
+def term_counts(doc):
+    """Field-boosted term counts for one document."""
+    counts = Counter()
+    for field, boost in FIELD_BOOST.items():
+        for term in tokenize(doc[field]):
+            counts[term] += boost
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+def load_state(path):
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if state.get("version") == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"version": STATE_VERSION, "docs": {}}
+
+
+def build_postings(docs, tf_by_doc):
+    """{term: [doc index, weight, ...]} with BM25 weights, documents in `docs` order."""
+    lengths = [sum(tf_by_doc[d["id"]].values()) for d in docs]
+    avg_len = (sum(lengths) / len(lengths)) if lengths else 1.0
+    df = Counter()
+    for d in docs:
+        df.update(tf_by_doc[d["id"]].keys())
+    n = len(docs)
+
+    postings = {}
+    for i, d in enumerate(docs):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[i] / avg_len)
+        for term, tf in tf_by_doc[d["id"]].items():
+            idf = math.log((n - df[term] + 0.5) / (df[term] + 0.5) + 1.0)
+            weight = round(idf * tf * (BM25_K1 + 1) / (tf + norm) * WEIGHT_SCALE)
+            postings.setdefault(term, []).extend((i, max(weight, 1)))
+    return postings
+
+
+def _dump(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+
+def shard_postings(postings):
+    """Group terms into {shard key: {term: postings}}: first character, split by two when large."""
+    by_first = {}
+    for term in sorted(postings):
+        by_first.setdefault(term[0], {})[term] = postings[term]
+    shards = {}
+    for key, terms in by_first.items():
+        if len(_dump(terms)) <= SHARD_BYTES:
+            shards[key] = terms
+            continue
+        for term, plist in terms.items():
+            shards.setdefault(term[:2], {})[term] = plist
+    return shards
+
+
+def _fingerprinted(prefix, data):
+    return f"{prefix}-{hashlib.sha256(data.encode()).hexdigest()[:10]}.json"
+
+
+def write_index(out_dir, docs, shards):
+    """Write docs / shard / manifest files; return (written, unchanged, removed) file counts."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    docs_data = _dump([{"t": d["title"], "u": d["url"], "k": d["kind"], "s": d["snippet"][:SNIPPET_CHARS]}
+                       for d in docs])
+    docs_file = _fingerprinted("docs", docs_data)
+    files[docs_file] = docs_data
+    shard_files = {}
+    for key, terms in sorted(shards.items()):
+        data = _dump(terms)
+        name = _fingerprinted(f"shard-{key}", data)
+        files[name] = data
+        shard_files[key] = name
+    manifest = _dump({"version": STATE_VERSION, "docs": docs_file, "shards": shard_files})
+
+    written = unchanged = 0
+    for name, data in files.items():
+        path = out_dir / name
+        if path.exists():
+            unchanged += 1  # same name means same content
+            continue
+        path.write_text(data + "\n", encoding="utf-8")
+        written += 1
+    manifest_path = out_dir / "manifest.json"
+    if not manifest_path.exists() or manifest_path.read_text(encoding="utf-8") != manifest + "\n":
+        manifest_path.write_text(manifest + "\n", encoding="utf-8")
+
+    removed = 0
+    for stale in out_dir.glob("*.json"):
+        if stale.name != "manifest.json" and stale.name not in files:
+            stale.unlink()
+            removed += 1
+    return written, unchanged, removed
+
+
+def build(out_dir=OUT_DIR, state_path=STATE_PATH, force=False, include_drafts=False):
+    state = {"version": STATE_VERSION, "docs": {}} if force else load_state(state_path)
+    cached = state["docs"]
+    docs = list(collect_documents(include_drafts))
+    tf_by_doc = {}
+    retokenized = 0
+    for doc in docs:
+        digest = _doc_hash(doc)
+        entry = cached.get(doc["id"])
+        if entry and entry["hash"] == digest:
+            tf_by_doc[doc["id"]] = Counter(entry["tf"])
+            continue
+        tf_by_doc[doc["id"]] = term_counts(doc)
+        cached[doc["id"]] = {"hash": digest, "tf": dict(tf_by_doc[doc["id"]])}
+        retokenized += 1
+    for stale in set(cached) - {d["id"] for d in docs}:
+        del cached[stale]
+
+    postings = build_postings(docs, tf_by_doc)
+    shards = shard_postings(postings)
+    written, unchanged, removed = write_index(Path(out_dir), docs, shards)
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+    return {
+        "docs": len(docs), "retokenized": retokenized, "terms": len(postings), "shards": len(shards),
+        "written": written, "unchanged": unchanged, "removed": removed,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(OUT_DIR), help="Output directory (served at /search/)")
+    ap.add_argument("--force", action="store_true", help="Ignore the incremental state and re-tokenize everything")
+    ap.add_argument("--include-drafts", action="store_true", help="Also index draft articles")
+    args = ap.parse_args()
+
+    print("=" * 60)
+    print("Build search index")
+    print("=" * 60)
+    start = time.perf_counter()
+    try:
+        stats = build(Path(args.out), STATE_PATH, args.force, args.include_drafts)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not build the search index: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Documents : {stats['docs']} ({stats['retokenized']} re-tokenized)")
+    print(f"Terms     : {stats['terms']:,} in {stats['shards']} shards")
+    print(f"Files     : {stats['written']} written, {stats['unchanged']} unchanged, {stats['removed']} removed")
+    print(f"✅ Search index ready in {elapsed:.0f} ms: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,24 @@
 """
 Check Availability of Multiple Domain Variations
 This script checks various domain name options
+
+Checks run concurrently under Route 53 Domains' request limit (see
+domain_availability.py) and results print as they arrive.
+
+Usage:
+  python3 check-domain-availability-list.py                   # DOMAIN_OPTIONS below
+  python3 check-domain-availability-list.py a.com b.net       # specific domains
+  python3 check-domain-availability-list.py --file names.txt  # one domain per line
 """
 
+import argparse
+import time
+
 import boto3
 import sys
-from botocore.exceptions import ClientError
+
+from domain_availability import DEFAULT_WORKERS, ROUTE53_DOMAINS_RPS, check_domains, make_client
+from domain_prices import load_price_table, price_for
 
 PROFILE = "my-sso"
 REGION = "us-east-1"
@@ -30,32 +43,23 @@ DOMAIN_OPTIONS = [
     "ffjabbari-consulting.org",
 ]
 
-def check_domain_availability(route53domains_client, domain):
-    """Check if a domain is available"""
-    try:
-        response = route53domains_client.check_domain_availability(
-            DomainName=domain
-        )
-        return response.get('Availability', 'UNKNOWN')
-    except ClientError as e:
-        error_code = e.response.get('Error', {}).get('Code', '')
-        if error_code == 'InvalidInput':
-            return 'INVALID'
-        return 'ERROR'
-
-def get_domain_price(route53domains_client, tld):
-    """Get price for a TLD"""
-    try:
-        response = route53domains_client.list_prices(Tld=tld)
-        for price in response.get('Prices', []):
-            if price.get('Name') == 'registration':
-                reg_price = price.get('Price', {})
-                return reg_price.get('Price', 'Unknown')
-    except:
-        pass
-    return None
+def load_domains(args):
+    domains = list(args.domains)
+    if args.file:
+        with open(args.file) as f:
+            domains += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return domains or DOMAIN_OPTIONS
 
 def main():
+    parser = argparse.ArgumentParser(description="Check Route 53 availability for several domains")
+    parser.add_argument("domains", nargs="*", help="Domains to check (default: built-in list)")
+    parser.add_argument("--file", help="File with one domain per line")
+    parser.add_argument("--rate", type=float, default=ROUTE53_DOMAINS_RPS, help="Max requests per second")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent requests")
+    parser.add_argument("--refresh-prices", action="store_true", help="Re-download the TLD price list")
+    args = parser.parse_args()
+    domains = load_domains(args)
+
     print("="*70)
     print("Domain Availability Check - FFJ Consulting LLC")
     print("="*70)
@@ -64,20 +68,20 @@ def main():
     # Initialize AWS client
     try:
         session = boto3.Session(profile_name=PROFILE)
-        route53domains_client = session.client('route53domains', region_name='us-east-1')
+        route53domains_client = make_client(session)
     except Exception as e:
         print(f"❌ Error connecting to AWS: {e}")
         print("")
         print("Please run this script on your machine where AWS CLI is configured.")
         sys.exit(1)
     
-    # Get prices for common TLDs
-    print("Getting domain prices...")
+    # Prices for the TLDs being checked (cached locally; refreshed once a day)
+    price_table = load_price_table(route53domains_client, refresh=args.refresh_prices)
     prices = {}
-    for tld in ['com', 'net', 'org', 'cloud', 'ai']:
-        price = get_domain_price(route53domains_client, tld)
-        if price:
-            prices[tld] = price
+    for tld in dict.fromkeys(d.rsplit('.', 1)[-1] for d in domains):
+        amount, _ = price_for(price_table, tld)
+        if amount is not None:
+            prices[tld] = amount
     
     if prices:
         print("Domain Prices:")
@@ -94,24 +98,33 @@ def main():
     unavailable_domains = []
     error_domains = []
     
-    for domain in DOMAIN_OPTIONS:
-        print(f"Checking: {domain:40}", end="", flush=True)
-        availability = check_domain_availability(route53domains_client, domain)
-        
+    print(f"Checking {len(domains)} domains ({args.workers} at a time, up to {args.rate:g} requests/s)")
+    print("")
+    start = time.perf_counter()
+    results = {}
+    for domain, availability in check_domains(route53domains_client, domains, args.rate, args.workers):
+        results[domain] = availability
+        print(f"{domain:40}", end="")
         if availability == 'AVAILABLE':
             print(" ✅ AVAILABLE")
-            available_domains.append(domain)
         elif availability == 'UNAVAILABLE':
             print(" ❌ UNAVAILABLE")
-            unavailable_domains.append(domain)
         elif availability == 'RESERVED':
             print(" ⚠️  RESERVED")
-            unavailable_domains.append(domain)
         elif availability == 'INVALID':
             print(" ⚠️  INVALID")
-            error_domains.append(domain)
         else:
             print(f" ❓ {availability}")
+    print(f"\nChecked {len(results)} domains in {time.perf_counter() - start:.1f}s")
+    
+    # Summaries keep the input order
+    for domain in dict.fromkeys(domains):
+        availability = results.get(domain)
+        if availability == 'AVAILABLE':
+            available_domains.append(domain)
+        elif availability in ('UNAVAILABLE', 'RESERVED'):
+            unavailable_domains.append(domain)
+        else:
             error_domains.append(domain)
     
     print("")
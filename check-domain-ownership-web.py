@@ -1,157 +1,145 @@
 #!/usr/bin/env python3
 """
 Check Domain Ownership using web-based WHOIS
+
+Records are parsed by whois_records.py (WHOIS text in common registry formats,
+or RDAP when whois is unavailable) and cached in build/cache/whois.json, so
+repeated portfolio checks only query domains whose record is missing or stale.
+Those lookups run through a bounded pool of whois processes, spaced per WHOIS
+server and retried with backoff, and each result prints as soon as it arrives.
+
+Usage:
+  python3 check-domain-ownership-web.py                         # ffjconsulting.com
+  python3 check-domain-ownership-web.py a.com b.net --refresh
+  python3 check-domain-ownership-web.py --file portfolio.txt --json
+  python3 check-domain-ownership-web.py --file portfolio.txt --workers 8 --interval 2
 """
 
-import subprocess
+import argparse
 import sys
 import json
 
-DOMAIN_NAME = "ffjconsulting.com"
+import time
 
-def run_whois():
-    """Run whois command"""
-    try:
-        result = subprocess.run(
-            ['whois', DOMAIN_NAME],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.stdout
-    except subprocess.TimeoutExpired:
-        return "Timeout"
-    except FileNotFoundError:
-        return None
-    except Exception as e:
-        return f"Error: {e}"
+from whois_records import (
+    DEFAULT_WORKERS, PER_SERVER_CONCURRENCY, SERVER_INTERVAL, WHOIS_TTL, WhoisCache, lookup_many, mask_email,
+)
 
-def parse_whois(whois_output):
-    """Parse whois output for key information"""
-    if not whois_output or whois_output == "Timeout":
-        return None
-    
-    info = {}
-    lines = whois_output.split('\n')
-    
-    for line in lines:
-        line_lower = line.lower()
-        
-        if 'registrar:' in line_lower:
-            info['registrar'] = line.split(':', 1)[1].strip() if ':' in line else ''
-        elif 'registrant name:' in line_lower:
-            info['registrant_name'] = line.split(':', 1)[1].strip() if ':' in line else ''
-        elif 'registrant organization:' in line_lower:
-            info['registrant_org'] = line.split(':', 1)[1].strip() if ':' in line else ''
-        elif 'registrant email:' in line_lower and 'email' not in info:
-            email = line.split(':', 1)[1].strip() if ':' in line else ''
-            # Mask email
-            if '@' in email:
-                parts = email.split('@')
-                if len(parts[0]) > 2:
-                    masked = parts[0][:2] + '***@' + parts[1]
-                else:
-                    masked = '***@' + parts[1]
-                info['registrant_email'] = masked
-        elif 'creation date:' in line_lower:
-            info['creation_date'] = line.split(':', 1)[1].strip() if ':' in line else ''
-        elif 'expiry date:' in line_lower or 'expiration date:' in line_lower:
-            info['expiry_date'] = line.split(':', 1)[1].strip() if ':' in line else ''
-        elif 'name server:' in line_lower:
-            if 'nameservers' not in info:
-                info['nameservers'] = []
-            ns = line.split(':', 1)[1].strip() if ':' in line else ''
-            if ns:
-                info['nameservers'].append(ns)
-    
-    return info
+DOMAIN_NAME = "ffjconsulting.com"
 
-def main():
-    print("="*60)
-    print("Domain Ownership Check")
-    print("="*60)
-    print(f"Domain: {DOMAIN_NAME}")
+def print_info(domain, info):
+    """Registration details and ownership hints for one domain"""
+    print(f"Domain: {domain}")
+    if info is None:
+        print("⚠️  Could not get WHOIS or RDAP information")
+        print("   Try running: ./check-domain-ownership.sh")
+        return
+    if info.get('registered') is False:
+        print("✅ Not registered (no WHOIS record)")
+        return
+    
+    print("✅ Domain Registration Information:")
     print("")
     
-    # Try whois
-    print("Checking WHOIS information...")
-    whois_output = run_whois()
+    if 'registrar' in info:
+        print(f"Registrar: {info['registrar']}")
+    
+    if 'registrant_name' in info:
+        print(f"Registrant Name: {info['registrant_name']}")
     
-    if whois_output is None:
-        print("❌ 'whois' command not available")
-        print("   Install with: brew install whois (on macOS)")
+    if 'registrant_org' in info:
+        print(f"Registrant Organization: {info['registrant_org']}")
+    
+    if 'registrant_email' in info:
+        print(f"Registrant Email: {mask_email(info['registrant_email'])}")
         print("")
-        print("Alternative: Run the shell script:")
-        print("   ./check-domain-ownership.sh")
-        sys.exit(1)
+        print("⚠️  Check if this email matches yours!")
     
-    if whois_output == "Timeout":
-        print("⚠️  WHOIS lookup timed out")
-        print("   Try running: ./check-domain-ownership.sh")
-        sys.exit(1)
+    if 'creation_date' in info:
+        print(f"Creation Date: {info['creation_date']}")
     
-    # Parse whois
-    info = parse_whois(whois_output)
+    if 'expiry_date' in info:
+        print(f"Expiry Date: {info['expiry_date']}")
     
-    if info:
-        print("✅ Domain Registration Information:")
+    if info.get('status'):
+        print(f"Status: {', '.join(info['status'])}")
+    
+    if info.get('nameservers'):
         print("")
-        
-        if 'registrar' in info:
-            print(f"Registrar: {info['registrar']}")
-        
-        if 'registrant_name' in info:
-            print(f"Registrant Name: {info['registrant_name']}")
-        
-        if 'registrant_org' in info:
-            print(f"Registrant Organization: {info['registrant_org']}")
-        
-        if 'registrant_email' in info:
-            print(f"Registrant Email: {info['registrant_email']}")
-            print("")
-            print("⚠️  Check if this email matches yours!")
-        
-        if 'creation_date' in info:
-            print(f"Creation Date: {info['creation_date']}")
-        
-        if 'expiry_date' in info:
-            print(f"Expiry Date: {info['expiry_date']}")
-        
-        if 'nameservers' in info and info['nameservers']:
-            print("")
-            print("Current Nameservers:")
-            for ns in info['nameservers']:
-                print(f"  - {ns}")
-        
+        print("Current Nameservers:")
+        for ns in info['nameservers']:
+            print(f"  - {ns}")
+    
+    print("")
+    print("="*60)
+    print("Analysis")
+    print("="*60)
+    print("")
+    
+    # Check if it might be user's domain
+    if 'registrant_org' in info:
+        org_lower = info['registrant_org'].lower()
+        if 'ffj' in org_lower or 'consulting' in org_lower:
+            print("✅ Organization name suggests this might be your domain!")
+        else:
+            print("⚠️  Organization name doesn't match 'FFJ Consulting LLC'")
+    
+    if 'registrar' in info:
         print("")
+        print(f"To update nameservers:")
+        print(f"1. Log into {info['registrar']}")
+        print(f"2. Find domain: {domain}")
+        print(f"3. Update nameservers to Route 53")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check domain ownership via WHOIS / RDAP")
+    parser.add_argument("domains", nargs="*", help=f"Domains to check (default: {DOMAIN_NAME})")
+    parser.add_argument("--file", help="File with one domain per line (e.g. a portfolio list)")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached WHOIS records")
+    parser.add_argument("--ttl-hours", type=float, default=WHOIS_TTL / 3600, help="Cache lifetime in hours")
+    parser.add_argument("--json", action="store_true", help="Print parsed records as JSON")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent whois processes")
+    parser.add_argument("--per-server", type=int, default=PER_SERVER_CONCURRENCY,
+                        help="Concurrent lookups per WHOIS server")
+    parser.add_argument("--interval", type=float, default=SERVER_INTERVAL,
+                        help="Minimum seconds between lookups to one WHOIS server")
+    args = parser.parse_args()
+
+    domains = list(args.domains)
+    if args.file:
+        with open(args.file) as f:
+            domains += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    domains = list(dict.fromkeys(d.lower() for d in domains)) or [DOMAIN_NAME]
+    cache = WhoisCache(ttl=args.ttl_hours * 3600)
+    
+    if not args.json:
         print("="*60)
-        print("Analysis")
+        print("Domain Ownership Check")
         print("="*60)
-        print("")
-        
-        # Check if it might be user's domain
-        if 'registrant_org' in info:
-            org_lower = info['registrant_org'].lower()
-            if 'ffj' in org_lower or 'consulting' in org_lower:
-                print("✅ Organization name suggests this might be your domain!")
-            else:
-                print("⚠️  Organization name doesn't match 'FFJ Consulting LLC'")
-        
-        if 'registrar' in info:
-            print("")
-            print(f"To update nameservers:")
-            print(f"1. Log into {info['registrar']}")
-            print(f"2. Find domain: {DOMAIN_NAME}")
-            print(f"3. Update nameservers to Route 53")
-    else:
-        print("⚠️  Could not parse WHOIS information")
-        print("")
-        print("Raw WHOIS output:")
-        print(whois_output[:500])
-        print("...")
+    
+    records = {}
+    cached = 0 if args.refresh else sum(1 for d in domains if cache.get(d) is not None)
+    start = time.perf_counter()
+    try:
+        for domain, info in lookup_many(domains, cache, refresh=args.refresh, workers=args.workers,
+                                        per_server=args.per_server, interval=args.interval):
+            records[domain] = info
+            if not args.json:
+                print("")
+                print_info(domain, info)
+                sys.stdout.flush()
+    finally:
+        cache.save()
+    
+    if args.json:
+        print(json.dumps(records, indent=2))
+        return
     
     print("")
     print("="*60)
+    print(f"{len(domains)} domains in {time.perf_counter() - start:.1f}s, {cached} from cache ({cache.path})")
+    if any(info is None for info in records.values()):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
 """
 Domain Availability Checker using public APIs
+
+DNS evidence comes from dns_probe.py: A, AAAA, NS, SOA and MX are queried
+concurrently for every domain and results print as they arrive.
+
+Usage:
+  python3 check-domains-web.py                              # built-in list
+  python3 check-domains-web.py a.com b.net --timeout 2
+  python3 check-domains-web.py --file names.txt --resolver 127.0.0.1:5353
 """
 
+import argparse
+import asyncio
+import time
+
 import requests
 import json
 
+from dns_probe import DEFAULT_TIMEOUT, parse_address, probe_many
+
 def check_domain_whois(domain):
     """Check domain using whois API"""
     try:
@@ -21,48 +35,66 @@ def check_domain_whois(domain):
         pass
     return None
 
-def check_domain_dns(domain):
-    """Check if domain has DNS records (indicates it's taken)"""
-    try:
-        import socket
-        socket.gethostbyname(domain)
-        return "UNAVAILABLE"  # Has DNS, likely taken
-    except socket.gaierror:
-        return "POSSIBLY_AVAILABLE"  # No DNS, might be available
-    except:
-        return None
+STATUS_LABELS = {
+    "IN_USE": "❌ LIKELY UNAVAILABLE (has address/mail records)",
+    "REGISTERED": "❌ LIKELY UNAVAILABLE (delegated, no website)",
+    "LAME": "❌ LIKELY UNAVAILABLE (delegated, name servers failing)",
+    "POSSIBLY_AVAILABLE": "✅ POSSIBLY AVAILABLE (not in the TLD zone)",
+    "UNKNOWN": "❓ Could not determine (DNS timed out)",
+    "ERROR": "❓ Could not determine (DNS error)",
+    "INVALID": "⚠️  Not a valid domain name",
+}
+
+DEFAULT_DOMAINS = [
+    "ffjconsulting.com",
+    "ffj-consulting.com",
+    "ffjconsultingllc.com",
+    "ffjconsulting.cloud",
+    "ffjconsulting.ai"
+]
+
+async def check_domains_dns(domains, resolver, port, timeout):
+    """Print each domain's DNS evidence as soon as it is known; return {domain: status}"""
+    results = {}
+    async for result in probe_many(domains, resolver, port, timeout):
+        results[result.domain] = result.status
+        print(f"{result.domain:40} {STATUS_LABELS[result.status]}")
+        evidence = ", ".join(f"{t}: {' '.join(v[:2])}" for t, v in result.records.items())
+        if evidence:
+            print(f"{'':40}   {evidence}")
+    return results
 
 def main():
-    domains = [
-        "ffjconsulting.com",
-        "ffj-consulting.com",
-        "ffjconsultingllc.com",
-        "ffjconsulting.cloud",
-        "ffjconsulting.ai"
-    ]
+    parser = argparse.ArgumentParser(description="Quick DNS-based domain availability check")
+    parser.add_argument("domains", nargs="*", help="Domains to check (default: built-in list)")
+    parser.add_argument("--file", help="File with one domain per line")
+    parser.add_argument("--resolver", help="Resolver address, optionally with :port (default: system)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per DNS query")
+    args = parser.parse_args()
+
+    domains = list(args.domains)
+    if args.file:
+        with open(args.file) as f:
+            domains += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    domains = domains or DEFAULT_DOMAINS
+    resolver, port = parse_address(args.resolver) if args.resolver else (None, 53)
     
     print("=" * 60)
     print("FFJ Consulting LLC - Domain Availability Check")
     print("=" * 60)
     print()
-    print("Checking domains...")
+    print(f"Checking {len(domains)} domains (A, AAAA, NS, SOA, MX)...")
     print("(Note: This is a quick check. For accurate results,")
     print(" use AWS Route 53 Console or namecheap.com)")
     print()
     
-    for domain in domains:
-        print(f"Checking: {domain}")
-        
-        # Try DNS check first
-        dns_result = check_domain_dns(domain)
-        
-        if dns_result == "UNAVAILABLE":
-            print(f"  ❌ LIKELY UNAVAILABLE (has DNS records)")
-        elif dns_result == "POSSIBLY_AVAILABLE":
-            print(f"  ✅ POSSIBLY AVAILABLE (no DNS found)")
-        else:
-            print(f"  ❓ Could not determine (check manually)")
-        print()
+    start = time.perf_counter()
+    results = asyncio.run(check_domains_dns(domains, resolver, port, args.timeout))
+    possibly = [d for d, status in results.items() if status == "POSSIBLY_AVAILABLE"]
+    print()
+    print(f"Checked {len(results)} domains in {time.perf_counter() - start:.1f}s; "
+          f"{len(possibly)} possibly available")
+    print()
     
     print("=" * 60)
     print("RECOMMENDATION:")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Check (and optionally wait for) nameserver delegation propagation.
+
+Asks the TLD servers and a set of public resolvers for the domain's NS / SOA
+records at the same time and compares them with the Route 53 hosted zone's
+delegation set. With --watch it keeps polling, backing off between rounds,
+until every responding resolver has the new nameservers.
+
+Usage:
+  python3 check-ns-propagation.py                                   # ffjconsulting.com, one round
+  python3 check-ns-propagation.py ffjconsultingllc.com --watch --deadline-minutes 120
+  python3 check-ns-propagation.py example.com --expected ns1.a.net,ns2.a.net \\
+      --resolvers 127.0.0.1:5301,127.0.0.1:5302 --tld-servers 127.0.0.1:5400
+"""
+
+import argparse
+import asyncio
+import sys
+
+from ns_propagation import (
+    DEFAULT_RESOLVERS, MAX_POLL_INTERVAL, POLL_INTERVAL, check_round, targets_from, tld_targets, watch,
+)
+from dns_probe import DEFAULT_TIMEOUT
+from route53_records import find_hosted_zone
+
+DOMAIN_NAME = "ffjconsulting.com"
+HOSTED_ZONE_ID = "Z0268429M8AW2ZUY4ECU"
+PROFILE = "my-sso"
+REGION = "us-east-1"
+
+STATUS_ICONS = {"MATCH": "✅", "PARTIAL": "⚠️ ", "OLD": "⏳", "NXDOMAIN": "❌", "ERROR": "❌", "TIMEOUT": "❓"}
+
+
+def expected_nameservers(domain, zone_id):
+    """Delegation set of the hosted zone (by id, or looked up by domain name)."""
+    import boto3
+    session = boto3.Session(profile_name=PROFILE)
+    route53 = session.client("route53", region_name=REGION)
+    if zone_id is None:
+        zone_id = find_hosted_zone(route53, domain)
+        if zone_id is None:
+            raise LookupError(f"No hosted zone for {domain}")
+    response = route53.get_hosted_zone(Id=zone_id)
+    return response["DelegationSet"]["NameServers"]
+
+
+def print_round(result, verbose):
+    print(f"Round {result.number} at {result.elapsed / 60:.1f} min: "
+          f"{result.matched}/{result.responding} responding targets propagated ({result.percent:.0f}%)")
+    if not verbose:
+        return
+    for r in sorted(result.results, key=lambda r: (r.target.kind != "tld", r.target.name)):
+        label = f"{'TLD' if r.target.kind == 'tld' else 'DNS'} {r.target.name}"
+        serial = f" serial {r.soa_serial}" if r.soa_serial is not None else ""
+        servers = ", ".join(r.nameservers) if r.nameservers else ""
+        print(f"  {STATUS_ICONS[r.status]} {label:32} {r.status:8}{serial}  {servers}")
+    print("")
+
+
+async def run(args, expected):
+    resolvers = targets_from(args.resolvers.split(",") if args.resolvers else DEFAULT_RESOLVERS)
+    if args.tld_servers:
+        tlds = targets_from(args.tld_servers.split(","), kind="tld")
+    elif args.no_tld:
+        tlds = []
+    else:
+        try:
+            tlds = await tld_targets(args.domain, args.timeout)
+        except Exception as e:
+            print(f"⚠️  Could not find the TLD servers: {e}")
+            tlds = []
+    targets = tlds + resolvers
+    print(f"Querying {len(tlds)} TLD servers and {len(resolvers)} resolvers")
+    print("")
+
+    if not args.watch:
+        result = await check_round(args.domain, expected, targets, args.timeout)
+        print_round(result, verbose=True)
+        return result
+    result = None
+    async for result in watch(args.domain, expected, targets, args.timeout, args.interval,
+                              args.max_interval, args.deadline_minutes * 60):
+        print_round(result, verbose=args.verbose)
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Nameserver delegation propagation checker")
+    ap.add_argument("domain", nargs="?", default=DOMAIN_NAME)
+    ap.add_argument("--zone-id", help="Route 53 hosted zone id (default: looked up by domain name)")
+    ap.add_argument("--expected", help="Comma-separated expected nameservers (skips the Route 53 lookup)")
+    ap.add_argument("--resolvers", help="Comma-separated resolver addresses ip[:port] (default: public resolvers)")
+    ap.add_argument("--tld-servers", help="Comma-separated TLD server addresses ip[:port] (default: discovered)")
+    ap.add_argument("--no-tld", action="store_true", help="Do not query the TLD servers")
+    ap.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per query")
+    ap.add_argument("--watch", action="store_true", help="Poll until fully propagated")
+    ap.add_argument("--interval", type=float, default=POLL_INTERVAL, help="First wait between rounds (seconds)")
+    ap.add_argument("--max-interval", type=float, default=MAX_POLL_INTERVAL, help="Longest wait between rounds")
+    ap.add_argument("--deadline-minutes", type=float, default=60, help="Give up watching after this long")
+    ap.add_argument("-v", "--verbose", action="store_true", help="Show every target in each --watch round")
+    args = ap.parse_args()
+    args.domain = args.domain.lower().rstrip(".")
+
+    print("=" * 70)
+    print(f"Nameserver Propagation: {args.domain}")
+    print("=" * 70)
+
+    if args.expected:
+        expected = [ns.strip() for ns in args.expected.split(",") if ns.strip()]
+    else:
+        zone_id = args.zone_id or (HOSTED_ZONE_ID if args.domain == DOMAIN_NAME else None)
+        try:
+            expected = expected_nameservers(args.domain, zone_id)
+        except Exception as e:
+            print(f"❌ Could not get the hosted zone's nameservers: {e}")
+            print("   Pass them with --expected ns1,ns2,...")
+            sys.exit(1)
+    print("Expected (Route 53 delegation set):")
+    for ns in expected:
+        print(f"  - {ns.rstrip('.').lower()}")
+    print("")
+
+    result = asyncio.run(run(args, expected))
+    if result is not None and result.responding and result.matched == result.responding:
+        print("✅ Delegation fully propagated")
+        return
+    print("⏳ Not fully propagated yet" if result and result.responding else "❌ No target responded")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate job postings (the same role reposted by several boards and
+recruiters) with MinHash signatures and LSH banding.
+
+  1. Each posting is tokenized (job_text.tokenize) and cut into word k-shingles,
+     hashed to 64-bit integers with a stable rolling hash.
+  2. MinHash signatures for a whole batch come from one vectorized pass: every
+     shingle goes through all permutations (multiply-shift hashing), then
+     np.minimum.reduceat takes the per-posting minimum.
+  3. Signatures are split into bands; postings sharing any band key are
+     candidates, confirmed when the estimated Jaccard similarity (fraction of
+     equal signature slots) reaches the threshold. Confirmed pairs are grouped
+     with union-find.
+
+The index (content digests, signatures, band keys) is kept in
+build/jobs/dedupe-index.npz. Each run only hashes postings it has not seen
+before and checks them against everything already indexed.
+
+Run from repo root:
+  python3 dedupe-jobs.py postings.jsonl                      # index + report duplicates
+  python3 dedupe-jobs.py new-postings/ --out unique.jsonl    # write one posting per cluster
+  python3 dedupe-jobs.py postings.jsonl --threshold 0.7 --reset
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    import subprocess
+    print("Installing numpy...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "--user", "--quiet"])
+    import numpy as np
+
+from job_text import load_jobs, tokenize
+
+REPO_ROOT = Path(__file__).resolve().parent
+INDEX_PATH = REPO_ROOT / "build" / "jobs" / "dedupe-index.npz"
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+SEED = 20240601
+# Rows processed per chunk when hashing shingles through every permutation
+CHUNK_ROWS = 1 << 14
+# Groups larger than this (boilerplate text) are linked as a chain instead of all pairs
+MAX_GROUP_PAIRS = 64
+
+SHINGLE_BASE = np.uint64(1099511628211)  # FNV prime, used as the rolling-hash base
+BAND_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def choose_bands(num_perm, threshold, fn_weight=0.7):
+    """
+    (bands, rows) with bands * rows == num_perm that minimizes the weighted
+    false-positive area below the threshold plus false-negative area above it
+    on the LSH S-curve 1 - (1 - s^rows)^bands. Misses weigh more than extra
+    candidates, since candidates are verified against the signatures anyway.
+    """
+    s = np.linspace(0.0, 1.0, 1001)
+    below, above = s < threshold, s >= threshold
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        p = 1.0 - (1.0 - s ** rows) ** bands
+        error = (1 - fn_weight) * p[below].mean() * threshold + fn_weight * (1 - p[above]).mean() * (1 - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def permutations(num_perm, seed=SEED):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingle_hashes(tokens, k=SHINGLE_SIZE, token_hashes=None):
+    """
+    64-bit hashes of the word k-shingles of one posting (whole text if it is
+    shorter than k). token_hashes is an optional {token: crc32} cache shared
+    across postings.
+    """
+    if not tokens:
+        return np.zeros(1, dtype=np.uint64)
+    if token_hashes is None:
+        token_hashes = {}
+    for t in set(tokens).difference(token_hashes):
+        token_hashes[t] = zlib.crc32(t.encode())
+    h = np.fromiter(map(token_hashes.__getitem__, tokens), dtype=np.uint64, count=len(tokens))
+    k = min(k, len(h))
+    n = len(h) - k + 1
+    out = np.zeros(n, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(k):
+            out = out * SHINGLE_BASE + h[j:j + n]
+    return np.unique(out)
+
+
+def minhash(shingle_sets, a, b):
+    """Signatures (postings x permutations, uint32) for a list of shingle-hash arrays."""
+    if not shingle_sets:
+        return np.empty((0, len(a)), dtype=np.uint32)
+    lengths = np.fromiter((len(s) for s in shingle_sets), dtype=np.int64, count=len(shingle_sets))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    flat = np.concatenate(shingle_sets)
+    sig = np.empty((len(shingle_sets), len(a)), dtype=np.uint32)
+
+    # Process whole postings per chunk so reduceat boundaries stay inside a chunk
+    doc = 0
+    while doc < len(shingle_sets):
+        end_doc = doc + 1
+        while end_doc < len(shingle_sets) and starts[end_doc] + lengths[end_doc] - starts[doc] <= CHUNK_ROWS:
+            end_doc += 1
+        lo, hi = starts[doc], starts[end_doc - 1] + lengths[end_doc - 1]
+        # Permutations x shingles keeps each reduceat run contiguous in memory
+        with np.errstate(over="ignore"):
+            hashed = (a[:, None] * flat[None, lo:hi] + b[:, None]) >> np.uint64(32)
+        sig[doc:end_doc] = np.minimum.reduceat(hashed, starts[doc:end_doc] - lo, axis=1).T
+        doc = end_doc
+    return sig
+
+
+def band_keys(signatures, bands, rows):
+    """One 64-bit key per (posting, band), with the band number mixed in so bands never collide."""
+    sig = signatures.astype(np.uint64).reshape(len(signatures), bands, rows)
+    keys = np.zeros((len(signatures), bands), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for r in range(rows):
+            keys = (keys ^ sig[:, :, r]) * BAND_MIX
+        keys ^= np.arange(bands, dtype=np.uint64) * SHINGLE_BASE
+    return keys
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class DedupeIndex:
+    """Signatures and band keys of every posting seen so far, persisted as one .npz file."""
+
+    def __init__(self, num_perm=NUM_PERM, threshold=DEFAULT_THRESHOLD, shingle=SHINGLE_SIZE):
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.shingle = shingle
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        self.a, self.b = permutations(num_perm)
+        self.ids = []
+        self.titles = []
+        self.digests = []
+        self.signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self.keys = np.empty((0, self.bands), dtype=np.uint64)
+        self.cluster = np.empty(0, dtype=np.int64)  # cluster representative (row index) per posting
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            params = json.loads(str(data["params"]))
+            index = cls(params["num_perm"], params["threshold"], params["shingle"])
+            index.ids = [str(x) for x in data["ids"]]
+            index.titles = [str(x) for x in data["titles"]]
+            index.digests = [str(x) for x in data["digests"]]
+            index.signatures = data["signatures"]
+            index.keys = data["keys"]
+            index.cluster = data["cluster"]
+        return index
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        params = {"num_perm": self.num_perm, "threshold": self.threshold, "shingle": self.shingle}
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            params=np.array(json.dumps(params)),
+            ids=np.array(self.ids, dtype=str),
+            titles=np.array(self.titles, dtype=str),
+            digests=np.array(self.digests, dtype=str),
+            signatures=self.signatures,
+            keys=self.keys,
+            cluster=self.cluster,
+        )
+        tmp.replace(path)
+
+    def _candidate_pairs(self, first_new):
+        """Pairs (i, j), i < j, that share a band key and involve at least one posting >= first_new."""
+        flat = self.keys.ravel()
+        owner = np.repeat(np.arange(len(self.keys)), self.bands)
+        order = np.argsort(flat, kind="stable")
+        flat, owner = flat[order], owner[order]
+        # Boundaries of runs of equal keys with more than one member
+        cuts = np.flatnonzero(np.diff(flat)) + 1
+        starts = np.concatenate(([0], cuts))
+        ends = np.concatenate((cuts, [len(flat)]))
+        pairs = set()
+        for s, e in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+            members = np.unique(owner[s:e])
+            if len(members) < 2 or members[-1] < first_new:
+                continue
+            if len(members) <= MAX_GROUP_PAIRS:
+                for x in range(len(members)):
+                    for y in range(x + 1, len(members)):
+                        if members[y] >= first_new:
+                            pairs.add((int(members[x]), int(members[y])))
+            else:
+                pairs.update(zip(members[:-1].tolist(), members[1:].tolist()))
+        return pairs
+
+    def add(self, jobs):
+        """
+        Index new postings. Returns (added, exact, near) where exact / near are
+        lists of (new row, existing-or-new row, similarity).
+        """
+        known = {d: i for i, d in enumerate(self.digests)}
+        new_jobs, exact = [], []
+        for job in jobs:
+            text = " ".join(tokenize(job.title + "\n" + job.text))
+            digest = hashlib.sha1(text.encode()).hexdigest()
+            if digest in known:
+                exact.append((job, known[digest]))
+                continue
+            known[digest] = len(self.digests) + len(new_jobs)
+            new_jobs.append((job, digest, text.split()))
+
+        first_new = len(self.ids)
+        if not new_jobs:
+            return 0, exact, []
+        token_hashes = {}
+        sig = minhash(
+            [shingle_hashes(tokens, self.shingle, token_hashes) for _, _, tokens in new_jobs], self.a, self.b
+        )
+        self.signatures = np.vstack((self.signatures, sig))
+        self.keys = np.vstack((self.keys, band_keys(sig, self.bands, self.rows)))
+        for job, digest, _ in new_jobs:
+            self.ids.append(str(job.id))
+            self.titles.append(job.title)
+            self.digests.append(digest)
+
+        parent = np.concatenate((self.cluster, np.arange(first_new, len(self.ids))))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        near = []
+        pairs = sorted(self._candidate_pairs(first_new))
+        if pairs:
+            left, right = np.array(pairs).T
+            similarity = (self.signatures[left] == self.signatures[right]).mean(axis=1)
+            for i, j, sim in zip(left, right, similarity):
+                if sim >= self.threshold:
+                    near.append((int(j), int(i), float(sim)))
+                    ri, rj = find(i), find(j)
+                    if ri != rj:
+                        # The older posting stays the representative
+                        parent[max(ri, rj)] = min(ri, rj)
+        self.cluster = np.array([find(x) for x in range(len(parent))], dtype=np.int64)
+        return len(new_jobs), exact, near
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("jobs", help="Postings: directory of .txt/.md, or .jsonl / .json")
+    ap.add_argument("--index", default=str(INDEX_PATH), help="Index file (.npz)")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Jaccard similarity for a duplicate")
+    ap.add_argument("--perm", type=int, default=NUM_PERM, help="MinHash permutations (new index only)")
+    ap.add_argument("--shingle", type=int, default=SHINGLE_SIZE, help="Words per shingle (new index only)")
+    ap.add_argument("--reset", action="store_true", help="Start a fresh index")
+    ap.add_argument("--dry-run", action="store_true", help="Report without saving the index")
+    ap.add_argument("--out", help="Write the input postings minus duplicates to this .jsonl file")
+    args = ap.parse_args()
+
+    src = Path(args.jobs)
+    if not src.exists():
+        print(f"❌ File not found: {src}")
+        sys.exit(1)
+    index_path = Path(args.index)
+
+    print("=" * 60)
+    print("Near-duplicate job postings (MinHash / LSH)")
+    print("=" * 60)
+
+    if index_path.exists() and not args.reset:
+        index = DedupeIndex.load(index_path)
+        if abs(index.threshold - args.threshold) > 1e-9:
+            print(f"⚠️  Index was built with threshold {index.threshold}; using it (pass --reset to change)")
+    else:
+        index = DedupeIndex(args.perm, args.threshold, args.shingle)
+    existing = len(index.ids)
+
+    jobs = load_jobs(src)
+    start = time.perf_counter()
+    added, exact, near = index.add(jobs)
+    elapsed = time.perf_counter() - start
+
+    print(f"Index    : {index_path} ({existing:,} postings before this run)")
+    print(f"LSH      : {index.num_perm} permutations = {index.bands} bands x {index.rows} rows, "
+          f"threshold {index.threshold}")
+    print(f"Input    : {len(jobs):,} postings, {added:,} new, {len(exact):,} exact repeats")
+    print(f"Near-dup : {len(near):,} pairs in {elapsed * 1000:,.0f} ms")
+
+    def label(row):
+        title = index.titles[row]
+        return f"{index.ids[row]}" + (f" ({title})" if title else "")
+
+    clusters = {}
+    for row in range(existing, len(index.ids)):
+        clusters.setdefault(int(index.cluster[row]), []).append(row)
+    shown = 0
+    for rep, rows in clusters.items():
+        members = [r for r in rows if r != rep]
+        if not members:
+            continue
+        if shown == 0:
+            print("")
+        shown += 1
+        origin = "indexed earlier" if rep < existing else "this batch"
+        print(f"🔁 {label(rep)}  [{origin}]")
+        for r in members:
+            print(f"     ≈ {label(r)}")
+
+    if args.out:
+        duplicate_rows = {r for r in range(existing, len(index.ids)) if index.cluster[r] != r}
+        exact_ids = {id(job) for job, _ in exact}
+        row_of = {index.ids[r]: r for r in range(existing, len(index.ids))}
+        out = Path(args.out)
+        with open(out, "w", encoding="utf-8") as f:
+            kept = 0
+            for job in jobs:
+                if id(job) in exact_ids or row_of.get(str(job.id)) in duplicate_rows:
+                    continue
+                f.write(json.dumps(job._asdict()) + "\n")
+                kept += 1
+        print("")
+        print(f"📄 Saved: {out} ({kept:,} unique postings)")
+
+    if not args.dry_run:
+        index.save(index_path)
+        print(f"✅ Index saved: {len(index.ids):,} postings")
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,7 @@ def build_frontend():
         print(f"❌ Frontend directory not found: {FRONTEND_DIR}")
         return False
     
+    # npm's prebuild script generates frontend/public/search/ and content-bundle/, which vite copies into dist/
     os.chdir(FRONTEND_DIR)
     success = run_command(["npm", "run", "build"], "Building frontend")
     os.chdir("..")
@@ -160,6 +161,26 @@ def deploy_to_s3():
                     )
                     print("✅ CSS content-type set to text/css")
         
+        # Search index and content bundle: hashed files are immutable, manifests must always be revalidated
+        for generated in ("search", "content-bundle"):
+            generated_dir = os.path.join(DIST_DIR, generated)
+            if not os.path.exists(generated_dir):
+                continue
+            print(f"\nSetting cache headers for {generated}/ files")
+            for file in os.listdir(generated_dir):
+                if not file.endswith(".json"):
+                    continue
+                generated_key = f"{generated}/{file}"
+                s3.copy_object(
+                    CopySource={'Bucket': BUCKET_NAME, 'Key': generated_key},
+                    Bucket=BUCKET_NAME,
+                    Key=generated_key,
+                    ContentType='application/json',
+                    CacheControl='no-cache' if file == "manifest.json" else 'public, max-age=31536000, immutable',
+                    MetadataDirective='REPLACE'
+                )
+            print(f"✅ {generated}/ cache headers set")
+        
         print("\n✅ All files uploaded to S3 with correct content-types")
         return True
         
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Structural diff between two versions of a resume .docx.
+
+Every paragraph (body and table cells) is reduced to a hash of its text, style
+and list level. The two hash sequences are aligned with a patience diff (unique
+paragraphs as anchors) that falls back to Myers' O(ND) algorithm between
+anchors (blocks needing more than MAX_EDIT_DISTANCE edits are shown as one
+replacement), then the script reports:
+
+  +  inserted paragraphs        -  deleted paragraphs
+  >  moved paragraphs           ~  same text/style but different run formatting
+
+Typical use, after running one of the *-docx.py edit scripts on a copy:
+  python3 diff-resume-docx.py before.docx after.docx
+  python3 diff-resume-docx.py before.docx after.docx --html diff.html
+"""
+
+import argparse
+import html
+import sys
+import time
+import zipfile
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+
+try:
+    from lxml import etree
+except ImportError:
+    import subprocess
+    print("Installing lxml...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "lxml", "--user", "--quiet"])
+    from lxml import etree
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# key: hash of (text, style, level); runs: run-formatting signature
+Para = namedtuple("Para", ["key", "text", "style", "level", "runs"])
+Change = namedtuple("Change", ["op", "old_index", "new_index", "para", "detail"])
+
+# Edit distance beyond which a block without unique anchors is treated as one replacement
+MAX_EDIT_DISTANCE = 2000
+
+RUN_PROPS = ("b", "i", "u", "strike", "caps", "smallCaps", "color", "sz", "highlight", "rFonts")
+
+
+def _val(el, name):
+    child = el.find(W + name) if el is not None else None
+    if child is None:
+        return None
+    return child.get(W + "val", "on")
+
+
+def _style_names(zf):
+    """Map style ids to display names ("ListBullet2" -> "List Bullet 2")."""
+    try:
+        root = etree.fromstring(zf.read("word/styles.xml"))
+    except KeyError:
+        return {}
+    names = {}
+    for style in root.iter(W + "style"):
+        name = style.find(W + "name")
+        names[style.get(W + "styleId")] = name.get(W + "val") if name is not None else style.get(W + "styleId")
+    return names
+
+
+def load_paragraphs(path):
+    """Read a .docx and return its paragraphs, in document order, as Para tuples."""
+    with zipfile.ZipFile(path) as zf:
+        styles = _style_names(zf)
+        root = etree.fromstring(zf.read("word/document.xml"))
+
+    paras = []
+    for p in root.iter(W + "p"):
+        ppr = p.find(W + "pPr")
+        style_id = _val(ppr, "pStyle")
+        style = styles.get(style_id, style_id) or "Normal"
+        num_pr = ppr.find(W + "numPr") if ppr is not None else None
+        level = int(_val(num_pr, "ilvl") or 0) if num_pr is not None else -1
+
+        texts = []
+        runs = []
+        for r in p.iter(W + "r"):
+            run_text = "".join(t.text or "" for t in r.iter(W + "t"))
+            if not run_text:
+                continue
+            rpr = r.find(W + "rPr")
+            props = tuple(_val(rpr, name) for name in RUN_PROPS) if rpr is not None else ()
+            texts.append(run_text)
+            runs.append((run_text, props))
+        text = "".join(texts)
+        paras.append(Para(hash((text, style, level)), text, style, level, tuple(runs)))
+    return paras
+
+
+# ---------------------------------------------------------------------------
+# Sequence alignment
+# ---------------------------------------------------------------------------
+
+def _myers(a, b, alo, ahi, blo, bhi, max_d=MAX_EDIT_DISTANCE):
+    """
+    Matched index pairs for a[alo:ahi] vs b[blo:bhi] using Myers' greedy O(ND) diff.
+
+    Only the diagonals reachable at each step are kept for the backtrack, so
+    memory is O(D^2). Blocks needing more than `max_d` edits are reported as a
+    whole replacement (no matches) instead of spending O((N+M)D) on them.
+    """
+    n, m = ahi - alo, bhi - blo
+    if n == 0 or m == 0:
+        return []
+    limit = min(n + m, max_d)
+    offset = limit + 1
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for d in range(limit + 1):
+        # Diagonals -d-1 .. d+1 of the previous step, all the backtrack needs
+        trace.append(v[offset - d - 1:offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m, alo, blo)
+    return []
+
+
+def _myers_backtrack(trace, x, y, alo, blo):
+    matches = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        base = d + 1  # trace[d][base + k] is diagonal k
+        k = x - y
+        if k == -d or (k != d and v[base + k - 1] < v[base + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[base + prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((alo + x, blo + y))
+        if d > 0:
+            x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def _unique_anchors(a, b, alo, ahi, blo, bhi):
+    """Longest increasing run of paragraphs that occur exactly once on each side."""
+    counts = defaultdict(lambda: [0, 0, 0])  # count in a, count in b, index in b
+    for i in range(alo, ahi):
+        counts[a[i]][0] += 1
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry[2] = j
+
+    pairs = []
+    for i in range(alo, ahi):
+        ca, cb, j = counts[a[i]]
+        if ca == 1 and cb == 1:
+            pairs.append((i, j))
+
+    # Patience sorting: LIS over the b indices
+    tails, tail_idx, prev = [], [], [None] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(n)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = n
+        prev[n] = tail_idx[pos - 1] if pos else None
+    anchors = []
+    n = tail_idx[-1] if tail_idx else None
+    while n is not None:
+        anchors.append(pairs[n])
+        n = prev[n]
+    anchors.reverse()
+    return anchors
+
+
+def align(a, b):
+    """Return matched (i, j) index pairs between key sequences a and b (patience diff, Myers fallback)."""
+    matches = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        # Common prefix / suffix
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if not anchors:
+            matches.extend(_myers(a, b, alo, ahi, blo, bhi))
+            continue
+        prev_i, prev_j = alo, blo
+        for i, j in anchors:
+            matches.append((i, j))
+            stack.append((prev_i, i, prev_j, j))
+            prev_i, prev_j = i + 1, j + 1
+        stack.append((prev_i, ahi, prev_j, bhi))
+    matches.sort()
+    return matches
+
+
+def diff_paragraphs(old, new):
+    """Diff two Para lists. Returns Changes ordered by position in the new document."""
+    matches = align([p.key for p in old], [p.key for p in new])
+    matched_old = {i for i, _ in matches}
+    matched_new = {j for _, j in matches}
+
+    deleted = [i for i in range(len(old)) if i not in matched_old]
+    inserted = [j for j in range(len(new)) if j not in matched_new]
+
+    # A deletion and an insertion of the same paragraph is a move
+    pending = defaultdict(list)
+    for i in deleted:
+        pending[old[i].key].append(i)
+    changes = []
+    moved_old = set()
+    for j in inserted:
+        candidates = pending.get(new[j].key)
+        if candidates and new[j].text.strip():
+            i = candidates.pop(0)
+            moved_old.add(i)
+            changes.append(Change("move", i, j, new[j], f"from #{i + 1}"))
+        else:
+            changes.append(Change("insert", None, j, new[j], ""))
+    for i in deleted:
+        if i not in moved_old:
+            changes.append(Change("delete", i, None, old[i], ""))
+
+    for i, j in matches:
+        if old[i].runs != new[j].runs:
+            changes.append(Change("format", i, j, new[j], _format_detail(old[i].runs, new[j].runs)))
+
+    matched_i = [i for i, _ in matches]
+
+    def position(change):
+        # Deletions sort just after the new paragraph that now precedes them
+        if change.new_index is not None:
+            return (change.new_index, 0)
+        n = bisect_left(matched_i, change.old_index)
+        return (matches[n - 1][1] if n else -1, 1)
+
+    changes.sort(key=position)
+    return changes
+
+
+def _format_detail(old_runs, new_runs):
+    old_fmt = {text: props for text, props in old_runs}
+    notes = []
+    for text, props in new_runs:
+        before = old_fmt.get(text)
+        if before is not None and before != props:
+            diffs = [
+                f"{name}: {a or '-'}→{b or '-'}"
+                for name, a, b in zip(RUN_PROPS, before or (None,) * len(RUN_PROPS), props or (None,) * len(RUN_PROPS))
+                if a != b
+            ]
+            notes.append(f'"{text[:30]}" ' + ", ".join(diffs))
+    if not notes:
+        notes.append(f"runs re-split ({len(old_runs)} → {len(new_runs)})")
+    return "; ".join(notes)
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+SYMBOLS = {"insert": "+", "delete": "-", "move": ">", "format": "~"}
+COLORS = {"insert": "\033[32m", "delete": "\033[31m", "move": "\033[36m", "format": "\033[33m"}
+RESET = "\033[0m"
+
+
+def print_terminal(changes, color):
+    for c in changes:
+        where = f"#{(c.new_index if c.new_index is not None else c.old_index) + 1}"
+        line = f"{SYMBOLS[c.op]} {where:>7} [{c.para.style}] {c.para.text[:100]}"
+        if c.detail:
+            line += f"  ({c.detail})"
+        print(f"{COLORS[c.op]}{line}{RESET}" if color else line)
+
+
+def write_html(changes, path, old_name, new_name):
+    rows = []
+    for c in changes:
+        where = (c.new_index if c.new_index is not None else c.old_index) + 1
+        rows.append(
+            f'<tr class="{c.op}"><td>{SYMBOLS[c.op]}</td><td>{where}</td>'
+            f"<td>{html.escape(c.para.style)}</td><td>{html.escape(c.para.text)}</td>"
+            f"<td>{html.escape(c.detail)}</td></tr>"
+        )
+    page = f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Resume diff</title>
+<style>
+body {{ font-family: -apple-system, "Segoe UI", Arial, sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td {{ border-bottom: 1px solid #eee; padding: 4px 8px; vertical-align: top; }}
+tr.insert {{ background: #e6ffed; }} tr.delete {{ background: #ffeef0; }}
+tr.move {{ background: #e8f4fd; }} tr.format {{ background: #fff8c5; }}
+</style></head><body>
+<h1>Resume diff</h1>
+<p>{html.escape(old_name)} → {html.escape(new_name)}: {len(changes)} change(s)</p>
+<table><tr><th></th><th>#</th><th>Style</th><th>Text</th><th>Detail</th></tr>
+{chr(10).join(rows)}
+</table></body></html>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("old", help="Original .docx")
+    ap.add_argument("new", help="Changed .docx")
+    ap.add_argument("--html", help="Also write an HTML report to this path")
+    ap.add_argument("--no-color", action="store_true", help="Plain terminal output")
+    args = ap.parse_args()
+
+    start = time.perf_counter()
+    try:
+        old = load_paragraphs(args.old)
+        new = load_paragraphs(args.new)
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        print(f"❌ Could not read document: {e}")
+        sys.exit(1)
+    loaded = time.perf_counter()
+    changes = diff_paragraphs(old, new)
+    done = time.perf_counter()
+
+    print("=" * 60)
+    print(f"Resume diff: {len(old)} → {len(new)} paragraphs")
+    print("=" * 60)
+    if changes:
+        print_terminal(changes, color=not args.no_color and sys.stdout.isatty())
+    else:
+        print("✅ No structural differences")
+
+    counts = defaultdict(int)
+    for c in changes:
+        counts[c.op] += 1
+    print("")
+    print(f"+{counts['insert']} -{counts['delete']} >{counts['move']} ~{counts['format']}  "
+          f"(parse {(loaded - start) * 1000:.0f} ms, diff {(done - loaded) * 1000:.0f} ms)")
+
+    if args.html:
+        write_html(changes, args.html, args.old, args.new)
+        print(f"📄 HTML report: {args.html}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Concurrent DNS evidence for domain availability checks.
+
+Every domain is probed for A, AAAA, NS, SOA and MX at once (asyncio, dnspython),
+each query with its own timeout (one UDP retransmit inside it), and the combined answers are classified:
+
+  IN_USE              has address or mail records: registered and serving
+  REGISTERED          delegated (NS / SOA) or the zone answers with no data
+  LAME                the registry delegates it but its name servers fail (SERVFAIL)
+  POSSIBLY_AVAILABLE  NXDOMAIN: not in the TLD zone (unregistered, or registered
+                      without name servers; confirm with a registrar)
+  UNKNOWN             every query timed out
+  ERROR               every query failed some other way (bad response, ...)
+  INVALID             not a valid domain name (e.g. "a..com"); nothing is queried
+
+The resolver address is configurable, so tests can point at a local stand-in.
+Results are yielded as they complete; a batch takes about one timeout window
+regardless of size (bounded by `concurrency`).
+
+  async for result in probe_many(domains, nameserver="127.0.0.1", port=5353):
+      print(result.domain, result.status)
+"""
+
+import asyncio
+import sys
+from collections import namedtuple
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.name
+    import dns.resolver
+except ImportError:
+    import subprocess
+    print("Installing dnspython...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "dnspython", "--user", "--quiet"])
+    import dns.asyncresolver
+    import dns.exception
+    import dns.name
+    import dns.resolver
+
+RECORD_TYPES = ("A", "AAAA", "NS", "SOA", "MX")
+DEFAULT_TIMEOUT = 3.0
+# Domains in flight (x5 queries); public resolvers rate-limit bursts per client
+DEFAULT_CONCURRENCY = 100
+
+# Per-type outcome of one query
+NOERROR, NXDOMAIN, SERVFAIL, TIMEOUT, ERROR = "NOERROR", "NXDOMAIN", "SERVFAIL", "TIMEOUT", "ERROR"
+
+# records: {type: [text, ...]}, outcomes: {type: NOERROR | NXDOMAIN | SERVFAIL | TIMEOUT | ERROR}
+ProbeResult = namedtuple("ProbeResult", ["domain", "status", "records", "outcomes", "elapsed"])
+
+
+def parse_address(value, default_port=53):
+    """'1.1.1.1', '127.0.0.1:5353' or a bare IPv6 address -> (address, port)"""
+    if value.count(":") == 1:          # IPv4 with port; bare IPv6 has several colons
+        host, _, port = value.partition(":")
+        return host, int(port)
+    return value, default_port
+
+
+def make_resolver(nameserver=None, port=53, timeout=DEFAULT_TIMEOUT):
+    """Async resolver; system configuration unless `nameserver` (an IP address) is given."""
+    resolver = dns.asyncresolver.Resolver(configure=nameserver is None)
+    if nameserver is not None:
+        resolver.nameservers = [nameserver]
+    resolver.port = port
+    # UDP can drop a packet: leave room for one retransmit inside the per-query timeout
+    resolver.timeout = timeout / 2
+    resolver.lifetime = timeout
+    return resolver
+
+
+async def _query(resolver, domain, rdtype):
+    try:
+        answer = await resolver.resolve(domain, rdtype, raise_on_no_answer=False, search=False)
+    except dns.resolver.NXDOMAIN:
+        return rdtype, NXDOMAIN, []
+    except dns.resolver.NoNameservers:
+        return rdtype, SERVFAIL, []
+    except dns.exception.Timeout:
+        return rdtype, TIMEOUT, []
+    except dns.exception.DNSException:
+        return rdtype, ERROR, []
+    records = [rdata.to_text().rstrip(".").lower() for rdata in answer.rrset] if answer.rrset else []
+    return rdtype, NOERROR, sorted(set(records))
+
+
+def classify(records, outcomes):
+    if any(records.get(t) for t in ("A", "AAAA", "MX")):
+        return "IN_USE"
+    if records.get("NS") or records.get("SOA"):
+        return "REGISTERED"
+    values = set(outcomes.values())
+    if NOERROR in values:
+        return "REGISTERED"
+    if SERVFAIL in values:
+        return "LAME"
+    if NXDOMAIN in values:
+        return "POSSIBLY_AVAILABLE"
+    if TIMEOUT in values:
+        return "UNKNOWN"
+    return "ERROR"
+
+
+async def probe_domain(resolver, domain, record_types=RECORD_TYPES):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        dns.name.from_text(domain)
+    except dns.exception.DNSException:
+        return ProbeResult(domain, "INVALID", {}, {}, 0.0)
+    answers = await asyncio.gather(*(_query(resolver, domain, t) for t in record_types))
+    records = {t: values for t, _, values in answers if values}
+    outcomes = {t: outcome for t, outcome, _ in answers}
+    return ProbeResult(domain, classify(records, outcomes), records, outcomes, loop.time() - start)
+
+
+async def probe_many(domains, nameserver=None, port=53, timeout=DEFAULT_TIMEOUT,
+                     concurrency=DEFAULT_CONCURRENCY, record_types=RECORD_TYPES):
+    """Async generator of ProbeResult in completion order."""
+    resolver = make_resolver(nameserver, port, timeout)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(domain):
+        async with limit:
+            return await probe_domain(resolver, domain, record_types)
+
+    tasks = [asyncio.ensure_future(bounded(d)) for d in dict.fromkeys(domains)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,141 @@
+"""
+Concurrent Route 53 Domains availability checks.
+
+Route 53 Domains allows about five API requests per second per account, so
+requests go through a shared token bucket. Worker threads keep that many calls
+in flight, which hides the round-trip time of each call. On a throttling error
+the bucket rate is halved and the call is retried with jittered exponential
+backoff; a run of successes slowly raises the rate back to the configured
+maximum (AIMD).
+
+  from domain_availability import check_domains
+  for domain, availability in check_domains(client, domains):   # as results arrive
+      ...
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# Route 53 Domains quota: 5 requests per second per account
+ROUTE53_DOMAINS_RPS = 5.0
+MIN_RPS = 0.5
+DEFAULT_WORKERS = 16
+MAX_RETRIES = 6
+BASE_BACKOFF = 0.5
+# Successes needed before the bucket rate is raised again after a throttle
+RECOVERY_STREAK = 3
+# Throttles within this many seconds of a rate cut are the same event (other in-flight calls)
+THROTTLE_COOLDOWN = 1.0
+
+THROTTLE_CODES = ("ThrottlingException", "Throttling", "TooManyRequestsException", "RequestLimitExceeded")
+
+# botocore's own retries would sleep without telling the bucket; let the bucket handle throttling
+CLIENT_CONFIG = Config(retries={"max_attempts": 1, "mode": "standard"}, max_pool_connections=DEFAULT_WORKERS)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts to throttling (halve on throttle,
+    creep back up). The default capacity of one token paces calls evenly instead
+    of bursting, since a burst followed by the steady rate is what trips the quota.
+    """
+
+    def __init__(self, rate=ROUTE53_DOMAINS_RPS, capacity=1.0, min_rate=MIN_RPS):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.streak = 0
+        self.last_cut = float("-inf")
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self):
+        with self.lock:
+            self.streak = 0
+            now = time.monotonic()
+            if now - self.last_cut < THROTTLE_COOLDOWN:
+                return
+            self.last_cut = now
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0)
+
+    def succeeded(self):
+        with self.lock:
+            self.streak += 1
+            if self.rate < self.max_rate and self.streak >= RECOVERY_STREAK:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+                self.streak = 0
+
+
+def make_client(session):
+    """Route 53 Domains client (the API only exists in us-east-1) configured for check_domains()."""
+    return session.client("route53domains", region_name="us-east-1", config=CLIENT_CONFIG)
+
+
+def throttled_call(call, bucket=None, max_retries=MAX_RETRIES, **kwargs):
+    """
+    call(**kwargs) paced by `bucket`; throttling errors cut the bucket rate and
+    retry with jittered exponential backoff. Other errors, or throttling after
+    `max_retries` retries, raise ClientError.
+    """
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            response = call(**kwargs)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code", "")
+            if code in THROTTLE_CODES and attempt < max_retries:
+                if bucket is not None:
+                    bucket.throttled()
+                time.sleep(BASE_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5))
+                continue
+            raise
+        if bucket is not None:
+            bucket.succeeded()
+        return response
+
+
+def check_domain_availability(client, domain, bucket=None, max_retries=MAX_RETRIES):
+    """
+    Availability string for one domain: AVAILABLE, UNAVAILABLE, RESERVED, ...,
+    INVALID for names Route 53 rejects, or ERROR.
+    """
+    try:
+        response = throttled_call(client.check_domain_availability, bucket, max_retries, DomainName=domain)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code", "") == "InvalidInput":
+            return "INVALID"
+        return "ERROR"
+    return response.get("Availability", "UNKNOWN")
+
+
+def check_domains(client, domains, rate=ROUTE53_DOMAINS_RPS, workers=DEFAULT_WORKERS, max_retries=MAX_RETRIES):
+    """Yield (domain, availability) in completion order, checking up to `workers` domains at once."""
+    bucket = TokenBucket(rate)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(check_domain_availability, client, domain, bucket, max_retries): domain
+            for domain in dict.fromkeys(domains)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,192 @@
+"""
+Candidate domain names from a seed phrase, pruned locally before any API call.
+
+  expand(seed)        hyphenation, word subsets / order, affix and TLD combinations
+  valid_name(domain)  DNS label length / charset rules (+ a preferred max length)
+  NegativeCache       names already known to be taken, persisted with a TTL
+  BloomFilter         compact membership test for very large "known taken" lists
+
+Only names that pass every local check need a CheckDomainAvailability call.
+"""
+
+import hashlib
+import itertools
+import json
+import math
+import os
+import re
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_DIR = REPO_ROOT / "build" / "cache"
+NEGATIVE_CACHE_PATH = CACHE_DIR / "domains-taken.json"
+BLOOM_PATH = CACHE_DIR / "domains-taken.bloom"
+
+DEFAULT_TLDS = ("com", "net", "org", "io", "ai", "cloud", "co", "dev", "tech", "consulting")
+DEFAULT_PREFIXES = ("get", "try", "the", "my", "go")
+DEFAULT_SUFFIXES = ("llc", "group", "labs", "hq", "cloud", "ai", "tech", "solutions", "co", "app", "consulting")
+# Taken names can lapse, so negative entries expire
+NEGATIVE_TTL = 30 * 24 * 60 * 60
+MAX_LABEL = 63
+MAX_DOMAIN = 253
+DEFAULT_MAX_LABEL = 24
+
+LABEL_RE = re.compile(r"^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?$")
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+# ---------------------------------------------------------------------------
+# Generation and rules
+# ---------------------------------------------------------------------------
+
+def _labels(words, prefixes, suffixes):
+    """Second-level labels: word subsets in seed order and reversed, joined with and without hyphens, plus affixes."""
+    bases = []
+    for size in range(len(words), 0, -1):
+        for subset in itertools.combinations(words, size):
+            orders = [subset] if size == 1 else [subset, subset[::-1]]
+            for order in orders:
+                bases.append(order)
+    for base in bases:
+        for joiner in ("", "-"):
+            core = joiner.join(base)
+            yield core
+            for prefix in prefixes:
+                yield prefix + core
+                yield f"{prefix}-{core}"
+            for suffix in suffixes:
+                if suffix in base:
+                    continue
+                yield core + suffix
+                yield f"{core}-{suffix}"
+
+
+def expand(seed, tlds=DEFAULT_TLDS, prefixes=DEFAULT_PREFIXES, suffixes=DEFAULT_SUFFIXES):
+    """All candidate domains for a seed phrase like "ffj consulting", without duplicates, in generation order."""
+    words = WORD_RE.findall(seed.lower())
+    seen = set()
+    for label in _labels(words, prefixes, suffixes):
+        for tld in tlds:
+            domain = f"{label}.{tld.lstrip('.')}"
+            if domain not in seen:
+                seen.add(domain)
+                yield domain
+
+
+def valid_name(domain, max_label=DEFAULT_MAX_LABEL):
+    """DNS / registry rules: label 1-63 chars of [a-z0-9-], no edge hyphens, no "xx--" unless punycode."""
+    if len(domain) > MAX_DOMAIN:
+        return False
+    label, _, tld = domain.partition(".")
+    if not tld or len(label) > min(MAX_LABEL, max_label) or not LABEL_RE.match(label):
+        return False
+    if label[2:4] == "--" and not label.startswith("xn--"):
+        return False
+    return all(LABEL_RE.match(part) for part in tld.split("."))
+
+
+def rank(domain):
+    """Sort key: .com first, then shorter, then fewer hyphens."""
+    label, _, tld = domain.partition(".")
+    return (tld != "com", len(label), label.count("-"), domain)
+
+
+# ---------------------------------------------------------------------------
+# Negative cache
+# ---------------------------------------------------------------------------
+
+def is_taken(status):
+    """Route 53 answers that mean registered or not registrable; DONT_KNOW, INVALID, ... are not cached."""
+    return status.startswith("UNAVAILABLE") or status == "RESERVED"
+
+
+class NegativeCache:
+    """
+    {domain: (status, checked_at)} for names known to be taken; entries older
+    than the TTL, or whose status is not a taken one, are ignored.
+    """
+
+    def __init__(self, path=NEGATIVE_CACHE_PATH, ttl=NEGATIVE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def __contains__(self, domain):
+        entry = self.entries.get(domain)
+        return entry is not None and is_taken(entry[0]) and time.time() - entry[1] < self.ttl
+
+    def add(self, domain, status):
+        self.entries[domain] = (status, time.time())
+
+    def save(self):
+        now = time.time()
+        live = {d: e for d, e in self.entries.items() if is_taken(e[0]) and now - e[1] < self.ttl}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text(json.dumps(live, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Bloom filter
+# ---------------------------------------------------------------------------
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter (double hashing over one blake2b digest). Sized for
+    `capacity` items at false-positive rate `error`; a false positive only means
+    a candidate is skipped, never that a taken name is reported available.
+    """
+
+    MAGIC = b"BLM1"
+
+    def __init__(self, capacity=1_000_000, error=0.001, bits=None, hashes=None, data=None):
+        self.bits = bits or max(8, int(-capacity * math.log(error) / (math.log(2) ** 2)))
+        self.hashes = hashes or max(1, round(self.bits / capacity * math.log(2)))
+        self.data = data if data is not None else bytearray((self.bits + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.data[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self.data[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def save(self, path=BLOOM_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.MAGIC + self.bits.to_bytes(8, "little") + self.hashes.to_bytes(2, "little"))
+            f.write(self.data)
+
+    @classmethod
+    def load(cls, path=BLOOM_PATH):
+        raw = Path(path).read_bytes()
+        if raw[:4] != cls.MAGIC:
+            raise ValueError(f"{path} is not a Bloom filter file")
+        bits = int.from_bytes(raw[4:12], "little")
+        hashes = int.from_bytes(raw[12:14], "little")
+        return cls(bits=bits, hashes=hashes, data=bytearray(raw[14:]))
+
+    @classmethod
+    def from_file(cls, names_path, error=0.001):
+        """Build from a text file with one domain per line (e.g. a zone or top-sites list)."""
+        with open(names_path, encoding="utf-8", errors="replace") as f:
+            count = sum(1 for line in f if line.strip())
+        bloom = cls(capacity=max(count, 1), error=error)
+        with open(names_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                name = line.strip().lower().rstrip(".")
+                if name:
+                    bloom.add(name)
+        return bloom
@@ -0,0 +1,214 @@
+"""
+Route 53 Domains portfolio inventory with a local SQLite state store.
+
+  iter_domains(client)        every registered domain, following NextPageMarker
+  find_domain(client, name)   one domain's summary from the full listing, or None
+  fetch_details(client, ...)  get_domain_detail for many domains concurrently,
+                              through the shared Route 53 Domains token bucket
+  PortfolioStore              build/cache/portfolio.sqlite3: expiry, auto-renew,
+                              transfer lock, nameservers and status per domain
+  zone_nameservers(route53)   delegation set of every public hosted zone
+
+Details are only re-fetched for domains that are new, older than the store's
+max age, or whose listing changed (renewed, auto-renew / lock toggled).
+"""
+
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+
+from domain_availability import DEFAULT_WORKERS, ROUTE53_DOMAINS_RPS, TokenBucket, throttled_call
+
+REPO_ROOT = Path(__file__).resolve().parent
+STORE_PATH = REPO_ROOT / "build" / "cache" / "portfolio.sqlite3"
+DETAIL_MAX_AGE = 24 * 60 * 60
+EXPIRY_WARNING_DAYS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    name          TEXT PRIMARY KEY,
+    expiry        TEXT,
+    auto_renew    INTEGER,
+    transfer_lock INTEGER,
+    nameservers   TEXT NOT NULL DEFAULT '[]',
+    status        TEXT NOT NULL DEFAULT '[]',
+    registrar     TEXT,
+    fetched_at    REAL NOT NULL
+)
+"""
+
+
+def _iso(value):
+    """Datetime (boto3) or None -> ISO 8601 UTC string or None."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _nameservers(names):
+    return sorted({ns.rstrip(".").lower() for ns in names})
+
+
+# ---------------------------------------------------------------------------
+# Route 53 Domains
+# ---------------------------------------------------------------------------
+
+def iter_domains(client):
+    """Every domain summary (DomainName, AutoRenew, TransferLock, Expiry) in the account, across all pages."""
+    for page in client.get_paginator("list_domains").paginate():
+        yield from page.get("Domains", [])
+
+
+def find_domain(client, domain_name):
+    """Summary for `domain_name` if it is registered in this account, else None."""
+    domain_name = domain_name.lower().rstrip(".")
+    for summary in iter_domains(client):
+        if summary["DomainName"].lower() == domain_name:
+            return summary
+    return None
+
+
+def get_domain_detail(client, domain_name, bucket=None):
+    """get_domain_detail reduced to the fields the store keeps."""
+    detail = throttled_call(client.get_domain_detail, bucket, DomainName=domain_name)
+    return {
+        "expiry": _iso(detail.get("ExpirationDate")),
+        "auto_renew": detail.get("AutoRenew"),
+        "nameservers": _nameservers(ns["Name"] for ns in detail.get("Nameservers", [])),
+        "status": detail.get("StatusList", []),
+        "registrar": detail.get("RegistrarName"),
+    }
+
+
+def fetch_details(client, domain_names, rate=ROUTE53_DOMAINS_RPS, workers=DEFAULT_WORKERS):
+    """Yield (domain, detail, error) in completion order; `error` is a message when the call failed."""
+    bucket = TokenBucket(rate)
+
+    def fetch(name):
+        try:
+            return get_domain_detail(client, name, bucket), None
+        except ClientError as e:
+            return None, e.response.get("Error", {}).get("Message", str(e))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch, name): name for name in dict.fromkeys(domain_names)}
+        for future in as_completed(futures):
+            detail, error = future.result()
+            yield futures[future], detail, error
+
+
+# ---------------------------------------------------------------------------
+# Route 53 hosted zones
+# ---------------------------------------------------------------------------
+
+def zone_nameservers(route53_client):
+    """{zone name: [nameservers]} for every public hosted zone (its delegation set)."""
+    zones = {}
+    for page in route53_client.get_paginator("list_hosted_zones").paginate():
+        for zone in page.get("HostedZones", []):
+            if zone.get("Config", {}).get("PrivateZone"):
+                continue
+            response = route53_client.get_hosted_zone(Id=zone["Id"])
+            servers = response.get("DelegationSet", {}).get("NameServers", [])
+            zones.setdefault(zone["Name"].rstrip(".").lower(), []).append(_nameservers(servers))
+    return zones
+
+
+def nameserver_drift(record, zones):
+    """
+    (zone_servers, missing, unexpected) comparing the registrar's nameservers
+    with the hosted zone's delegation set, or None when there is no public zone.
+    With several zones for one name, the closest match is used.
+    """
+    candidates = zones.get(record["name"])
+    if not candidates:
+        return None
+    current = set(record["nameservers"])
+    best = min(candidates, key=lambda servers: len(current.symmetric_difference(servers)))
+    return best, sorted(set(best) - current), sorted(current - set(best))
+
+
+def days_until(iso_date, now=None):
+    if not iso_date:
+        return None
+    expiry = datetime.strptime(iso_date, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return (expiry - now).total_seconds() / 86400
+
+
+# ---------------------------------------------------------------------------
+# Local state
+# ---------------------------------------------------------------------------
+
+class PortfolioStore:
+    """One row per domain in a SQLite table; lists are stored as JSON text."""
+
+    def __init__(self, path=STORE_PATH, max_age=DETAIL_MAX_AGE):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(SCHEMA)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def rows(self):
+        for row in self.db.execute("SELECT * FROM domains ORDER BY expiry, name"):
+            record = dict(row)
+            record["nameservers"] = json.loads(record["nameservers"])
+            record["status"] = json.loads(record["status"])
+            record["auto_renew"] = bool(record["auto_renew"]) if record["auto_renew"] is not None else None
+            record["transfer_lock"] = bool(record["transfer_lock"]) if record["transfer_lock"] is not None else None
+            yield record
+
+    def stale(self, summaries, now=None):
+        """Names from list_domains summaries whose stored details are missing, too old, or out of date."""
+        now = now or time.time()
+        stored = {row["name"]: row for row in self.db.execute("SELECT * FROM domains")}
+        names = []
+        for summary in summaries:
+            name = summary["DomainName"].lower()
+            row = stored.get(name)
+            if (row is None
+                    or now - row["fetched_at"] >= self.max_age
+                    or row["expiry"] != _iso(summary.get("Expiry"))
+                    or row["auto_renew"] != int(bool(summary.get("AutoRenew")))
+                    or row["transfer_lock"] != int(bool(summary.get("TransferLock")))):
+                names.append(name)
+        return names
+
+    def upsert(self, summary, detail, now=None):
+        name = summary["DomainName"].lower()
+        self.db.execute(
+            "INSERT OR REPLACE INTO domains"
+            " (name, expiry, auto_renew, transfer_lock, nameservers, status, registrar, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                name,
+                # Listing values, so stale() compares like with like
+                _iso(summary.get("Expiry")) or detail.get("expiry"),
+                int(bool(summary.get("AutoRenew"))),
+                int(bool(summary.get("TransferLock"))),
+                json.dumps(detail.get("nameservers", [])),
+                json.dumps(detail.get("status", [])),
+                detail.get("registrar"),
+                now or time.time(),
+            ),
+        )
+
+    def prune(self, names):
+        """Drop domains no longer in the account (transferred out or expired); returns the removed names."""
+        keep = {n.lower() for n in names}
+        gone = [row["name"] for row in self.db.execute("SELECT name FROM domains") if row["name"] not in keep]
+        self.db.executemany("DELETE FROM domains WHERE name = ?", [(n,) for n in gone])
+        return gone
@@ -0,0 +1,87 @@
+"""
+Local cache of Route 53 Domains TLD prices.
+
+The complete price list (every page of ListPrices) is fetched once and stored in
+build/cache/route53-prices.json with a timestamp. Until it is older than the TTL,
+lookups are dict hits and no price API calls are made.
+
+  from domain_prices import load_price_table, price_for
+  table = load_price_table(client)                  # cached, fetched only when stale
+  amount, currency = price_for(table, "com")        # registration
+  amount, currency = price_for(table, "net", "renewal")
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_PATH = REPO_ROOT / "build" / "cache" / "route53-prices.json"
+PRICE_TTL = 24 * 60 * 60
+PRICE_KINDS = {
+    "registration": "RegistrationPrice",
+    "renewal": "RenewalPrice",
+    "transfer": "TransferPrice",
+}
+
+
+def fetch_price_table(client):
+    """{tld: {kind: [price, currency]}} for every TLD Route 53 sells, following all pages."""
+    table = {}
+    for page in client.get_paginator("list_prices").paginate():
+        for entry in page.get("Prices", []):
+            prices = {}
+            for kind, field in PRICE_KINDS.items():
+                price = entry.get(field)
+                if price and "Price" in price:
+                    prices[kind] = [price["Price"], price.get("Currency", "USD")]
+            table[entry["Name"].lower().lstrip(".")] = prices
+    return table
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_price_table(client=None, ttl=PRICE_TTL, refresh=False, path=CACHE_PATH):
+    """
+    Price table from the cache, refreshed from the API when it is missing,
+    older than `ttl` seconds or `refresh` is set. If the API call fails (service
+    error, no credentials, unreachable endpoint) a stale cache is still
+    returned; with neither, the result is {}.
+    """
+    cached = _read_cache(path)
+    fresh = cached is not None and time.time() - cached.get("fetched_at", 0) < ttl
+    if fresh and not refresh:
+        return cached["prices"]
+    if client is None:
+        return cached["prices"] if cached else {}
+
+    try:
+        table = fetch_price_table(client)
+    except (ClientError, BotoCoreError):
+        return cached["prices"] if cached else {}
+
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text(json.dumps({"fetched_at": time.time(), "prices": table}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return table
+
+
+def price_for(table, tld, kind="registration"):
+    """(amount, currency) for a TLD ("com", ".com" or a full domain), or (None, None)."""
+    tld = tld.lower().rsplit(".", 1)[-1]
+    price = table.get(tld, {}).get(kind)
+    return (price[0], price[1]) if price else (None, None)
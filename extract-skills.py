@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Extract normalized job titles and skills from resumes or job postings using the
+shared dictionary (frontend/src/data/skills-dictionary.json) compiled by
+skill_dictionary.py.
+
+Run from repo root:
+  python3 extract-skills.py                          # resume.md
+  python3 extract-skills.py resume.docx posting.txt --json
+  python3 extract-skills.py --jobs postings.jsonl    # totals across a JD corpus
+  python3 extract-skills.py --frontend               # write the browser dictionary
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from job_text import MD_PATH, load_jobs, resume_text
+from skill_dictionary import DICT_PATH, FRONTEND_PATH, frontend_dictionary, load_automaton, load_dictionary
+
+
+def _text_of(path):
+    if path.suffix.lower() in (".md", ".docx"):
+        return resume_text(path)
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def write_frontend(dict_path, out_path):
+    dictionary, digest = load_dictionary(dict_path)
+    compact = frontend_dictionary(dictionary, digest)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(compact, separators=(",", ":"), ensure_ascii=False) + "\n", encoding="utf-8")
+    return compact
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("files", nargs="*", help="Resumes (.md/.docx) or plain-text postings (default: resume.md)")
+    ap.add_argument("--jobs", help="Summarize a JD corpus (directory, .jsonl or .json)")
+    ap.add_argument("--dictionary", default=str(DICT_PATH), help="Skills dictionary JSON")
+    ap.add_argument("--top", type=int, default=15, help="Entries to show per kind")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON")
+    ap.add_argument("--frontend", nargs="?", const=str(FRONTEND_PATH), metavar="PATH",
+                    help=f"Write the compact browser dictionary (default: {FRONTEND_PATH.relative_to(FRONTEND_PATH.parents[2])})")
+    args = ap.parse_args()
+
+    dict_path = Path(args.dictionary)
+    if not dict_path.exists():
+        print(f"❌ Dictionary not found: {dict_path}")
+        sys.exit(1)
+
+    if args.frontend:
+        out = Path(args.frontend)
+        compact = write_frontend(dict_path, out)
+        aliases = len(compact["tAliases"]) + len(compact["sAliases"])
+        print(f"📄 Saved: {out} ({out.stat().st_size:,} bytes, {aliases:,} aliases, version {compact['version']})")
+        if not args.files and not args.jobs:
+            return
+
+    t0 = time.perf_counter()
+    automaton = load_automaton(dict_path)
+    t1 = time.perf_counter()
+
+    results = {}
+    if args.jobs:
+        titles, skills = Counter(), Counter()
+        jobs = load_jobs(args.jobs)
+        for job in jobs:
+            signals = automaton.extract(job.title + "\n" + job.text)
+            # Count postings that mention each entry, not raw occurrences
+            titles.update(name for name, _ in signals.titles)
+            skills.update(name for name, _ in signals.skills)
+        results[f"{args.jobs} ({len(jobs):,} postings)"] = {
+            "titles": titles.most_common(args.top), "skills": skills.most_common(args.top),
+        }
+    for path in [Path(p) for p in args.files] or ([] if args.jobs else [MD_PATH]):
+        if not path.exists():
+            print(f"❌ File not found: {path}")
+            sys.exit(1)
+        signals = automaton.extract(_text_of(path))
+        results[str(path)] = {"titles": signals.titles[:args.top], "skills": signals.skills[:args.top]}
+    t2 = time.perf_counter()
+
+    if args.json:
+        print(json.dumps({k: {kind: dict(v) for kind, v in r.items()} for k, r in results.items()}, indent=2))
+        return
+
+    print(f"Dictionary: {len(automaton.entries):,} entries, {len(automaton.goto):,} states "
+          f"(loaded in {(t1 - t0) * 1000:.1f} ms); extraction {(t2 - t1) * 1000:.1f} ms")
+    for source, found in results.items():
+        print("")
+        print(f"📄 {source}")
+        for kind in ("titles", "skills"):
+            listed = ", ".join(f"{name} ({n})" if n > 1 else name for name, n in found[kind]) or "—"
+            print(f"   {kind.capitalize():7}: {listed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Explore domain name combinations for a seed phrase and check only the ones that
+could be available.
+
+Pipeline (cheapest first):
+  1. expand the seed into hyphenation / word-order / affix / TLD combinations
+  2. drop names that break DNS rules or exceed --max-length
+  3. drop names in the negative cache (known taken, build/cache/domains-taken.json)
+  4. drop names in the Bloom filter of a large known-taken list (--taken-list)
+  5. check the best-ranked survivors with Route 53 (concurrent, rate limited),
+     up to --limit calls; taken results (UNAVAILABLE*, RESERVED) go into the
+     negative cache, DONT_KNOW and errors are checked again next run
+
+Usage:
+  python3 find-domain-candidates.py "ffj consulting"
+  python3 find-domain-candidates.py "ffj consulting" --tlds com,net,ai --limit 50
+  python3 find-domain-candidates.py "ffj consulting" --dry-run        # no API calls
+  python3 find-domain-candidates.py "ffj consulting" --taken-list top-domains.txt
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from domain_candidates import (
+    BLOOM_PATH, DEFAULT_MAX_LABEL, DEFAULT_PREFIXES, DEFAULT_SUFFIXES, DEFAULT_TLDS,
+    BloomFilter, NegativeCache, expand, is_taken, rank, valid_name,
+)
+
+PROFILE = "my-sso"
+DEFAULT_LIMIT = 100
+
+
+def _csv(value, default):
+    return tuple(v.strip().lstrip(".") for v in value.split(",") if v.strip()) if value is not None else default
+
+
+def load_bloom(args):
+    """Bloom filter from --taken-list (rebuilt and saved), else the saved one, else None."""
+    if args.taken_list:
+        start = time.perf_counter()
+        bloom = BloomFilter.from_file(args.taken_list)
+        bloom.save(BLOOM_PATH)
+        print(f"ℹ️  Bloom filter built from {args.taken_list} in {time.perf_counter() - start:.1f}s "
+              f"({len(bloom.data) / 1024:,.0f} KB)")
+        return bloom
+    if BLOOM_PATH.exists():
+        return BloomFilter.load(BLOOM_PATH)
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("seed", help='Seed phrase, e.g. "ffj consulting"')
+    ap.add_argument("--tlds", help=f"Comma-separated TLDs (default: {','.join(DEFAULT_TLDS)})")
+    ap.add_argument("--prefixes", help="Comma-separated prefixes ('' for none)")
+    ap.add_argument("--suffixes", help="Comma-separated suffixes ('' for none)")
+    ap.add_argument("--max-length", type=int, default=DEFAULT_MAX_LABEL, help="Longest label to consider")
+    ap.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Max availability API calls")
+    ap.add_argument("--taken-list", help="Text file of known-registered domains to load into the Bloom filter")
+    ap.add_argument("--dry-run", action="store_true", help="Show what would be checked; no API calls")
+    args = ap.parse_args()
+
+    tlds = _csv(args.tlds, DEFAULT_TLDS)
+    prefixes = _csv(args.prefixes, DEFAULT_PREFIXES)
+    suffixes = _csv(args.suffixes, DEFAULT_SUFFIXES)
+    if args.taken_list and not Path(args.taken_list).exists():
+        print(f"❌ File not found: {args.taken_list}")
+        sys.exit(1)
+
+    print("=" * 70)
+    print(f"Domain candidates for \"{args.seed}\"")
+    print("=" * 70)
+
+    negative = NegativeCache()
+    bloom = load_bloom(args)
+    generated = invalid = cached = bloomed = 0
+    survivors = []
+    for domain in expand(args.seed, tlds, prefixes, suffixes):
+        generated += 1
+        if not valid_name(domain, args.max_length):
+            invalid += 1
+        elif domain in negative:
+            cached += 1
+        elif bloom is not None and domain in bloom:
+            bloomed += 1
+        else:
+            survivors.append(domain)
+    survivors.sort(key=rank)
+    to_check = survivors[:args.limit]
+
+    print(f"Generated      : {generated:,}")
+    print(f"Invalid / long : {invalid:,}")
+    print(f"Known taken    : {cached:,} (negative cache)")
+    print(f"Bloom filter   : {bloomed:,}" + ("" if bloom is not None else " (no list loaded)"))
+    print(f"To check       : {len(to_check):,} of {len(survivors):,} survivors (limit {args.limit})")
+    print("")
+
+    if args.dry_run:
+        for domain in to_check:
+            print(f"  {domain}")
+        return
+
+    # AWS modules are only needed once something is actually checked
+    import boto3
+    from domain_availability import check_domains, make_client
+    from domain_prices import load_price_table, price_for
+
+    try:
+        session = boto3.Session(profile_name=PROFILE)
+        client = make_client(session)
+    except Exception as e:
+        print(f"❌ Error connecting to AWS: {e}")
+        sys.exit(1)
+    prices = load_price_table(client)
+
+    available = []
+    rejected = []
+    unknown = []
+    start = time.perf_counter()
+    try:
+        for domain, availability in check_domains(client, to_check):
+            if availability == "AVAILABLE":
+                available.append(domain)
+                amount, currency = price_for(prices, domain)
+                price = f"{currency} {amount}/year" if amount is not None else "price unknown"
+                print(f"✅ {domain:40} {price}")
+            elif is_taken(availability):
+                negative.add(domain, availability)
+            elif availability == "INVALID":
+                rejected.append(domain)
+                print(f"⚠️  {domain:40} rejected by Route 53 (INVALID)")
+            else:
+                unknown.append(domain)
+                print(f"❓ {domain:40} {availability} (checked again next run)")
+    finally:
+        negative.save()
+
+    print("")
+    print(f"Checked {len(to_check)} names in {time.perf_counter() - start:.1f}s; "
+          f"{len(available)} available, {len(rejected)} invalid, {len(unknown)} undetermined; "
+          f"negative cache now {len(negative.entries):,} names")
+    if available:
+        print("")
+        print("Best options:")
+        for domain in sorted(available, key=rank)[:10]:
+            print(f"  • {domain}")
+
+
+if __name__ == "__main__":
+    main()
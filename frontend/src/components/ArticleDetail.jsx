@@ -1,14 +1,15 @@
 import { useState, useEffect } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
-import ReactMarkdown from 'react-markdown'
 import articlesData from '../data/articles.json'
+import { loadArticle } from '../contentBundle'
 import './ArticleDetail.css'
 
 function ArticleDetail() {
   const { articleId } = useParams()
   const navigate = useNavigate()
   const [article, setArticle] = useState(null)
-  const [content, setContent] = useState('')
+  const [compiled, setCompiled] = useState(null)
+  const [message, setMessage] = useState('')
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
@@ -19,51 +20,37 @@ function ArticleDetail() {
       if (foundArticle) break
     }
 
-    if (foundArticle) {
-      setArticle(foundArticle)
-      // Load markdown content
-      loadContent(foundArticle.contentFile)
-    } else {
+    setArticle(foundArticle)
+    setCompiled(null)
+    setMessage('')
+    if (!foundArticle) {
       setLoading(false)
+      return
     }
-  }, [articleId])
 
-  const loadContent = async (contentFile) => {
-    try {
-      // Try loading from public folder first (for production)
-      let response = await fetch(`/content/${contentFile}`)
-      
-      // If not found, try src path (for development)
-      if (!response.ok) {
-        response = await fetch(`/src/content/${contentFile}`)
-      }
-      
-      // If still not found, try importing directly (extension .md must be static for Vite)
-      if (!response.ok) {
-        try {
-          const baseName = contentFile.replace(/\.md$/, '')
-          const module = await import(`../content/${baseName}.md?raw`)
-          setContent(module.default)
-          setLoading(false)
-          return
-        } catch (importError) {
-          console.error('Import error:', importError)
+    // One fetch of the precompiled article (see build-content-bundle.py)
+    let cancelled = false
+    setLoading(true)
+    loadArticle(articleId)
+      .then((entry) => {
+        if (cancelled) return
+        if (entry) {
+          setCompiled(entry)
+        } else {
+          setMessage('This article is still being written. Check back soon.')
         }
-      }
-      
-      if (response.ok) {
-        const text = await response.text()
-        setContent(text)
-      } else {
-        setContent('# Article Content\n\nContent file not found. Please add the content file.')
-      }
-    } catch (error) {
-      console.error('Error loading content:', error)
-      setContent('# Article Content\n\nError loading content.')
-    } finally {
-      setLoading(false)
+      })
+      .catch((error) => {
+        console.error('Error loading content:', error)
+        if (!cancelled) setMessage('Error loading content.')
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false)
+      })
+    return () => {
+      cancelled = true
     }
-  }
+  }, [articleId])
 
   if (loading) {
     return <div className="article-detail-loading">Loading...</div>
@@ -94,6 +81,11 @@ function ArticleDetail() {
               <span className="article-author">By {article.author}</span>
               <span className="article-date">{new Date(article.date).toLocaleDateString()}</span>
               <span className={`article-status ${article.status}`}>{article.status}</span>
+              {compiled && (
+                <span className="article-reading-time">
+                  {compiled.readingMinutes} min read · {compiled.words.toLocaleString()} words
+                </span>
+              )}
             </div>
             <div className="article-tags">
               {article.tags.map(tag => (
@@ -105,9 +97,26 @@ function ArticleDetail() {
             )}
           </header>
 
-          <div className="article-body">
-            <ReactMarkdown>{content}</ReactMarkdown>
-          </div>
+          {compiled && compiled.toc.length > 1 && (
+            <nav className="article-toc" aria-label="Table of contents">
+              <ul>
+                {compiled.toc.map((item) => (
+                  <li key={item.id} className={`article-toc-level-${item.level}`}>
+                    <a href={`#${item.id}`}>{item.title}</a>
+                  </li>
+                ))}
+              </ul>
+            </nav>
+          )}
+
+          {compiled ? (
+            // HTML is rendered at build time from our own markdown files
+            <div className="article-body" dangerouslySetInnerHTML={{ __html: compiled.html }} />
+          ) : (
+            <div className="article-body">
+              <p>{message}</p>
+            </div>
+          )}
         </article>
       </div>
     </div>
@@ -1,8 +1,63 @@
+import { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
 import articlesData from '../data/articles.json'
+import { searchSite } from '../search'
 import './Articles.css'
 
+function SearchResultLink({ result }) {
+  const body = (
+    <div>
+      <h4 className="article-title">{result.title}</h4>
+      {result.snippet && <p className="article-excerpt">{result.snippet}</p>}
+    </div>
+  )
+  // In-app routes go through the router; anchors and raw content files are plain links
+  if (result.url.startsWith('/') && !result.url.startsWith('/#') && !result.url.startsWith('/content/')) {
+    return (
+      <Link to={result.url} className="article-item">
+        {body}
+        <span className="article-status">{result.kind}</span>
+      </Link>
+    )
+  }
+  return (
+    <a href={result.url} className="article-item">
+      {body}
+      <span className="article-status">{result.kind}</span>
+    </a>
+  )
+}
+
 function Articles() {
+  const [query, setQuery] = useState('')
+  const [results, setResults] = useState([])
+  const [searchError, setSearchError] = useState('')
+
+  useEffect(() => {
+    if (query.trim() === '') {
+      setResults([])
+      setSearchError('')
+      return
+    }
+    let cancelled = false
+    const timer = setTimeout(() => {
+      searchSite(query)
+        .then((found) => {
+          if (!cancelled) {
+            setResults(found)
+            setSearchError('')
+          }
+        })
+        .catch(() => {
+          if (!cancelled) setSearchError('Search is not available right now.')
+        })
+    }, 150)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [query])
+
   return (
     <section id="articles" className="articles">
       <div className="section-container">
@@ -13,6 +68,28 @@ function Articles() {
           </p>
         </div>
 
+        <div className="articles-search">
+          <input
+            type="search"
+            value={query}
+            onChange={(e) => setQuery(e.target.value)}
+            placeholder="Search articles, tools, technologies and the resume…"
+            aria-label="Search site content"
+          />
+        </div>
+
+        {query.trim() !== '' && (
+          <div className="articles-search-results" aria-live="polite">
+            {searchError && <p className="category-description">{searchError}</p>}
+            {!searchError && results.length === 0 && <p className="category-description">No matches.</p>}
+            <div className="articles-list">
+              {results.map((result) => (
+                <SearchResultLink key={result.url + result.title} result={result} />
+              ))}
+            </div>
+          </div>
+        )}
+
         <div className="articles-grid">
           {articlesData.categories.map((category) => (
             <div key={category.id} className="article-category">
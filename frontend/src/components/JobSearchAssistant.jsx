@@ -1,4 +1,4 @@
-import { useMemo, useRef, useState } from 'react'
+import { useEffect, useMemo, useRef, useState } from 'react'
 import { useNavigate } from 'react-router-dom'
 import Navigation from './Navigation'
 import Footer from './Footer'
@@ -45,7 +45,58 @@ function buildLinkedInSearchUrl({ keywords, location, easyApply, remoteOnly }) {
   return qs ? `${base}?${qs}` : base
 }
 
-function extractSignals(resumeText) {
+// Generated by `python3 extract-skills.py --frontend` from src/data/skills-dictionary.json.
+// Loaded lazily; the inline lists below are used until it arrives (or if it fails to load).
+const SKILLS_DICTIONARY_URL = '/data/skills-dictionary.json'
+
+// Alias maps become Maps so words like "constructor" never hit Object.prototype
+function loadSkillsDictionary() {
+  return fetch(SKILLS_DICTIONARY_URL)
+    .then((response) => (response.ok ? response.json() : null))
+    .then((data) => data && {
+      ...data,
+      tAliases: new Map(Object.entries(data.tAliases)),
+      sAliases: new Map(Object.entries(data.sAliases)),
+    })
+    .catch(() => null)
+}
+
+// Longest-match scan over word n-grams: one lookup per (position, length), so the
+// cost does not grow with the dictionary size.
+function matchAliases(words, aliases, names, maxWords) {
+  const counts = new Map()
+  let i = 0
+  while (i < words.length) {
+    let step = 1
+    for (let n = Math.min(maxWords, words.length - i); n >= 1; n--) {
+      const index = aliases.get(words.slice(i, i + n).join(' '))
+      if (index !== undefined) {
+        const name = names[index]
+        counts.set(name, (counts.get(name) || 0) + 1)
+        step = n
+        break
+      }
+    }
+    i += step
+  }
+  // Most frequent first; Map preserves first-seen order for ties
+  return Array.from(counts.keys()).sort((a, b) => counts.get(b) - counts.get(a))
+}
+
+function extractSignalsWithDictionary(resumeText, dictionary) {
+  const words = normalizeText(resumeText)
+    .split(/[\s,;:()!?"]+/)
+    .map((w) => w.replace(/[.]+$/, ''))
+    .filter(Boolean)
+
+  const titlesFound = matchAliases(words, dictionary.tAliases, dictionary.titles, dictionary.maxWords)
+  const skillsFound = matchAliases(words, dictionary.sAliases, dictionary.skills, dictionary.maxWords)
+  return { topTitles: titlesFound.slice(0, 3), topSkills: skillsFound.slice(0, 8) }
+}
+
+function extractSignals(resumeText, dictionary) {
+  if (dictionary) return extractSignalsWithDictionary(resumeText, dictionary)
+
   const t = normalizeText(resumeText)
 
   const titleCandidates = [
@@ -117,7 +168,19 @@ function JobSearchAssistant() {
   const [preferredTitle, setPreferredTitle] = useState('')
   const [actionStatus, setActionStatus] = useState('')
 
-  const signals = useMemo(() => extractSignals(resumeText), [resumeText])
+  const [skillsDictionary, setSkillsDictionary] = useState(null)
+  const dictionaryRequested = useRef(false)
+
+  useEffect(() => {
+    // Only fetch the dictionary once the user has typed something to analyze
+    if (dictionaryRequested.current || resumeText.trim() === '') return
+    dictionaryRequested.current = true
+    loadSkillsDictionary().then((dictionary) => {
+      if (dictionary) setSkillsDictionary(dictionary)
+    })
+  }, [resumeText])
+
+  const signals = useMemo(() => extractSignals(resumeText, skillsDictionary), [resumeText, skillsDictionary])
 
   const hasCriteria = useMemo(() => {
     // Start with no results until the user provides either a title or resume text.
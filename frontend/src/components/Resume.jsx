@@ -1,45 +1,29 @@
 import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import ReactMarkdown from 'react-markdown'
 import Navigation from './Navigation'
 import Footer from './Footer'
 import { SITE_URL, GITHUB_REPO, getFullUrl } from '../config'
+import { loadPage } from '../contentBundle'
 import './Resume.css'
 
 function Resume() {
   const navigate = useNavigate()
-  // Resume content will be loaded from markdown file
-  const [resumeContent, setResumeContent] = useState('')
+  // Resume HTML is compiled from resume.md by build-content-bundle.py
+  const [resumeHtml, setResumeHtml] = useState('')
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
-    loadResume()
+    loadPage('resume')
+      .then((page) => {
+        setResumeHtml(page ? page.html : '<h1>Resume</h1><p>Resume content will be loaded here.</p>')
+      })
+      .catch((error) => {
+        console.error('Error loading resume:', error)
+        setResumeHtml('<h1>Resume</h1><p>Error loading resume content.</p>')
+      })
+      .finally(() => setLoading(false))
   }, [])
 
-  const loadResume = async () => {
-    try {
-      // Try loading from public folder first (for production)
-      let response = await fetch('/content/resume.md')
-      
-      // If not found, try src path (for development)
-      if (!response.ok) {
-        response = await fetch('/src/content/resume.md')
-      }
-      
-      if (response.ok) {
-        const text = await response.text()
-        setResumeContent(text)
-      } else {
-        setResumeContent('# Resume\n\nResume content will be loaded here.')
-      }
-    } catch (error) {
-      console.error('Error loading resume:', error)
-      setResumeContent('# Resume\n\nError loading resume content.')
-    } finally {
-      setLoading(false)
-    }
-  }
-
   if (loading) {
     return <div className="resume-loading">Loading resume...</div>
   }
@@ -57,9 +41,7 @@ function Resume() {
           <p className="resume-subtitle">Professional Experience & Expertise</p>
         </header>
         
-        <div className="resume-content">
-          <ReactMarkdown>{resumeContent}</ReactMarkdown>
-        </div>
+        <div className="resume-content" dangerouslySetInnerHTML={{ __html: resumeHtml }} />
         
         <div className="resume-links">
           <h3>Additional Resources</h3>
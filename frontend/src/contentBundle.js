@@ -0,0 +1,54 @@
+// Client for the compiled content written by build-content-bundle.py into /content-bundle/.
+// The manifest is revalidated once per session; every other file name is a content
+// hash, so an article or page costs a single fetch that the browser can cache for good.
+
+const BUNDLE_BASE = '/content-bundle/'
+
+let manifestPromise = null
+const filePromises = new Map()
+
+function fetchJson(name, options) {
+  return fetch(BUNDLE_BASE + name, options).then((response) => {
+    if (!response.ok) throw new Error(`${name}: ${response.status}`)
+    return response.json()
+  })
+}
+
+function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson('manifest.json', { cache: 'no-cache' })
+    manifestPromise.catch(() => {
+      manifestPromise = null
+    })
+  }
+  return manifestPromise
+}
+
+function loadFile(name) {
+  if (!filePromises.has(name)) {
+    const promise = fetchJson(name)
+    promise.catch(() => filePromises.delete(name))
+    filePromises.set(name, promise)
+  }
+  return filePromises.get(name)
+}
+
+async function loadEntry(section, id) {
+  const manifest = await loadManifest()
+  const name = manifest[section][id]
+  return name ? loadFile(name) : null
+}
+
+// Resolves to {id, title, html, toc, words, readingMinutes, ...}, or null for drafts
+// and unknown ids (they are not compiled into the bundle).
+export function loadArticle(articleId) {
+  return loadEntry('articles', articleId)
+}
+
+export function loadCategory(categoryId) {
+  return loadEntry('categories', categoryId)
+}
+
+export function loadPage(pageName) {
+  return loadEntry('pages', pageName)
+}
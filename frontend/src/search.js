@@ -0,0 +1,102 @@
+// Client for the static search index written by build-search-index.py into /search/.
+// Only the manifest is fetched up front; docs and shards are fetched on demand and
+// cached for the session (their file names are content hashes, so the browser and
+// CloudFront can cache them indefinitely).
+
+const SEARCH_BASE = '/search/'
+
+// Must match TOKEN_RE / STOPWORDS in build-search-index.py
+const STOPWORDS = new Set(
+  ('a an and are as at be but by for from has have how in is it its of on or that the this to was ' +
+    'were what when where which who will with you your').split(' ')
+)
+
+let manifestPromise = null
+const filePromises = new Map()
+
+function fetchJson(name) {
+  if (!filePromises.has(name)) {
+    const promise = fetch(SEARCH_BASE + name).then((response) => {
+      if (!response.ok) throw new Error(`${name}: ${response.status}`)
+      return response.json()
+    })
+    // Allow a retry later if the request failed
+    promise.catch(() => filePromises.delete(name))
+    filePromises.set(name, promise)
+  }
+  return filePromises.get(name)
+}
+
+function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetch(SEARCH_BASE + 'manifest.json', { cache: 'no-cache' }).then((response) => {
+      if (!response.ok) throw new Error(`manifest.json: ${response.status}`)
+      return response.json()
+    })
+    manifestPromise.catch(() => {
+      manifestPromise = null
+    })
+  }
+  return manifestPromise
+}
+
+export function tokenize(text) {
+  return ((text || '').toLowerCase().match(/[a-z0-9]+/g) || []).filter((t) => !STOPWORDS.has(t))
+}
+
+// Shard files that can hold terms starting with `prefix`
+function shardsFor(manifest, prefix) {
+  const keys = Object.keys(manifest.shards)
+  const exact = manifest.shards[prefix.slice(0, 2)] || manifest.shards[prefix[0]]
+  if (exact) return [exact]
+  // One-character prefix whose letter was split into two-character shards
+  return keys.filter((key) => key.startsWith(prefix)).map((key) => manifest.shards[key])
+}
+
+/**
+ * Search the site. Every query word must match; the last word also matches as a
+ * prefix so results update while typing. Resolves to [{title, url, kind, snippet, score}].
+ */
+export async function searchSite(query, limit = 10) {
+  const terms = tokenize(query)
+  if (terms.length === 0) return []
+
+  const manifest = await loadManifest()
+  const shardNames = new Set(terms.flatMap((term) => shardsFor(manifest, term)))
+  const [docs, ...shards] = await Promise.all([manifest.docs, ...shardNames].map(fetchJson))
+  // A Map, so query words like "constructor" cannot resolve to Object.prototype members
+  const postingsByTerm = new Map(shards.flatMap((shard) => Object.entries(shard)))
+
+  let scores = null
+  terms.forEach((term, i) => {
+    const isLast = i === terms.length - 1
+    const matching = isLast
+      ? Array.from(postingsByTerm.keys()).filter((t) => t.startsWith(term))
+      : postingsByTerm.has(term)
+        ? [term]
+        : []
+    const termScores = new Map()
+    for (const t of matching) {
+      const postings = postingsByTerm.get(t)
+      // Exact matches rank above prefix completions
+      const factor = t === term ? 1 : 0.5
+      for (let p = 0; p < postings.length; p += 2) {
+        termScores.set(postings[p], (termScores.get(postings[p]) || 0) + postings[p + 1] * factor)
+      }
+    }
+    if (scores === null) {
+      scores = termScores
+    } else {
+      const next = new Map()
+      for (const [doc, score] of scores) {
+        if (termScores.has(doc)) next.set(doc, score + termScores.get(doc))
+      }
+      scores = next
+    }
+  })
+
+  return Array.from(scores.entries())
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, limit)
+    .map(([doc, score]) => ({ title: docs[doc].t, url: docs[doc].u, kind: docs[doc].k, snippet: docs[doc].s, score }))
+}
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Generate many tailored resume .docx variants from one base template.
+
+The base .docx is read once; its parts are kept in memory as raw bytes and
+word/document.xml is parsed once per worker process into a pristine tree. Each
+variant deep-copies that tree (a cheap in-memory clone), applies its edits and
+writes a new zip from the cached parts, so no variant re-reads the template.
+
+A variant can:
+  - drop bullets by tag (tags are text patterns defined once in the spec)
+  - keep only the tagged bullets it asks for (untagged text is always kept)
+  - reorder sections by heading text
+  - replace text (like fix-resume-date-docx.py)
+
+Spec file (JSON), see resume-variants.example.json:
+  {
+    "tags": {"healthcare": ["HIPAA", "CMS platforms"], ...},
+    "variants": [
+      {"name": "cloud", "exclude_tags": ["healthcare"],
+       "section_order": ["SUMMARY", "PROFESSIONAL EXPERIENCE", "KEY SKILLS"]}
+    ],
+    "matrix": {"exclude_tags": [[], ["healthcare"]], "section_order": [[...], [...]]}
+  }
+"matrix" (optional) adds one variant per combination of the listed values.
+
+Run from repo root:
+  python3 generate-resume-variants.py resume-variants.example.json [--template X.docx] [--out build/variants]
+"""
+
+import argparse
+import copy
+import itertools
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from lxml import etree
+except ImportError:
+    import subprocess
+    print("Installing lxml...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "lxml", "--user", "--quiet"])
+    from lxml import etree
+
+REPO_ROOT = Path(__file__).resolve().parent
+TEMPLATE_DOCX = REPO_ROOT / "Fred_Jabbari_Resume_Optimized_2026_with_Bedrock_BDAGood001_with_links.docx"
+OUT_DIR = REPO_ROOT / "build" / "variants"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W = f"{{{W_NS}}}"
+DOCUMENT_PART = "word/document.xml"
+BULLET_PREFIXES = ("•", "·", "▪", "◦", "‣")
+
+# Per-process template cache, filled by _init_worker()
+_TEMPLATE = {}
+
+
+def _normalize(text):
+    return " ".join(text.split()).lower()
+
+
+def _para_text(p):
+    return "".join(t.text or "" for t in p.iter(W + "t"))
+
+
+def load_template(path):
+    """Read every part of the .docx once. Returns {part name: bytes} in archive order."""
+    with zipfile.ZipFile(path) as zf:
+        return {info.filename: zf.read(info.filename) for info in zf.infolist()}
+
+
+def _init_worker(parts, spec):
+    """Parse the template once per worker and compile the tag patterns."""
+    _TEMPLATE["parts"] = parts
+    _TEMPLATE["root"] = etree.fromstring(parts[DOCUMENT_PART])
+    _TEMPLATE["tags"] = {
+        tag: re.compile("|".join(re.escape(p) for p in patterns), re.I)
+        for tag, patterns in spec.get("tags", {}).items()
+        if patterns
+    }
+
+
+def _tags_for(text, tag_patterns):
+    return {tag for tag, pattern in tag_patterns.items() if pattern.search(text)}
+
+
+def _is_bullet(p):
+    """List paragraph: numbered/bulleted (w:numPr), a List* style, or text typed with a bullet character."""
+    ppr = p.find(W + "pPr")
+    if ppr is not None:
+        if ppr.find(W + "numPr") is not None:
+            return True
+        style = ppr.find(W + "pStyle")
+        if style is not None and "list" in (style.get(W + "val") or "").lower():
+            return True
+    return _para_text(p).lstrip().startswith(BULLET_PREFIXES)
+
+
+def _filter_tagged(body, variant, tag_patterns):
+    """Drop tagged bullets; headings, the summary and skills lines are never removed."""
+    exclude = set(variant.get("exclude_tags", []))
+    include = variant.get("include_tags")
+    include = set(include) if include is not None else None
+    removed = 0
+    for p in list(body.iterchildren(W + "p")):
+        if not _is_bullet(p):
+            continue
+        tags = _tags_for(_para_text(p), tag_patterns)
+        if not tags:
+            continue
+        if tags & exclude or (include is not None and not tags & include):
+            body.remove(p)
+            removed += 1
+    return removed
+
+
+def _is_heading(p):
+    """Section heading: a Heading*/Title style, or a short all-caps line that is not a bullet."""
+    ppr = p.find(W + "pPr")
+    style = ppr.find(W + "pStyle") if ppr is not None else None
+    if style is not None and (style.get(W + "val") or "").lower().startswith(("heading", "title")):
+        return True
+    text = _para_text(p).strip()
+    return text.isupper() and len(text.split()) <= 6 and not _is_bullet(p)
+
+
+def _reorder_sections(body, order):
+    """
+    Put the sections named in `order` into that order; unlisted sections keep their place.
+
+    The body is split at every section heading; a section runs up to the next one.
+    The listed sections are placed, in the requested order, into the slots they
+    occupied in the template.
+    """
+    rank = {_normalize(name): i for i, name in enumerate(order)}
+    children = [el for el in body.iterchildren() if el.tag != W + "sectPr"]
+    starts = [i for i, el in enumerate(children) if el.tag == W + "p" and _is_heading(el)]
+    if not starts:
+        return
+    sections = [children[:starts[0]]]
+    for n, start in enumerate(starts):
+        stop = starts[n + 1] if n + 1 < len(starts) else len(children)
+        sections.append(children[start:stop])
+
+    def name(section):
+        return _normalize(_para_text(section[0]))
+
+    slots = [i for i in range(1, len(sections)) if name(sections[i]) in rank]
+    listed = sorted((sections[i] for i in slots), key=lambda section: rank[name(section)])
+    for i, section in zip(slots, listed):
+        sections[i] = section
+
+    sect_pr = body.find(W + "sectPr")
+    for el in children:
+        body.remove(el)
+    for el in (el for section in sections for el in section):
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
+
+
+def _replace_text(root, replacements):
+    """Replace text within single w:t nodes (runs split mid-phrase are left alone)."""
+    for t in root.iter(W + "t"):
+        if not t.text:
+            continue
+        for old, new in replacements.items():
+            if old in t.text:
+                t.text = t.text.replace(old, new)
+
+
+def build_variant(variant, out_dir):
+    """Clone the cached template, apply one variant and write it. Runs in a worker process."""
+    start = time.perf_counter()
+    root = copy.deepcopy(_TEMPLATE["root"])
+    body = root.find(W + "body")
+
+    removed = _filter_tagged(body, variant, _TEMPLATE["tags"])
+    if variant.get("section_order"):
+        _reorder_sections(body, variant["section_order"])
+    if variant.get("replace"):
+        _replace_text(root, variant["replace"])
+
+    document_xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+    out = Path(out_dir) / f"{variant['name']}.docx"
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in _TEMPLATE["parts"].items():
+            zf.writestr(name, document_xml if name == DOCUMENT_PART else data)
+    return variant["name"], str(out), removed, time.perf_counter() - start
+
+
+def expand_variants(spec):
+    """Explicit variants plus one per combination in the optional matrix."""
+    variants = list(spec.get("variants", []))
+    matrix = spec.get("matrix")
+    if matrix:
+        keys = sorted(matrix)
+        for n, values in enumerate(itertools.product(*(matrix[k] for k in keys)), 1):
+            variant = dict(zip(keys, values))
+            variant["name"] = f"{spec.get('matrix_prefix', 'variant')}-{n:03d}"
+            variants.append(variant)
+    seen = set()
+    for variant in variants:
+        name = re.sub(r"[^\w.-]+", "-", variant["name"]).strip("-")
+        if name in seen:
+            raise ValueError(f"Duplicate variant name: {name}")
+        seen.add(name)
+        variant["name"] = name
+    return variants
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("spec", help="Variant spec JSON")
+    ap.add_argument("--template", default=str(TEMPLATE_DOCX), help="Base resume .docx")
+    ap.add_argument("--out", default=str(OUT_DIR), help="Output directory")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    args = ap.parse_args()
+
+    print("=" * 60)
+    print("Generate tailored resume variants")
+    print("=" * 60)
+
+    template = Path(args.template)
+    if not template.exists():
+        print(f"❌ Template not found: {template}")
+        sys.exit(1)
+
+    spec = json.loads(Path(args.spec).read_text(encoding="utf-8"))
+    try:
+        variants = expand_variants(spec)
+    except (KeyError, ValueError) as e:
+        print(f"❌ Invalid spec: {e}")
+        sys.exit(1)
+    if not variants:
+        print("⚠️  Spec defines no variants; nothing to do.")
+        return
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    parts = load_template(template)
+    workers = max(1, min(args.workers, len(variants)))
+    print(f"Template: {template.name} ({len(parts)} parts), {len(variants)} variant(s), {workers} worker(s)")
+    print("")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parts, spec)) as pool:
+        futures = [pool.submit(build_variant, v, str(out_dir)) for v in variants]
+        for future in futures:
+            name, path, removed, secs = future.result()
+            print(f"✅ {name:30} {secs * 1000:7.1f} ms  (-{removed} tagged bullet(s))")
+
+    print("")
+    print(f"📄 {len(variants)} variant(s) written to {out_dir} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
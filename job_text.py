@@ -0,0 +1,91 @@
+"""
+Text helpers shared by the job-search scripts (match-resume-jobs.py and friends).
+
+  tokenize(text)     lower-case word tokens, tech-aware ("c#", ".net", "node.js",
+                     "ci/cd" -> "ci", "cd") with English stop words removed
+  load_jobs(path)    job postings from a directory of .txt/.md files, a .jsonl
+                     file or a .json list
+  resume_text(path)  plain text of a resume (.md via resume_markdown, .docx via
+                     extract_docx)
+"""
+
+import json
+import re
+from collections import namedtuple
+from pathlib import Path
+
+from resume_markdown import parse_resume
+
+REPO_ROOT = Path(__file__).resolve().parent
+MD_PATH = REPO_ROOT / "frontend" / "src" / "content" / "resume.md"
+
+# One job posting. text is the full description; the other fields are optional metadata.
+Job = namedtuple("Job", ["id", "title", "company", "url", "text"])
+
+# Words like "c#", "c++", ".net", "node.js", "full-stack", "s3"; inner "." / "-" only,
+# so sentence punctuation never sticks to a token
+TOKEN_RE = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each either
+etc few for from further had has have having he her here hers him his how i if in into is it
+its itself just may me might more most must my no nor not now of off on once only or other our
+ours out over own per same she should so some such than that the their theirs them then there
+these they this those through to too under until up upon us very via was we were what when
+where which while who whom why will with within without would you your yours
+""".split())
+
+TEXT_SUFFIXES = (".txt", ".md")
+
+
+def tokenize(text):
+    """Lower-case tokens of `text` with stop words removed."""
+    return [tok for tok in TOKEN_RE.findall(text.lower()) if tok not in STOPWORDS]
+
+
+def _job_from_dict(obj, default_id):
+    text = obj.get("text") or obj.get("description") or ""
+    return Job(
+        str(obj.get("id", default_id)),
+        obj.get("title", ""),
+        obj.get("company", ""),
+        obj.get("url", ""),
+        text,
+    )
+
+
+def load_jobs(path):
+    """
+    Load job postings.
+
+      directory  every *.txt / *.md file is one posting; its first line is the title
+      .jsonl     one object per line with "text" (or "description") and optional
+                 id / title / company / url
+      .json      a list of such objects
+    """
+    path = Path(path)
+    if path.is_dir():
+        jobs = []
+        for f in sorted(p for p in path.rglob("*") if p.suffix.lower() in TEXT_SUFFIXES):
+            text = f.read_text(encoding="utf-8", errors="replace")
+            title = text.strip().splitlines()[0].lstrip("# ").strip() if text.strip() else ""
+            jobs.append(Job(str(f.relative_to(path)), title, "", "", text))
+        return jobs
+    if path.suffix.lower() == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            return [_job_from_dict(json.loads(line), n) for n, line in enumerate(f) if line.strip()]
+    with open(path, encoding="utf-8") as f:
+        return [_job_from_dict(obj, n) for n, obj in enumerate(json.load(f))]
+
+
+def resume_text(path=MD_PATH):
+    """Visible text of a resume in markdown or Word format."""
+    path = Path(path)
+    if path.suffix.lower() == ".docx":
+        # Imported lazily: extract_docx needs python-docx, the markdown path does not.
+        from extract_docx import extract_docx_text
+        return extract_docx_text(path)
+    return "\n".join(
+        "".join(tok.text for tok in block.tokens) for block in parse_resume(path) if block.tokens
+    )
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Rank job descriptions against one or more resumes.
+
+The JD corpus and the resumes are tokenized with job_text.tokenize() and turned
+into sparse term-count matrices (SciPy CSR). Term weights are computed over
+whole matrices at once:
+
+  bm25   Okapi BM25 (k1, b) weights on the JD side, resume terms as the query
+  tfidf  L2-normalized TF-IDF on both sides, cosine similarity
+
+Every resume is scored against every JD with one sparse matrix product
+(JDs x terms) @ (terms x resumes). For each top-ranked JD the report lists the
+highest-weighted JD terms the resume does not contain.
+
+Run from repo root:
+  python3 match-resume-jobs.py --jobs jobs/                       # resume.md vs a folder of JDs
+  python3 match-resume-jobs.py --jobs postings.jsonl --resume a.md --resume b.docx --method tfidf
+  python3 match-resume-jobs.py --synthetic 10000                  # timing on generated postings
+  python3 match-resume-jobs.py --jobs jobs/ --json build/matches.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:
+    import subprocess
+    print("Installing numpy and scipy...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "scipy", "--user", "--quiet"])
+    import numpy as np
+    import scipy.sparse as sp
+
+from job_text import MD_PATH, Job, load_jobs, resume_text, tokenize
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFAULT_TOP = 10
+DEFAULT_MISSING = 8
+
+# Fitted JD corpus: term list, {term: column}, raw counts (JDs x terms), document frequency, idf
+Corpus = namedtuple("Corpus", ["terms", "vocab", "counts", "df", "idf"])
+
+
+# ---------------------------------------------------------------------------
+# Sparse matrices
+# ---------------------------------------------------------------------------
+
+def count_matrix(token_lists, vocab, grow=False):
+    """
+    CSR matrix of term counts, one row per token list.
+
+    With grow=True unseen terms are added to `vocab`; otherwise they are dropped.
+    """
+    cols = []
+    lengths = np.empty(len(token_lists), dtype=np.int64)
+    for n, tokens in enumerate(token_lists):
+        if grow:
+            ids = [vocab.setdefault(t, len(vocab)) for t in tokens]
+        else:
+            ids = [i for i in map(vocab.get, tokens) if i is not None]
+        cols.extend(ids)
+        lengths[n] = len(ids)
+    rows = np.repeat(np.arange(len(token_lists)), lengths)
+    data = np.ones(len(cols), dtype=np.float64)
+    # COO -> CSR sums the duplicate (row, term) entries into counts
+    return sp.csr_matrix(
+        (data, (rows, np.asarray(cols, dtype=np.int64))), shape=(len(token_lists), len(vocab))
+    )
+
+
+def fit(jd_tokens):
+    vocab = {}
+    counts = count_matrix(jd_tokens, vocab, grow=True)
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    n = counts.shape[0]
+    # BM25's idf, floored at a small positive value so very common terms never score negative
+    idf = np.maximum(np.log((n - df + 0.5) / (df + 0.5) + 1.0), 1e-6)
+    terms = [None] * len(vocab)
+    for term, col in vocab.items():
+        terms[col] = term
+    return Corpus(terms, vocab, counts, df, idf)
+
+
+def _row_values(matrix, per_row):
+    """Expand one value per row to one value per stored entry of a CSR matrix."""
+    return np.repeat(per_row, np.diff(matrix.indptr))
+
+
+def _l2_normalize(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    out = matrix.copy()
+    out.data /= _row_values(out, norms)
+    return out
+
+
+def bm25_weights(corpus, k1=BM25_K1, b=BM25_B):
+    counts = corpus.counts
+    doc_len = np.asarray(counts.sum(axis=1)).ravel()
+    avg_len = doc_len.mean() if len(doc_len) else 0.0
+    norm = k1 * (1 - b + b * doc_len / (avg_len or 1.0))
+    tf = counts.data
+    out = counts.copy()
+    out.data = tf * (k1 + 1) / (tf + _row_values(counts, norm)) * corpus.idf[counts.indices]
+    return out
+
+
+def tfidf_weights(counts, idf):
+    out = counts.copy()
+    out.data = (1 + np.log(out.data)) * idf[out.indices]
+    return _l2_normalize(out)
+
+
+def score(corpus, resume_counts, method="bm25"):
+    """
+    Scores of every JD against every resume as a dense (JDs x resumes) array,
+    plus the JD-side weight matrix used for the missing-term report.
+    """
+    if method == "bm25":
+        weights = bm25_weights(corpus)
+        query = resume_counts.copy()
+        query.data[:] = 1.0  # BM25 queries are term sets
+    else:
+        weights = tfidf_weights(corpus.counts, corpus.idf)
+        query = tfidf_weights(resume_counts, corpus.idf)
+    scores = (weights @ query.T).toarray()
+    return scores, weights
+
+
+def missing_terms(weights, resume_row, jd_indices, terms, k=DEFAULT_MISSING):
+    """For each JD index, the k highest-weighted JD terms absent from the resume."""
+    absent = np.ones(weights.shape[1], dtype=np.float64)
+    absent[resume_row.indices] = 0.0
+    subset = weights[jd_indices].multiply(absent).tocsr()
+    out = []
+    for r in range(subset.shape[0]):
+        start, end = subset.indptr[r], subset.indptr[r + 1]
+        data, cols = subset.data[start:end], subset.indices[start:end]
+        if len(data) > k:
+            pick = np.argpartition(-data, k)[:k]
+            data, cols = data[pick], cols[pick]
+        order = np.argsort(-data)
+        out.append([(terms[cols[i]], float(data[i])) for i in order if data[i] > 0])
+    return out
+
+
+def top_matches(scores, top):
+    """Indices of the `top` best JDs per resume (columns of `scores`), best first."""
+    top = min(top, scores.shape[0])
+    if top == 0:
+        return np.empty((0, scores.shape[1]), dtype=np.int64)
+    part = np.argpartition(-scores, top - 1, axis=0)[:top]
+    picked = np.take_along_axis(scores, part, axis=0)
+    return np.take_along_axis(part, np.argsort(-picked, axis=0), axis=0)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus for timing
+# ---------------------------------------------------------------------------
+
+SKILLS = (
+    "aws kubernetes eks ecs lambda terraform cloudformation cdk jenkins docker helm python java "
+    "c# .net react node.js typescript microservices oauth okta bedrock kafka spark airflow "
+    "postgresql dynamodb redis graphql grpc prometheus grafana datadog splunk ansible azure gcp "
+    "snowflake databricks pytorch tensorflow sagemaker langchain rag llm security compliance"
+).split()
+FILLER = (
+    "design build operate scalable reliable distributed systems teams partner stakeholders deliver "
+    "platform services customers production experience years strong ownership mentor engineers "
+    "architecture cloud infrastructure automation pipelines data models observability cost"
+).split()
+TITLES = ("Cloud Architect", "Platform Engineer", "DevOps Engineer", "Solutions Architect",
+          "Site Reliability Engineer", "Data Engineer", "ML Engineer", "Backend Engineer")
+
+
+def synthetic_jobs(n, seed=7):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        title = rng.choice(TITLES)
+        words = rng.choices(FILLER, k=300) + rng.sample(SKILLS, 12)
+        rng.shuffle(words)
+        jobs.append(Job(f"synthetic-{i}", title, f"Company {i % 500}", "", f"{title}\n" + " ".join(words)))
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", help="Directory of .txt/.md postings, or a .jsonl/.json file")
+    ap.add_argument("--synthetic", type=int, metavar="N", help="Use N generated postings instead of --jobs")
+    ap.add_argument("--resume", action="append", help="Resume .md or .docx (repeatable; default resume.md)")
+    ap.add_argument("--method", choices=("bm25", "tfidf"), default="bm25")
+    ap.add_argument("--top", type=int, default=DEFAULT_TOP, help="JDs to report per resume")
+    ap.add_argument("--missing", type=int, default=DEFAULT_MISSING, help="Missing terms to list per JD")
+    ap.add_argument("--json", help="Also write the ranking to this JSON file")
+    args = ap.parse_args()
+
+    if not args.jobs and not args.synthetic:
+        ap.error("pass --jobs PATH or --synthetic N")
+    resume_paths = [Path(p) for p in (args.resume or [MD_PATH])]
+    for path in resume_paths + ([Path(args.jobs)] if args.jobs else []):
+        if not path.exists():
+            print(f"❌ File not found: {path}")
+            sys.exit(1)
+
+    print("=" * 60)
+    print(f"Match resume(s) to job descriptions ({args.method})")
+    print("=" * 60)
+
+    t0 = time.perf_counter()
+    jobs = synthetic_jobs(args.synthetic) if args.synthetic else load_jobs(args.jobs)
+    if not jobs:
+        print("❌ No job postings found")
+        sys.exit(1)
+    corpus = fit([tokenize(job.text) for job in jobs])
+    resume_counts = count_matrix([tokenize(resume_text(p)) for p in resume_paths], corpus.vocab)
+    t1 = time.perf_counter()
+    scores, weights = score(corpus, resume_counts, args.method)
+    ranked = top_matches(scores, args.top)
+    t2 = time.perf_counter()
+
+    print(f"Postings : {len(jobs):,}   Vocabulary: {len(corpus.terms):,} terms")
+    print(f"Tokenize : {(t1 - t0) * 1000:,.0f} ms   Score: {(t2 - t1) * 1000:,.0f} ms "
+          f"({len(jobs) * len(resume_paths):,} pairs)")
+
+    report = []
+    for col, path in enumerate(resume_paths):
+        idx = ranked[:, col]
+        gaps = missing_terms(weights, resume_counts[col], idx, corpus.terms, args.missing)
+        print("")
+        print(f"📄 {path.name}")
+        matches = []
+        for rank, (j, gap) in enumerate(zip(idx, gaps), 1):
+            job = jobs[j]
+            label = " — ".join(x for x in (job.title, job.company) if x) or job.id
+            print(f"{rank:>3}. {scores[j, col]:8.3f}  {label}  [{job.id}]")
+            if gap:
+                print(f"       missing: {', '.join(term for term, _ in gap)}")
+            matches.append({
+                "id": job.id, "title": job.title, "company": job.company, "url": job.url,
+                "score": round(float(scores[j, col]), 4), "missing": [term for term, _ in gap],
+            })
+        report.append({"resume": str(path), "matches": matches})
+
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({"method": args.method, "results": report}, indent=2), encoding="utf-8")
+        print("")
+        print(f"📄 Saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Monitor every domain registered in Route 53 Domains.
+
+Lists all domains (every page), refreshes details only for domains that are new,
+changed or older than --max-age-hours, keeps them in build/cache/portfolio.sqlite3
+and flags:
+  - expirations within --expiry-days (critical when auto-renew is off)
+  - transfer lock disabled
+  - registrar nameservers that drift from the Route 53 hosted zone's delegation set
+
+Exits 1 when anything is flagged, so it can run from cron.
+
+Usage:
+  python3 monitor-domain-portfolio.py
+  python3 monitor-domain-portfolio.py --expiry-days 90 --refresh
+  python3 monitor-domain-portfolio.py --json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import boto3
+
+from domain_availability import make_client
+from domain_portfolio import (
+    DETAIL_MAX_AGE, EXPIRY_WARNING_DAYS, PortfolioStore, days_until, fetch_details, iter_domains,
+    nameserver_drift, zone_nameservers,
+)
+
+PROFILE = "my-sso"
+REGION = "us-east-1"
+
+
+def issues_for(record, zones, expiry_days):
+    """List of (level, message) for one stored domain; level is 'critical' or 'warning'."""
+    issues = []
+    days = days_until(record["expiry"])
+    if days is not None and days <= expiry_days:
+        if days < 0:
+            issues.append(("critical", f"expired {-days:.0f} days ago"))
+        elif not record["auto_renew"]:
+            issues.append(("critical", f"expires in {days:.0f} days and auto-renew is OFF"))
+        else:
+            issues.append(("warning", f"expires in {days:.0f} days (auto-renew on)"))
+    if not record["transfer_lock"]:
+        issues.append(("warning", "transfer lock is off"))
+    drift = nameserver_drift(record, zones)
+    if drift is not None:
+        _, missing, unexpected = drift
+        if missing or unexpected:
+            detail = []
+            if missing:
+                detail.append("missing " + ", ".join(missing))
+            if unexpected:
+                detail.append("unexpected " + ", ".join(unexpected))
+            issues.append(("critical", "nameservers differ from hosted zone: " + "; ".join(detail)))
+    return issues
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Route 53 domain portfolio monitor")
+    ap.add_argument("--max-age-hours", type=float, default=DETAIL_MAX_AGE / 3600,
+                    help="Re-fetch domain details older than this")
+    ap.add_argument("--refresh", action="store_true", help="Re-fetch details for every domain")
+    ap.add_argument("--expiry-days", type=int, default=EXPIRY_WARNING_DAYS, help="Flag expirations within N days")
+    ap.add_argument("--json", action="store_true", help="Print stored records and issues as JSON")
+    args = ap.parse_args()
+
+    try:
+        session = boto3.Session(profile_name=PROFILE)
+        domains_client = make_client(session)
+        route53 = session.client("route53", region_name=REGION)
+    except Exception as e:
+        print(f"❌ Error connecting to AWS: {e}")
+        sys.exit(1)
+
+    store = PortfolioStore(max_age=0 if args.refresh else args.max_age_hours * 3600)
+    start = time.perf_counter()
+    try:
+        summaries = {s["DomainName"].lower(): s for s in iter_domains(domains_client)}
+        removed = store.prune(summaries)
+        stale = store.stale(summaries.values())
+        errors = {}
+        for name, detail, error in fetch_details(domains_client, stale):
+            if error:
+                errors[name] = error
+            else:
+                store.upsert(summaries[name], detail)
+        zones = zone_nameservers(route53)
+        records = list(store.rows())
+    finally:
+        store.close()
+
+    report = {r["name"]: issues_for(r, zones, args.expiry_days) for r in records}
+    if args.json:
+        print(json.dumps({"domains": records, "issues": report, "errors": errors}, indent=2))
+        sys.exit(1 if any(report.values()) or errors else 0)
+
+    print("=" * 70)
+    print("Domain Portfolio")
+    print("=" * 70)
+    print(f"{len(summaries)} domains, {len(stale)} refreshed, {len(removed)} removed "
+          f"in {time.perf_counter() - start:.1f}s")
+    print("")
+    for record in records:
+        days = days_until(record["expiry"])
+        expiry = f"{record['expiry'][:10]} ({days:.0f}d)" if days is not None else "unknown"
+        renew = "auto-renew" if record["auto_renew"] else "manual"
+        print(f"{record['name']:36} {expiry:20} {renew}")
+        for level, message in report[record["name"]]:
+            print(f"   {'❌' if level == 'critical' else '⚠️ '} {message}")
+        if nameserver_drift(record, zones) is None:
+            print("   ℹ️  no public hosted zone in this account")
+    for name, error in errors.items():
+        print(f"❌ {name}: could not fetch details: {error}")
+    for name in removed:
+        print(f"ℹ️  {name} is no longer in this account")
+
+    flagged = sum(1 for issues in report.values() if issues)
+    print("")
+    if flagged or errors:
+        print(f"⚠️  {flagged} domains need attention")
+        sys.exit(1)
+    print("✅ All domains healthy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Nameserver delegation propagation across many resolvers.
+
+After a nameserver change, the new delegation reaches the TLD servers first and
+recursive resolvers as their cached NS records expire. Every round asks each
+target at once (asyncio, dnspython):
+
+  resolvers    recursive NS + SOA queries (public resolvers by default)
+  TLD servers  non-recursive NS query; the referral's authority section is
+               the delegation the registry publishes
+
+and compares the answer with the expected set (the hosted zone's delegation set):
+
+  MATCH     NS set equals the expected set
+  PARTIAL   overlaps it (mixed cache, or the registrar has only some of the servers)
+  OLD       no overlap: still the previous delegation
+  NXDOMAIN / ERROR / TIMEOUT
+
+watch() repeats rounds with a growing interval until every responding target
+matches or the deadline passes. Addresses accept "ip:port", so local stand-in
+resolvers can be used in tests.
+"""
+
+import asyncio
+import time
+from collections import namedtuple
+
+# dns_probe installs dnspython when it is missing
+from dns_probe import DEFAULT_TIMEOUT, parse_address
+
+import dns.asyncquery
+import dns.asyncresolver
+import dns.exception
+import dns.flags
+import dns.message
+import dns.name
+import dns.rcode
+import dns.rdatatype
+
+DEFAULT_RESOLVERS = {
+    "Google": "8.8.8.8",
+    "Google 2": "8.8.4.4",
+    "Cloudflare": "1.1.1.1",
+    "Cloudflare 2": "1.0.0.1",
+    "Quad9": "9.9.9.9",
+    "OpenDNS": "208.67.222.222",
+    "OpenDNS 2": "208.67.220.220",
+    "Level3": "4.2.2.1",
+    "AdGuard": "94.140.14.14",
+    "CleanBrowsing": "185.228.168.9",
+    "Yandex": "77.88.8.8",
+    "Comodo": "8.26.56.26",
+}
+POLL_INTERVAL = 30.0
+MAX_POLL_INTERVAL = 300.0
+POLL_BACKOFF = 1.5
+
+Target = namedtuple("Target", ["name", "address", "port", "kind"])          # kind: "resolver" | "tld"
+TargetResult = namedtuple("TargetResult", ["target", "status", "nameservers", "soa_serial", "elapsed"])
+Round = namedtuple("Round", ["number", "elapsed", "results", "matched", "responding", "percent"])
+
+
+def targets_from(addresses, kind="resolver"):
+    """Targets from {name: "ip[:port]"} or a list of "ip[:port]" strings."""
+    items = addresses.items() if isinstance(addresses, dict) else ((a, a) for a in addresses)
+    return [Target(name, *parse_address(address), kind) for name, address in items]
+
+
+async def tld_targets(domain, timeout=DEFAULT_TIMEOUT):
+    """The TLD's authoritative servers (IPv4), found through the system resolver."""
+    tld = dns.name.from_text(domain).parent()
+    resolver = dns.asyncresolver.Resolver()
+    resolver.lifetime = timeout
+    answer = await resolver.resolve(tld, "NS")
+    hosts = sorted(str(rdata.target) for rdata in answer)
+
+    async def address(host):
+        try:
+            return host, (await resolver.resolve(host, "A"))[0].address
+        except dns.exception.DNSException:
+            return host, None
+
+    found = await asyncio.gather(*(address(h) for h in hosts))
+    return [Target(host.rstrip("."), ip, 53, "tld") for host, ip in found if ip]
+
+
+async def _ask(target, domain, rdtype, timeout):
+    query = dns.message.make_query(domain, rdtype)
+    if target.kind == "tld":
+        query.flags &= ~dns.flags.RD
+    response = await dns.asyncquery.udp(query, target.address, timeout=timeout, port=target.port)
+    if response.flags & dns.flags.TC:
+        response = await dns.asyncquery.tcp(query, target.address, timeout=timeout, port=target.port)
+    return response
+
+
+def _nameservers(response, name):
+    servers = set()
+    for rrset in response.answer + response.authority:
+        if rrset.rdtype == dns.rdatatype.NS and rrset.name == name:
+            servers.update(str(rdata.target).rstrip(".").lower() for rdata in rrset)
+    return servers
+
+
+def _classify(servers, expected):
+    if servers == expected:
+        return "MATCH"
+    return "PARTIAL" if servers & expected else "OLD"
+
+
+async def check_target(target, domain, expected, timeout=DEFAULT_TIMEOUT):
+    """One target's view of the delegation (NS, plus SOA serial from recursive resolvers)."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    name = dns.name.from_text(domain)
+    kinds = ("NS", "SOA") if target.kind == "resolver" else ("NS",)
+    answers = await asyncio.gather(*(_ask(target, domain, k, timeout) for k in kinds), return_exceptions=True)
+    elapsed = loop.time() - start
+
+    ns_response = answers[0]
+    if isinstance(ns_response, dns.exception.Timeout):
+        return TargetResult(target, "TIMEOUT", [], None, elapsed)
+    if isinstance(ns_response, Exception):
+        return TargetResult(target, "ERROR", [], None, elapsed)
+    rcode = ns_response.rcode()
+    if rcode == dns.rcode.NXDOMAIN:
+        return TargetResult(target, "NXDOMAIN", [], None, elapsed)
+    if rcode != dns.rcode.NOERROR:
+        return TargetResult(target, "ERROR", [], None, elapsed)
+
+    serial = None
+    if len(answers) > 1 and isinstance(answers[1], dns.message.Message):
+        for rrset in answers[1].answer:
+            if rrset.rdtype == dns.rdatatype.SOA:
+                serial = rrset[0].serial
+    servers = _nameservers(ns_response, name)
+    status = _classify(servers, expected) if servers else "ERROR"
+    return TargetResult(target, status, sorted(servers), serial, elapsed)
+
+
+async def check_round(domain, expected, targets, timeout=DEFAULT_TIMEOUT, number=1, started=None):
+    """Query every target concurrently; returns a Round with the propagated percentage of responding targets."""
+    expected = {ns.rstrip(".").lower() for ns in expected}
+    started = started if started is not None else time.monotonic()
+    results = await asyncio.gather(*(check_target(t, domain, expected, timeout) for t in targets))
+    responding = [r for r in results if r.status not in ("TIMEOUT", "ERROR")]
+    matched = sum(1 for r in responding if r.status == "MATCH")
+    percent = 100.0 * matched / len(responding) if responding else 0.0
+    return Round(number, time.monotonic() - started, results, matched, len(responding), percent)
+
+
+async def watch(domain, expected, targets, timeout=DEFAULT_TIMEOUT, interval=POLL_INTERVAL,
+                max_interval=MAX_POLL_INTERVAL, deadline=None):
+    """
+    Async generator of Rounds until every responding target matches or
+    `deadline` seconds pass. The wait between rounds grows by POLL_BACKOFF up
+    to `max_interval`, and drops back to `interval` whenever progress is made.
+    """
+    started = time.monotonic()
+    wait = interval
+    best = -1.0
+    number = 0
+    while True:
+        number += 1
+        result = await check_round(domain, expected, targets, timeout, number, started)
+        yield result
+        if result.responding and result.matched == result.responding:
+            return
+        if deadline is not None and time.monotonic() - started + wait > deadline:
+            return
+        if result.percent > best:
+            best = result.percent
+            wait = interval
+        await asyncio.sleep(wait)
+        wait = min(max_interval, wait * POLL_BACKOFF)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Shrink a resume .docx before emailing it or uploading it to job portals / S3.
+
+  1. Images in word/media/ are downscaled to the size they are actually
+     rendered at in the document (plus headroom for print DPI) and re-encoded.
+     A recompressed image only replaces the original if it is smaller.
+  2. Relationships nothing points at (images, hyperlinks) are dropped, then any
+     part no longer reachable from the package root is removed.
+  3. The archive is rewritten member by member at maximum deflate.
+
+Image recompression needs Pillow (pip3 install Pillow); without it steps 2 and
+3 still run.
+
+Run from repo root:
+  python3 optimize-docx.py Fred_Jabbari_Resume_....docx             # writes *_optimized.docx
+  python3 optimize-docx.py in.docx -o out.docx --dpi 150
+"""
+
+import argparse
+import io
+import posixpath
+import sys
+import zipfile
+from pathlib import Path
+
+try:
+    from lxml import etree
+except ImportError:
+    import subprocess
+    print("Installing lxml...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "lxml", "--user", "--quiet"])
+    from lxml import etree
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PKG_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+# Attributes in these namespaces hold relationship ids (r:embed, r:id, r:link, ..., VML o:relid)
+RID_ATTR_NAMESPACES = (
+    R_NS,
+    "http://purl.oclc.org/ooxml/officeDocument/relationships",
+    "urn:schemas-microsoft-com:office:office",
+)
+
+EMU_PER_INCH = 914400
+DEFAULT_DPI = 220
+JPEG_QUALITY = 85
+
+# Relationship types that are safe to drop when the source part never references their rId
+DROPPABLE_RELTYPES = (
+    R_NS + "/image",
+    R_NS + "/hyperlink",
+)
+
+
+def _rels_name(part):
+    """word/document.xml -> word/_rels/document.xml.rels; '' (package root) -> _rels/.rels"""
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _source_of(rels_name):
+    """Inverse of _rels_name()."""
+    folder, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(folder), name[:-len(".rels")])
+
+
+def _resolve(source, target):
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+def referenced_rids(root):
+    """Every attribute value in a relationship namespace anywhere in the part."""
+    found = set()
+    for element in root.iter():
+        for attr, value in element.attrib.items():
+            if attr.startswith("{") and attr[1:attr.index("}")] in RID_ATTR_NAMESPACES:
+                found.add(value)
+    return found
+
+
+def analyze(zf):
+    """
+    First pass over the small XML parts.
+
+    Returns (rels, rendered_px, drop_rids):
+      rels         {rels part: [(rId, type, target part or None if external)]}
+      rendered_px  {media part: (max width px, max height px) at 1 dpi-inch unit}
+      drop_rids    {rels part: {rIds to remove}}
+    """
+    names = set(zf.namelist())
+    rels = {}
+    for name in names:
+        if not name.endswith(".rels"):
+            continue
+        source = _source_of(name)
+        root = etree.fromstring(zf.read(name))
+        entries = []
+        for rel in root.iter(f"{{{PKG_RELS_NS}}}Relationship"):
+            external = rel.get("TargetMode") == "External"
+            target = None if external else _resolve(source, rel.get("Target"))
+            entries.append((rel.get("Id"), rel.get("Type"), target))
+        rels[name] = entries
+
+    extents = {}
+    drop_rids = {}
+    for rels_part, entries in rels.items():
+        source = _source_of(rels_part)
+        if not source.endswith(".xml") or source not in names:
+            continue
+        try:
+            root = etree.fromstring(zf.read(source))
+        except etree.XMLSyntaxError:
+            # Cannot tell what it references, so keep all of its relationships
+            continue
+        droppable = [rid for rid, rtype, _ in entries if rtype in DROPPABLE_RELTYPES]
+        if droppable:
+            unused = set(droppable) - referenced_rids(root)
+            if unused:
+                drop_rids[rels_part] = unused
+
+        targets = {rid: t for rid, rtype, t in entries if rtype == R_NS + "/image"}
+        if not targets:
+            continue
+        for container in ("inline", "anchor"):
+            for drawing in root.iter(f"{{{WP_NS}}}{container}"):
+                extent = drawing.find(f"{{{WP_NS}}}extent")
+                if extent is None:
+                    continue
+                cx, cy = int(extent.get("cx", 0)), int(extent.get("cy", 0))
+                for blip in drawing.iter(f"{{{A_NS}}}blip"):
+                    target = targets.get(blip.get(f"{{{R_NS}}}embed"))
+                    if target:
+                        w, h = extents.get(target, (0, 0))
+                        extents[target] = (max(w, cx), max(h, cy))
+    return rels, extents, drop_rids
+
+
+def reachable_parts(rels, drop_rids, names):
+    """Parts reachable from the package root, ignoring relationships we are dropping."""
+    seen = set()
+    stack = [""]
+    while stack:
+        source = stack.pop()
+        rels_part = _rels_name(source) if source else "_rels/.rels"
+        for rid, _, target in rels.get(rels_part, []):
+            if target is None or rid in drop_rids.get(rels_part, ()) or target in seen:
+                continue
+            if target in names:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def recompress_image(data, name, extent_emu, dpi):
+    """Return smaller image bytes, or None if recompression does not help."""
+    if Image is None:
+        return None
+    ext = posixpath.splitext(name)[1].lower()
+    if ext not in (".png", ".jpg", ".jpeg"):
+        return None
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.load()
+    except Exception:
+        return None
+
+    if extent_emu and extent_emu[0] and extent_emu[1]:
+        max_w = max(1, round(extent_emu[0] / EMU_PER_INCH * dpi))
+        max_h = max(1, round(extent_emu[1] / EMU_PER_INCH * dpi))
+        if img.width > max_w or img.height > max_h:
+            img.thumbnail((max_w, max_h), Image.LANCZOS)
+
+    out = io.BytesIO()
+    if ext == ".png":
+        img.save(out, format="PNG", optimize=True)
+    else:
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(out, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    new = out.getvalue()
+    return new if len(new) < len(data) else None
+
+
+def _strip_rels(data, rids):
+    root = etree.fromstring(data)
+    for rel in list(root.iter(f"{{{PKG_RELS_NS}}}Relationship")):
+        if rel.get("Id") in rids:
+            root.remove(rel)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _strip_content_types(data, dropped):
+    root = etree.fromstring(data)
+    for override in list(root.iter(f"{{{CT_NS}}}Override")):
+        if override.get("PartName", "").lstrip("/") in dropped:
+            root.remove(override)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def optimize(src, dst, dpi=DEFAULT_DPI):
+    """Write an optimized copy of `src` to `dst`. Returns a stats dict."""
+    stats = {"images": 0, "image_bytes_saved": 0, "dropped_parts": [], "dropped_rels": 0}
+    with zipfile.ZipFile(src) as zin:
+        names = set(zin.namelist())
+        rels, extents, drop_rids = analyze(zin)
+        keep = reachable_parts(rels, drop_rids, names)
+        always = {"[Content_Types].xml"}
+        dropped = {
+            n for n in names
+            if n not in keep and n not in always and not n.endswith(".rels") and not n.endswith("/")
+        }
+        # A .rels file goes with its source part
+        dropped |= {n for n in names if n.endswith(".rels") and n != "_rels/.rels" and _source_of(n) in dropped}
+        stats["dropped_parts"] = sorted(dropped)
+        stats["dropped_rels"] = sum(len(r) for r in drop_rids.values())
+
+        with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zout:
+            for info in zin.infolist():
+                name = info.filename
+                if name in dropped:
+                    continue
+                data = zin.read(name)
+                if name in drop_rids:
+                    data = _strip_rels(data, drop_rids[name])
+                elif name == "[Content_Types].xml" and dropped:
+                    data = _strip_content_types(data, dropped)
+                elif name.startswith("word/media/"):
+                    smaller = recompress_image(data, name, extents.get(name), dpi)
+                    if smaller is not None:
+                        stats["images"] += 1
+                        stats["image_bytes_saved"] += len(data) - len(smaller)
+                        data = smaller
+                zout.writestr(name, data)
+    return stats
+
+
+def _kb(n):
+    return f"{n / 1024:,.1f} KB"
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("docx", help="Input .docx")
+    ap.add_argument("-o", "--output", help="Output path (default: <name>_optimized.docx)")
+    ap.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Target resolution for rendered image size")
+    args = ap.parse_args()
+
+    src = Path(args.docx)
+    if not src.exists():
+        print(f"❌ File not found: {src}")
+        sys.exit(1)
+    dst = Path(args.output) if args.output else src.with_name(src.stem + "_optimized.docx")
+    if dst.resolve() == src.resolve():
+        print("❌ Output must differ from input (the input is streamed while writing)")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Optimize .docx")
+    print("=" * 60)
+    if Image is None:
+        print("ℹ️  Pillow not installed; skipping image recompression (pip3 install Pillow)")
+
+    try:
+        stats = optimize(src, dst, args.dpi)
+    except (zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        print(f"❌ Could not process {src}: {e}")
+        sys.exit(1)
+
+    before, after = src.stat().st_size, dst.stat().st_size
+    print(f"Images recompressed : {stats['images']} (saved {_kb(stats['image_bytes_saved'])})")
+    print(f"Relationships dropped: {stats['dropped_rels']}")
+    print(f"Parts dropped       : {len(stats['dropped_parts'])}")
+    for name in stats["dropped_parts"]:
+        print(f"   - {name}")
+    print("")
+    saved = before - after
+    pct = saved / before * 100 if before else 0
+    print(f"Before: {_kb(before)}")
+    print(f"After : {_kb(after)}  ({pct:.1f}% smaller)")
+    print(f"📄 Saved: {dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ import json
 import sys
 from botocore.exceptions import ClientError
 
+from domain_portfolio import find_domain
+from domain_prices import load_price_table, price_for
+
 DOMAIN_NAME = "ffjconsulting.com"
 PROFILE = "my-sso"
 REGION = "us-east-1"
@@ -59,37 +62,24 @@ def get_domain_price(route53domains_client):
     """Get domain registration price"""
     print_header("Getting Domain Price")
     
-    try:
-        response = route53domains_client.list_prices(
-            Tld='com'
-        )
-        
-        # Find .com price
-        for price in response.get('Prices', []):
-            if price.get('Name') == 'registration':
-                reg_price = price.get('Price', {})
-                amount = reg_price.get('Price', 'Unknown')
-                currency = reg_price.get('Currency', 'USD')
-                print_info(f"Domain registration price: {currency} {amount}")
-                return amount, currency
-    except ClientError as e:
-        print_info(f"Could not get price: {e}")
+    amount, currency = price_for(load_price_table(route53domains_client), DOMAIN_NAME)
+    if amount is None:
+        print_info("Could not get price")
         return None, None
-    
-    return None, None
+    print_info(f"Domain registration price: {currency} {amount}")
+    return amount, currency
 
 def check_if_already_registered(route53domains_client):
     """Check if domain is already registered in this AWS account"""
     print_header("Checking if Domain Already Registered")
     
     try:
-        response = route53domains_client.list_domains()
-        
-        for domain in response.get('Domains', []):
-            if domain['DomainName'] == DOMAIN_NAME:
-                print_success(f"Domain {DOMAIN_NAME} is already registered in your AWS account")
-                print_info(f"Expiration: {domain.get('Expiry', 'Unknown')}")
-                return True
+        # All pages; list_domains() alone stops at the first page
+        domain = find_domain(route53domains_client, DOMAIN_NAME)
+        if domain is not None:
+            print_success(f"Domain {DOMAIN_NAME} is already registered in your AWS account")
+            print_info(f"Expiration: {domain.get('Expiry', 'Unknown')}")
+            return True
         
         print_info(f"Domain {DOMAIN_NAME} not found in registered domains")
         return False
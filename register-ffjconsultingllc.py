@@ -7,6 +7,8 @@ import boto3
 import sys
 from botocore.exceptions import ClientError
 
+from domain_prices import load_price_table, price_for
+
 DOMAIN_NAME = "ffjconsultingllc.com"
 PROFILE = "my-sso"
 REGION = "us-east-1"
@@ -78,16 +80,11 @@ def main():
     
     # Get price
     print_header("Domain Pricing")
-    try:
-        response = route53domains_client.list_prices(Tld='com')
-        for price in response.get('Prices', []):
-            if price.get('Name') == 'registration':
-                reg_price = price.get('Price', {})
-                amount = reg_price.get('Price', 'Unknown')
-                currency = reg_price.get('Currency', 'USD')
-                print_info(f"Registration price: {currency} {amount} per year")
-    except ClientError as e:
-        print_info(f"Could not get price: {e}")
+    amount, currency = price_for(load_price_table(route53domains_client), DOMAIN_NAME)
+    if amount is not None:
+        print_info(f"Registration price: {currency} {amount} per year")
+    else:
+        print_info("Could not get price")
     
     # Registration instructions
     print_header("Domain Registration")
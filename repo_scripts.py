@@ -0,0 +1,22 @@
+"""
+Import the repo's hyphen-named scripts (e.g. "sync-resume-md-to-docx.py") as modules.
+
+Shared by watch-resume.py, bench-docx.py and the tests so they load scripts the
+same way. The script's main() is not run.
+
+  from repo_scripts import load_script
+  sync = load_script("sync-resume-md-to-docx.py")
+"""
+
+import importlib.util
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def load_script(filename):
+    """Import a root-level script by file name; "build-resume-formats.py" becomes module build_resume_formats."""
+    spec = importlib.util.spec_from_file_location(Path(filename).stem.replace("-", "_"), REPO_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
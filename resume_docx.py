@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Word (.docx) rendering for the resume markdown AST (see resume_markdown.py).
+
+Shared by sync-resume-md-to-docx.py, update-resume-docx.py and
+build-resume-formats.py so they all write the same paragraphs, styles and
+hyperlinks.
+"""
+
+import sys
+from copy import deepcopy
+from itertools import groupby
+from weakref import WeakKeyDictionary
+
+try:
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+except ImportError:
+    import subprocess
+    print("Installing python-docx...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx", "--user", "--quiet"])
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+
+from resume_markdown import parse_blocks
+
+HYPERLINK_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+HEADING_STYLES = {1: "Title", 2: "Heading 2", 3: "Heading 3"}
+BULLET_STYLES = {1: "List Bullet", 2: "List Bullet 2", 3: "List Bullet 3"}
+
+
+def set_style(paragraph, style_name):
+    """Apply a style; templates may not define every built-in style, so ignore misses."""
+    if not style_name:
+        return
+    try:
+        paragraph.style = style_name
+    except (KeyError, ValueError):
+        pass
+
+
+class HyperlinkWriter:
+    """
+    Writes w:hyperlink elements into one document part.
+
+    Relationship ids are cached per URL (seeded from the part's existing
+    relationships), so repeated links share one relationship and no lookup scans
+    the relationship collection. Elements are cloned from prebuilt templates
+    instead of formatting and parsing an XML string per link.
+    """
+
+    def __init__(self, part):
+        self.part = part
+        self.rels = part.rels
+        self._rids = {
+            rel.target_ref: rId
+            for rId, rel in self.rels.items()
+            if rel.is_external and rel.reltype == HYPERLINK_RELTYPE
+        }
+        self._next_id = 1 + max(
+            (int(rId[3:]) for rId in self.rels if rId.startswith("rId") and rId[3:].isdigit()),
+            default=0,
+        )
+        self._templates = {}
+
+    def rid_for(self, url):
+        """Return the relationship id for `url`, adding the relationship on first use."""
+        rId = self._rids.get(url)
+        if rId is None:
+            rId = f"rId{self._next_id}"
+            while rId in self.rels:
+                self._next_id += 1
+                rId = f"rId{self._next_id}"
+            self._next_id += 1
+            self.rels.add_relationship(HYPERLINK_RELTYPE, url, rId, is_external=True)
+            self._rids[url] = rId
+        return rId
+
+    def _template(self, bold, italic):
+        key = (bold, italic)
+        template = self._templates.get(key)
+        if template is None:
+            extra = ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "")
+            template = parse_xml(
+                f'<w:hyperlink r:id="" {nsdecls("w", "r")}>'
+                f'<w:r><w:rPr>{extra}<w:color w:val="0563C1"/><w:u w:val="single"/></w:rPr>'
+                f'<w:t xml:space="preserve"></w:t></w:r></w:hyperlink>'
+            )
+            self._templates[key] = template
+        return template
+
+    def element(self, url, text, bold=False, italic=False):
+        """Build a w:hyperlink element (not yet attached to any paragraph)."""
+        hl = deepcopy(self._template(bold, italic))
+        hl.set(qn("r:id"), self.rid_for(url))
+        hl[0][-1].text = text
+        return hl
+
+    def add(self, paragraph, url, text, bold=False, italic=False):
+        hl = self.element(url, text, bold, italic)
+        paragraph._p.append(hl)
+        return hl
+
+    def add_many(self, links):
+        """
+        Bulk insert: `links` yields (paragraph, url, text) or (paragraph, url, text, bold, italic).
+        Every paragraph must belong to this writer's part. A link that cannot be added is
+        written as plain text, like add_hyperlink().
+        """
+        count = 0
+        for link in links:
+            try:
+                self.add(*link)
+            except Exception:
+                link[0].add_run(link[2])
+            count += 1
+        return count
+
+
+_writers = WeakKeyDictionary()
+
+
+def hyperlink_writer(part):
+    """The shared HyperlinkWriter for a document part."""
+    writer = _writers.get(part)
+    if writer is None:
+        writer = _writers[part] = HyperlinkWriter(part)
+    return writer
+
+
+def add_hyperlink(paragraph, url: str, text: str, bold: bool = False, italic: bool = False):
+    """Add a hyperlink run to a paragraph."""
+    try:
+        hyperlink_writer(paragraph.part).add(paragraph, url, text, bold, italic)
+    except Exception:
+        paragraph.add_run(text)
+
+
+def add_hyperlinks(links):
+    """Add many (paragraph, url, text[, bold, italic]) hyperlinks in one call."""
+    # Each part (body, header, footer, footnotes) has its own relationships
+    count = 0
+    for part, part_links in groupby(links, key=lambda link: link[0].part):
+        count += hyperlink_writer(part).add_many(part_links)
+    return count
+
+
+def add_tokens(paragraph, tokens):
+    """Add runs for a tokenize_inline() token stream."""
+    for tok in tokens:
+        if tok.url:
+            add_hyperlink(paragraph, tok.url, tok.text, tok.bold, tok.italic)
+            continue
+        run = paragraph.add_run(tok.text)
+        if tok.bold:
+            run.bold = True
+        if tok.italic:
+            run.italic = True
+        if tok.kind == "code":
+            run.font.name = "Consolas"
+
+
+def render_blocks(blocks, new_paragraph):
+    """Render AST blocks as paragraphs created by `new_paragraph(style)`."""
+    for block in blocks:
+        kind = block.kind
+        if kind in ("rule", "blank"):
+            new_paragraph()
+        elif kind in ("title", "heading"):
+            p = new_paragraph(HEADING_STYLES[block.level])
+            p.add_run(block.text.strip())
+        elif kind == "bullet":
+            style = BULLET_STYLES.get(block.level, BULLET_STYLES[3])
+            add_tokens(new_paragraph(style), block.tokens)
+        else:
+            add_tokens(new_paragraph(), block.tokens)
+
+
+def render_markdown(lines, new_paragraph):
+    """Parse and render resume markdown lines."""
+    render_blocks(parse_blocks(lines), new_paragraph)
+
+
+def blocks_to_document(blocks):
+    """Build a new Document containing `blocks`."""
+    doc = Document()
+
+    def new_paragraph(style=None):
+        p = doc.add_paragraph()
+        set_style(p, style)
+        return p
+
+    render_blocks(blocks, new_paragraph)
+    return doc
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Markdown parsing shared by the resume converters.
+
+Turns a single line of resume markdown into a flat stream of tokens in one
+left-to-right pass over precompiled patterns. Supported inline syntax:
+
+  **bold**   *italic*   `code`   [text](url)
+
+Links and bold nest either way ("**[text](url)**" and "[**text**](url)"), and
+the nested token inherits the formatting of its parent.
+
+parse_blocks() builds a line-level AST (titles, headings, bullets, paragraphs)
+on top of the tokenizer, so every output format is produced from one parse.
+
+Usage:
+    from resume_markdown import tokenize_inline, parse_resume
+    for tok in tokenize_inline("**Languages:** Java, [site](https://...)"):
+        print(tok.kind, tok.text)
+    blocks = parse_resume("frontend/src/content/resume.md")
+"""
+
+import re
+from collections import namedtuple
+
+# One token per contiguous span of identically formatted text.
+# kind is one of: "text", "bold", "italic", "link", "code".
+Token = namedtuple("Token", ["kind", "text", "bold", "italic", "url"])
+
+# Alternatives are tried in order at each position, so code spans win over
+# emphasis and ** wins over *.
+INLINE_RE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|\*(?P<italic>[^*\s](?:[^*]*[^*\s])?)\*"
+)
+
+
+MARKUP_CHARS = frozenset("*[`")
+
+# Build tokens without the keyword-handling namedtuple constructor; this is the
+# hot path when converting large documents.
+_new_token = tuple.__new__
+
+
+def _kind(bold, italic, url):
+    if url:
+        return "link"
+    if bold:
+        return "bold"
+    if italic:
+        return "italic"
+    return "text"
+
+
+def _tokenize(text, bold, italic, url, out):
+    kind = _kind(bold, italic, url)
+    # Most spans (and most inner bold/link texts) carry no further markup.
+    if MARKUP_CHARS.isdisjoint(text):
+        out.append(_new_token(Token, (kind, text, bold, italic, url)))
+        return
+    append = out.append
+    pos = 0
+    for m in INLINE_RE.finditer(text):
+        start = m.start()
+        if start > pos:
+            append(_new_token(Token, (kind, text[pos:start], bold, italic, url)))
+        code, link_text, link_url, bold_text, italic_text = m.groups()
+        if code is not None:
+            append(_new_token(Token, ("code", code, bold, italic, url)))
+        elif link_text is not None:
+            _tokenize(link_text, bold, italic, link_url, out)
+        elif bold_text is not None:
+            _tokenize(bold_text, True, italic, url, out)
+        else:
+            _tokenize(italic_text, bold, True, url, out)
+        pos = m.end()
+    if pos < len(text):
+        append(_new_token(Token, (kind, text[pos:], bold, italic, url)))
+
+
+def tokenize_inline(line):
+    """Return the list of Tokens for one line of inline markdown."""
+    out = []
+    _tokenize(line, False, False, None, out)
+    return out
+
+
+def plain_text(line):
+    """Strip inline markdown from a line, keeping only the visible text."""
+    return "".join(tok.text for tok in tokenize_inline(line))
+
+
+# ---------------------------------------------------------------------------
+# Block-level AST
+# ---------------------------------------------------------------------------
+
+# One block per markdown line. kind is one of:
+#   "title"      # Heading
+#   "heading"    ## / ### Heading (level 2 or 3)
+#   "bullet"     - item (level 1, 2, ... from indentation)
+#   "note"       *whole line in italics* (text is the inner markdown)
+#   "paragraph"  any other non-empty line
+#   "rule"       ---
+#   "blank"      empty line
+# text is the raw inline markdown; tokens is tokenize_inline(text).
+Block = namedtuple("Block", ["kind", "level", "text", "tokens"])
+
+HEADING_RE = re.compile(r"^(#{1,3}) +(.+?)\s*$")
+BULLET_RE = re.compile(r"^( *)- +(.*?)\s*$")
+
+
+def parse_blocks(lines):
+    """Parse resume markdown lines into a list of Blocks (one parse serves every output format)."""
+    blocks = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped == "---":
+            blocks.append(Block("rule", 0, "", []))
+            continue
+        if not stripped:
+            blocks.append(Block("blank", 0, "", []))
+            continue
+
+        m = HEADING_RE.match(stripped)
+        if m:
+            level = len(m.group(1))
+            text = m.group(2)
+            kind = "title" if level == 1 else "heading"
+            blocks.append(Block(kind, level, text, tokenize_inline(text)))
+            continue
+
+        m = BULLET_RE.match(line.rstrip())
+        if m:
+            level = len(m.group(1)) // 2 + 1
+            text = m.group(2)
+            blocks.append(Block("bullet", level, text, tokenize_inline(text)))
+            continue
+
+        if stripped.startswith("*") and stripped.endswith("*") and not stripped.startswith("**"):
+            text = stripped[1:-1].strip()
+            blocks.append(Block("note", 0, text, tokenize_inline(text)))
+            continue
+
+        blocks.append(Block("paragraph", 0, stripped, tokenize_inline(stripped)))
+    return blocks
+
+
+def parse_resume(md_path):
+    """Read and parse a resume markdown file."""
+    with open(md_path, encoding="utf-8") as f:
+        return parse_blocks(f.read().splitlines())
+
+
+def sections(blocks):
+    """
+    Group blocks by their enclosing ## heading.
+
+    Returns a list of (heading text or None for the preamble, blocks) pairs; ###
+    headings stay inside their ## section.
+    """
+    out = [(None, [])]
+    for block in blocks:
+        if block.kind == "heading" and block.level == 2:
+            out.append((block.text, []))
+        else:
+            out[-1][1].append(block)
+    return out
@@ -0,0 +1,106 @@
+"""
+Idempotent Route 53 record changes for ACM DNS validation.
+
+  find_hosted_zone(route53, domain)     public hosted zone id for a domain
+  zone_index(route53, zone_id)          {(name, type): record set}, loaded once (all pages)
+  plan_validation_changes(records, ix)  UPSERTs for validation CNAMEs that are missing or differ
+  apply_changes(route53, zone_id, ...)  one change_resource_record_sets batch
+  wait_insync(route53, change_id)       get_change with backoff until INSYNC
+
+Running it twice is a no-op the second time: records that already match are
+left out of the batch, and an empty plan makes no API call at all.
+
+  from route53_records import sync_validation_records
+  changes, status = sync_validation_records(acm, route53, cert_arn, zone_id)
+"""
+
+import time
+
+from acm_waiter import backoff_delays, validation_records
+
+VALIDATION_TTL = 300
+INSYNC_TIMEOUT = 300.0
+
+
+def _fqdn(name):
+    return name.lower().rstrip(".") + "."
+
+
+def find_hosted_zone(route53, domain):
+    """Id of the public hosted zone named `domain`, or None."""
+    response = route53.list_hosted_zones_by_name(DNSName=_fqdn(domain), MaxItems="5")
+    for zone in response.get("HostedZones", []):
+        if zone["Name"].lower() == _fqdn(domain) and not zone.get("Config", {}).get("PrivateZone"):
+            return zone["Id"].split("/")[-1]
+    return None
+
+
+def zone_index(route53, zone_id):
+    """Every record set in the zone keyed by (fqdn, type)."""
+    index = {}
+    for page in route53.get_paginator("list_resource_record_sets").paginate(HostedZoneId=zone_id):
+        for record_set in page.get("ResourceRecordSets", []):
+            index[(_fqdn(record_set["Name"]), record_set["Type"])] = record_set
+    return index
+
+
+def _values(record_set):
+    return sorted(_fqdn(r["Value"]) for r in record_set.get("ResourceRecords", []))
+
+
+def plan_validation_changes(records, index, ttl=VALIDATION_TTL):
+    """
+    (change, reason) pairs for validation records that are missing ("missing")
+    or point elsewhere ("changed"); records that already match are skipped.
+    """
+    planned = []
+    for name, record_type, value in records:
+        existing = index.get((_fqdn(name), record_type))
+        if existing is not None and _values(existing) == [_fqdn(value)]:
+            continue
+        planned.append(({
+            "Action": "UPSERT",
+            "ResourceRecordSet": {
+                "Name": _fqdn(name),
+                "Type": record_type,
+                "TTL": existing.get("TTL", ttl) if existing else ttl,
+                "ResourceRecords": [{"Value": value}],
+            },
+        }, "changed" if existing is not None else "missing"))
+    return planned
+
+
+def apply_changes(route53, zone_id, changes, comment="ACM DNS validation"):
+    """Submit `changes` as a single batch; returns the change id."""
+    response = route53.change_resource_record_sets(
+        HostedZoneId=zone_id,
+        ChangeBatch={"Comment": comment, "Changes": changes},
+    )
+    return response["ChangeInfo"]["Id"]
+
+
+def wait_insync(route53, change_id, timeout=INSYNC_TIMEOUT, base_delay=2.0, max_delay=15.0):
+    """Poll get_change until the batch is INSYNC on every Route 53 server; returns the final status."""
+    deadline = time.monotonic() + timeout
+    for delay in backoff_delays(base_delay, max_delay):
+        status = route53.get_change(Id=change_id)["ChangeInfo"]["Status"]
+        if status == "INSYNC" or time.monotonic() + delay > deadline:
+            return status
+        time.sleep(delay)
+
+
+def sync_validation_records(acm, route53, cert_arn, zone_id, certificate=None, dry_run=False, wait=True):
+    """
+    Create or fix every validation CNAME of a certificate in one batch.
+    Returns (planned changes, status) where status is "UNCHANGED", "DRY_RUN",
+    "PENDING" (submitted, not waited on) or the get_change status.
+    """
+    if certificate is None:
+        certificate = acm.describe_certificate(CertificateArn=cert_arn)["Certificate"]
+    planned = plan_validation_changes(validation_records(certificate), zone_index(route53, zone_id))
+    if not planned:
+        return planned, "UNCHANGED"
+    if dry_run:
+        return planned, "DRY_RUN"
+    change_id = apply_changes(route53, zone_id, [change for change, _ in planned])
+    return planned, wait_insync(route53, change_id) if wait else "PENDING"
@@ -4,11 +4,16 @@ Interactive Domain Setup Script
 Run this script locally - it will execute AWS commands and report results
 """
 
+import asyncio
 import boto3
 import json
 import time
 import sys
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+
+from acm_waiter import record_history, validation_records, wait_for_issued, wait_for_records
+from domain_portfolio import find_domain
+from route53_records import sync_validation_records
 
 DOMAIN_NAME = "ffjconsulting.com"
 BUCKET_NAME = "ffj-consulting-website"
@@ -47,11 +52,10 @@ def check_domain_registered(session):
     print_header("Checking Domain Registration")
     try:
         route53domains = session.client('route53domains', region_name='us-east-1')
-        domains = route53domains.list_domains()
-        for domain in domains.get('Domains', []):
-            if domain['DomainName'] == DOMAIN_NAME:
-                print_success(f"Domain {DOMAIN_NAME} is registered")
-                return True
+        # All pages; list_domains() alone stops at the first page
+        if find_domain(route53domains, DOMAIN_NAME) is not None:
+            print_success(f"Domain {DOMAIN_NAME} is registered")
+            return True
         print_info(f"Domain {DOMAIN_NAME} not found in registered domains")
         print_info("You may need to register it first via AWS Console")
         return False
@@ -127,20 +131,17 @@ def request_ssl_certificate(session):
         cert_arn = response['CertificateArn']
         print_success(f"Certificate requested: {cert_arn}")
         
-        # Get validation records
-        time.sleep(5)
-        cert_detail = acm.describe_certificate(CertificateArn=cert_arn)
+        # Validation records appear a few seconds after the request
+        certificate = asyncio.run(wait_for_records(acm, cert_arn))
         print("\n📋 SSL Certificate Validation Records:")
         print("Add these CNAME records to your Route 53 hosted zone:")
-        for option in cert_detail['Certificate']['DomainValidationOptions']:
-            if 'ResourceRecord' in option:
-                record = option['ResourceRecord']
-                print(f"   Name: {record['Name']}")
-                print(f"   Type: {record['Type']}")
-                print(f"   Value: {record['Value']}")
-                print()
+        for name, record_type, value in validation_records(certificate):
+            print(f"   Name: {name}")
+            print(f"   Type: {record_type}")
+            print(f"   Value: {value}")
+            print()
         return cert_arn
-    except ClientError as e:
+    except (ClientError, BotoCoreError, TimeoutError) as e:
         print_error(f"Failed to request certificate: {e}")
         return None
 
@@ -315,18 +316,38 @@ def main():
         print_error("Failed to request certificate. Exiting.")
         sys.exit(1)
     
+    # Add validation records (only missing / changed ones, one batch)
+    print_header("Adding Certificate Validation Records")
+    acm = session.client('acm', region_name=REGION)
+    route53 = session.client('route53', region_name=REGION)
+    try:
+        planned, status = sync_validation_records(acm, route53, cert_arn, zone_id)
+        if status == "UNCHANGED":
+            print_success("Validation records already in the hosted zone")
+        else:
+            print_success(f"{len(planned)} validation records added ({status})")
+    except (ClientError, BotoCoreError) as e:
+        print_error(f"Could not add validation records: {e}")
+        print_info("Add the DNS validation records shown above to Route 53 manually")
+    
     # Wait for certificate validation
-    print("\n" + "="*60)
-    print("IMPORTANT: Certificate Validation")
-    print("="*60)
-    print("Before creating CloudFront, you need to:")
-    print("1. Add the DNS validation records shown above to Route 53")
-    print("2. Wait 5-30 minutes for validation")
-    print("3. Check certificate status in ACM console")
-    response = input("\nIs the certificate validated? (y/n): ")
-    if response.lower() != 'y':
-        print("\nPlease validate the certificate first, then run this script again.")
+    print_header("Waiting for Certificate Validation")
+    print_info("CloudFront setup continues as soon as the certificate is issued (Ctrl-C to stop)")
+    try:
+        result = asyncio.run(wait_for_issued(
+            acm, cert_arn, on_event=lambda kind, message: print_info(message)))
+    except KeyboardInterrupt:
+        print("\nStopped waiting. Resume later with:")
+        print(f"   python3 wait-for-certificate.py --cert-arn {cert_arn}")
         sys.exit(0)
+    except (ClientError, BotoCoreError, TimeoutError) as e:
+        print_error(f"Stopped waiting for the certificate: {e}")
+        sys.exit(1)
+    if result.status != 'ISSUED':
+        print_error(f"Certificate not issued: {result.status}")
+        sys.exit(1)
+    record_history(result)
+    print_success(f"Certificate issued after {result.waited / 60:.1f} minutes")
     
     # Create CloudFront distribution
     dist_id, dist_domain = create_cloudfront_distribution(session, cert_arn, zone_id)
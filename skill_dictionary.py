@@ -0,0 +1,181 @@
+"""
+Skill and job-title extraction from frontend/src/data/skills-dictionary.json.
+
+The dictionary maps each canonical title / skill to its aliases:
+
+  {"titles": {"Site Reliability Engineer": ["sre", ...], ...},
+   "skills": {"Kubernetes": ["k8s"], ...}}
+
+All aliases (plus each lower-cased canonical name) are compiled into one
+Aho-Corasick automaton, so a text is scanned once no matter how many entries the
+dictionary has. Matches must sit on word boundaries ("java" does not match inside
+"javascript"), and overlapping matches of the same kind keep the longest one
+("enterprise cloud architect" wins over "cloud architect").
+
+Compiling is cached on disk under build/cache/, keyed by a hash of the
+dictionary file, so scripts that run often only unpickle it.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+from collections import namedtuple
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+DICT_PATH = REPO_ROOT / "frontend" / "src" / "data" / "skills-dictionary.json"
+CACHE_DIR = REPO_ROOT / "build" / "cache"
+FRONTEND_PATH = REPO_ROOT / "frontend" / "public" / "data" / "skills-dictionary.json"
+
+# Bump when the compiled layout changes so stale caches are ignored
+CACHE_VERSION = 1
+KINDS = ("titles", "skills")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Extraction result: each field is a list of (canonical name, count), most frequent first
+Signals = namedtuple("Signals", ["titles", "skills"])
+
+
+def normalize(text):
+    return WHITESPACE_RE.sub(" ", text.lower())
+
+
+def _aliases(dictionary):
+    """Yield (alias, kind, canonical) for every entry, the canonical name included."""
+    for kind in KINDS:
+        for name, aliases in dictionary.get(kind, {}).items():
+            for alias in {normalize(name).strip(), *(normalize(a).strip() for a in aliases)}:
+                if alias:
+                    yield alias, kind, name
+
+
+class Automaton:
+    """Aho-Corasick automaton over lower-cased aliases; outputs are merged along failure links."""
+
+    def __init__(self, dictionary, digest=""):
+        self.digest = digest
+        self.entries = []          # entry id -> (kind, canonical)
+        self.goto = [{}]           # state -> {char: state}
+        self.fail = [0]
+        self.out = [()]            # state -> ((alias length, entry id), ...)
+        entry_ids = {}
+        outputs = [[]]
+        for alias, kind, name in _aliases(dictionary):
+            entry = entry_ids.setdefault((kind, name), len(self.entries))
+            if entry == len(self.entries):
+                self.entries.append((kind, name))
+            state = 0
+            for ch in alias:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((len(alias), entry))
+
+        # Breadth-first failure links
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                outputs[nxt].extend(outputs[self.fail[nxt]])
+        self.out = [tuple(o) for o in outputs]
+
+    def matches(self, text):
+        """Yield (start, end, kind, canonical) for every word-bounded alias match in normalized text."""
+        goto, fail, out, entries = self.goto, self.fail, self.out, self.entries
+        size = len(text)
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            if end < size and text[end].isalnum():
+                continue
+            for length, entry in out[state]:
+                start = end - length
+                if start and text[start - 1].isalnum():
+                    continue
+                yield (start, end) + entries[entry]
+
+    def extract(self, text):
+        """Signals found in `text`; overlapping matches of the same kind keep the longest."""
+        found = {kind: [] for kind in KINDS}
+        for start, end, kind, name in self.matches(normalize(text)):
+            found[kind].append((start, -(end - start), end, name))
+
+        result = {}
+        for kind, spans in found.items():
+            counts, first = {}, {}
+            last_end = -1
+            for start, _, end, name in sorted(spans):
+                if start < last_end:
+                    continue
+                last_end = end
+                counts[name] = counts.get(name, 0) + 1
+                first.setdefault(name, start)
+            ranked = sorted(counts, key=lambda n: (-counts[n], first[n]))
+            result[kind] = [(name, counts[name]) for name in ranked]
+        return Signals(result["titles"], result["skills"])
+
+
+def load_dictionary(path=DICT_PATH):
+    data = Path(path).read_bytes()
+    return json.loads(data), hashlib.sha256(data).hexdigest()
+
+
+def load_automaton(path=DICT_PATH, cache_dir=CACHE_DIR):
+    """Compiled automaton for the dictionary at `path`, from the on-disk cache when it is current."""
+    dictionary, digest = load_dictionary(path)
+    cache = Path(cache_dir) / f"skills-{digest[:16]}-v{CACHE_VERSION}.pickle"
+    try:
+        with open(cache, "rb") as f:
+            automaton = pickle.load(f)
+        if automaton.digest == digest:
+            return automaton
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    automaton = Automaton(dictionary, digest)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "wb") as f:
+            pickle.dump(automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # a read-only checkout still works, just without the cache
+    return automaton
+
+
+def frontend_dictionary(dictionary, digest):
+    """
+    Compact form for the browser: canonical names per kind plus one
+    {alias: index} map per kind, and the longest alias in words so the client
+    can do a longest-match n-gram scan.
+    """
+    out = {"version": digest[:12], "maxWords": 1}
+    for kind in KINDS:
+        names = list(dictionary.get(kind, {}))
+        index = {name: i for i, name in enumerate(names)}
+        aliases = {}
+        for alias, alias_kind, name in _aliases(dictionary):
+            if alias_kind == kind:
+                aliases[alias] = index[name]
+                out["maxWords"] = max(out["maxWords"], alias.count(" ") + 1)
+        out[kind] = names
+        out[kind[0] + "Aliases"] = dict(sorted(aliases.items()))
+    return out
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Reverse sync: bring edits made in the Word resume (.docx) back into
+frontend/src/content/resume.md.
+
+word/document.xml is streamed with iterparse (one pass, each paragraph freed
+once converted) and mapped to the same markdown conventions that
+sync-resume-md-to-docx.py consumes:
+
+  Title -> "# "   Heading 2 -> "## "   Heading 3 -> "### "
+  List Bullet / 2 / 3 (or numbered list level) -> "- " / "  - " / "    - "
+  typed "• " / "◦ " / "▪ " bullets in plain paragraphs -> the same list levels
+  bold -> **text**   italic -> *text*   hyperlink -> [text](resolved target)
+
+The result is not written over resume.md wholesale. Lines are compared with the
+document by plain text, and only the lines whose text differs are changed, so
+markup, hard breaks, "---" rules and blank lines stay as they are. The output
+is a unified diff. A document without heading styles (not produced by the
+forward sync) is only applied with --force.
+
+Run from repo root:
+  python3 sync-resume-docx-to-md.py                 # show the patch
+  python3 sync-resume-docx-to-md.py --apply         # write resume.md
+  python3 sync-resume-docx-to-md.py some.docx -o resume.patch
+"""
+
+import argparse
+import difflib
+import sys
+import zipfile
+from pathlib import Path
+
+try:
+    from lxml import etree
+except ImportError:
+    import subprocess
+    print("Installing lxml...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "lxml", "--user", "--quiet"])
+    from lxml import etree
+
+from resume_docx import BULLET_STYLES, HEADING_STYLES
+from resume_markdown import parse_blocks
+
+REPO_ROOT = Path(__file__).resolve().parent
+MD_PATH = REPO_ROOT / "frontend" / "src" / "content" / "resume.md"
+LOCAL_DOCX = Path("/Users/fjabbari/@@@PUBLIC/@@@RESUME_2026/Fred_Jabbari_Resume_Optimized_2026_with_Bedrock_BDAGood001_with_links.docx")
+FALLBACK_DOCX = REPO_ROOT / "Fred_Jabbari_Resume_synced_from_website.docx"
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+OFF_VALUES = ("0", "false", "off", "none")
+
+# Typed bullet characters used by plain-text templates, by nesting level
+TEXT_BULLETS = {"•": 1, "◦": 2, "▪": 3}
+
+STYLE_PREFIX = {name: "#" * level + " " for level, name in HEADING_STYLES.items()}
+BULLET_LEVEL = {name: level for level, name in BULLET_STYLES.items()}
+
+
+# ---------------------------------------------------------------------------
+# Paragraph -> markdown: a paragraph is (style name, [(text, bold, italic, url)], list level)
+# ---------------------------------------------------------------------------
+
+def _merge_runs(runs):
+    merged = []
+    for text, bold, italic, url in runs:
+        if not text:
+            continue
+        if merged and merged[-1][1:] == (bold, italic, url):
+            merged[-1] = (merged[-1][0] + text, bold, italic, url)
+        else:
+            merged.append((text, bold, italic, url))
+    return merged
+
+
+def _wrap(text, marker):
+    """Put emphasis markers around the text but keep surrounding spaces outside them."""
+    core = text.strip()
+    if not core:
+        return text
+    lead = text[:len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()):]
+    return f"{lead}{marker}{core}{marker}{trail}"
+
+
+def paragraph_to_markdown(style, runs, level=None):
+    """Markdown line for one paragraph, or '' for an empty paragraph."""
+    parts = []
+    for text, bold, italic, url in _merge_runs(runs):
+        if italic:
+            text = _wrap(text, "*")
+        if bold:
+            text = _wrap(text, "**")
+        if url:
+            text = f"[{text}]({url})"
+        parts.append(text)
+    body = "".join(parts).strip()
+    if not body:
+        return ""
+
+    if style in STYLE_PREFIX:
+        # Headings are written as plain text by the forward sync
+        return STYLE_PREFIX[style] + "".join(r[0] for r in runs).strip()
+    if style in BULLET_LEVEL or level is not None:
+        depth = BULLET_LEVEL.get(style, (level or 0) + 1)
+        return "  " * (depth - 1) + "- " + body
+    if body[:1] in TEXT_BULLETS and body[1:2].isspace():
+        return "  " * (TEXT_BULLETS[body[0]] - 1) + "- " + body[2:].lstrip()
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Streaming docx reader
+# ---------------------------------------------------------------------------
+
+def _on(el, name):
+    child = el.find(W + name) if el is not None else None
+    return child is not None and child.get(W + "val", "true").lower() not in OFF_VALUES
+
+
+def _read_rels_and_styles(zf):
+    targets = {}
+    try:
+        for rel in etree.fromstring(zf.read("word/_rels/document.xml.rels")).iter(PKG_REL):
+            if rel.get("TargetMode") == "External":
+                targets[rel.get("Id")] = rel.get("Target")
+    except KeyError:
+        pass
+    styles = {}
+    try:
+        for style in etree.fromstring(zf.read("word/styles.xml")).iter(W + "style"):
+            name = style.find(W + "name")
+            styles[style.get(W + "styleId")] = name.get(W + "val") if name is not None else style.get(W + "styleId")
+    except KeyError:
+        pass
+    return targets, styles
+
+
+def _normalize_style(name):
+    """Word stores built-in names in lower case ("heading 2"); match our capitalized names."""
+    if not name:
+        return None
+    for known in list(STYLE_PREFIX) + list(BULLET_LEVEL):
+        if name.lower() == known.lower():
+            return known
+    return name
+
+
+def iter_docx_paragraphs(docx_path):
+    """Yield (style, runs, list level or None) for each body paragraph, streaming document.xml."""
+    with zipfile.ZipFile(docx_path) as zf:
+        targets, styles = _read_rels_and_styles(zf)
+        with zf.open("word/document.xml") as stream:
+            for _, p in etree.iterparse(stream, events=("end",), tag=W + "p"):
+                ppr = p.find(W + "pPr")
+                style_el = ppr.find(W + "pStyle") if ppr is not None else None
+                style_id = style_el.get(W + "val") if style_el is not None else None
+                style = _normalize_style(styles.get(style_id, style_id))
+                level = None
+                num_pr = ppr.find(W + "numPr") if ppr is not None else None
+                if num_pr is not None and style not in BULLET_LEVEL:
+                    ilvl = num_pr.find(W + "ilvl")
+                    level = int(ilvl.get(W + "val", "0")) if ilvl is not None else 0
+
+                runs = []
+                for child in p:
+                    if child.tag == W + "r":
+                        runs.append(_run(child, None))
+                    elif child.tag == W + "hyperlink":
+                        url = targets.get(child.get(R_ID))
+                        runs.extend(_run(r, url) for r in child.iter(W + "r"))
+                yield style, runs, level
+
+                # Free what we have processed so memory stays flat on large documents
+                p.clear(keep_tail=True)
+                parent = p.getparent()
+                if parent is not None and parent.tag == W + "body":
+                    while p.getprevious() is not None:
+                        del parent[0]
+
+
+def _run(r, url):
+    rpr = r.find(W + "rPr")
+    text = "".join(
+        (t.text or "") if t.tag == W + "t" else "\t" if t.tag == W + "tab" else ""
+        for t in r
+    )
+    return text, _on(rpr, "b"), _on(rpr, "i"), url
+
+
+# ---------------------------------------------------------------------------
+# Minimal patch
+# ---------------------------------------------------------------------------
+
+def _is_structural(line):
+    stripped = line.strip()
+    return not stripped or stripped == "---"
+
+
+def _plain(line):
+    """Text of a markdown line without heading / list / emphasis / link markup."""
+    block = parse_blocks([line])[0]
+    text = block.text if block.kind in ("title", "heading") else "".join(t.text for t in block.tokens)
+    return " ".join(text.split())
+
+
+def merge_into_markdown(md_lines, docx_lines):
+    """
+    Return new markdown lines: existing lines where the document's text agrees,
+    document lines where it differs. Lines are compared by plain text, so markup
+    the document cannot express (or lost) is kept. Blank lines and rules in
+    resume.md are left alone, except that a deleted line takes one of the blank
+    lines around it with it.
+    """
+    content_idx = [i for i, line in enumerate(md_lines) if not _is_structural(line)]
+    old_plain = [_plain(md_lines[i]) for i in content_idx]
+    new_plain = [_plain(line) for line in docx_lines]
+
+    matcher = difflib.SequenceMatcher(None, old_plain, new_plain, autojunk=False)
+    replacement = {}  # md line index -> list of new lines (empty = deleted)
+    insert_after = {}  # md line index -> list of lines to add after it (-1 = top)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        old = content_idx[i1:i2]
+        new = docx_lines[j1:j2]
+        # Pair replaced lines one to one; extra document lines follow the last pair
+        for idx, line in zip(old, new):
+            replacement[idx] = [line]
+        for idx in old[len(new):]:
+            replacement[idx] = []
+        if len(new) > len(old):
+            anchor = old[-1] if old else (content_idx[i1 - 1] if i1 else -1)
+            insert_after.setdefault(anchor, []).extend(new[len(old):])
+
+    out = list(insert_after.get(-1, []))
+    drop_blank = False
+    for i, line in enumerate(md_lines):
+        if drop_blank and not line.strip():
+            drop_blank = False
+            continue
+        lines = replacement.get(i, [line])
+        drop_blank = not lines and (not out or not out[-1].strip())
+        out.extend(lines)
+        out.extend(insert_after.get(i, []))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("docx", nargs="?", help="Word resume (default: local resume, else repo copy)")
+    ap.add_argument("--md", default=str(MD_PATH), help="Markdown file to patch")
+    ap.add_argument("--apply", action="store_true", help="Write the patched markdown")
+    ap.add_argument("-o", "--output", help="Write the patch to this file")
+    ap.add_argument("--force", action="store_true", help="Apply even if the document has no heading styles")
+    args = ap.parse_args()
+
+    docx_path = Path(args.docx) if args.docx else (LOCAL_DOCX if LOCAL_DOCX.exists() else FALLBACK_DOCX)
+    md_path = Path(args.md)
+    for path in (docx_path, md_path):
+        if not path.exists():
+            print(f"❌ File not found: {path}")
+            sys.exit(1)
+
+    print("=" * 60)
+    print("Sync Word (.docx) → website resume (resume.md)")
+    print("=" * 60)
+
+    docx_lines = []
+    docx_headings = 0
+    try:
+        for style, runs, level in iter_docx_paragraphs(docx_path):
+            line = paragraph_to_markdown(style, runs, level)
+            if line:
+                docx_lines.append(line)
+                docx_headings += style in STYLE_PREFIX
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
+        print(f"❌ Could not read {docx_path}: {e}")
+        sys.exit(1)
+
+    original = md_path.read_text(encoding="utf-8")
+    md_lines = original.splitlines()
+    md_headings = sum(1 for block in parse_blocks(md_lines) if block.kind in ("title", "heading"))
+    unstyled = docx_headings * 2 < md_headings
+    if unstyled:
+        print(f"⚠️  {docx_path.name} uses heading styles for {docx_headings} paragraph(s) but resume.md has "
+              f"{md_headings} headings;")
+        print("   it was probably not produced by sync-resume-md-to-docx.py, so changed lines would lose")
+        print("   their markdown structure. Review the patch; --apply needs --force for this document.")
+        print("")
+    merged = merge_into_markdown(md_lines, docx_lines)
+    patch = list(difflib.unified_diff(
+        md_lines, merged, fromfile=f"a/{md_path.name}", tofile=f"b/{md_path.name}", lineterm=""
+    ))
+
+    if not patch:
+        print("✅ resume.md already matches the Word document; nothing to do.")
+        return
+
+    changed = sum(1 for line in patch if line[:1] in "+-" and not line.startswith(("+++", "---")))
+    text = "\n".join(patch) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"📄 Patch written: {args.output}")
+    else:
+        print(text)
+
+    if args.apply and unstyled and not args.force:
+        print("❌ Not applied: the document has no heading styles (re-run with --apply --force to write anyway)")
+        sys.exit(1)
+    if args.apply:
+        trailing = "\n" if original.endswith("\n") else ""
+        md_path.write_text("\n".join(merged) + trailing, encoding="utf-8")
+        print(f"✅ Applied {changed} changed line(s) to {md_path}")
+    else:
+        print(f"ℹ️  {changed} changed line(s). Re-run with --apply to update {md_path.name}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,38 @@
 Sync the website resume (frontend/src/content/resume.md) to your local Word resume .docx.
 Updates the .docx IN PLACE at your local path, or saves to repo if that path is not writable.
 
+Only the sections (split at ## / ### headings) whose markdown changed since the last
+sync are rewritten; the rest of the template keeps its original formatting. Section
+hashes are kept in a sidecar file next to the .docx (<name>.docx.sections.json).
+
 Run from repo root: python3 sync-resume-md-to-docx.py
+Force a full rebuild: python3 sync-resume-md-to-docx.py --full
 """
 
+import argparse
+import hashlib
+import json
+import os
 import re
 import sys
 from pathlib import Path
 
 try:
     from docx import Document
-    from docx.shared import Pt
-    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
 except ImportError:
     import subprocess
     print("Installing python-docx...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx", "--user", "--quiet"])
     from docx import Document
-    from docx.shared import Pt
-    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
+
+from resume_docx import blocks_to_document, render_markdown, set_style
+from resume_markdown import parse_blocks
 
 # Paths
 REPO_ROOT = Path(__file__).resolve().parent
@@ -29,142 +43,238 @@ LOCAL_DOCX = Path("/Users/fjabbari/@@@PUBLIC/@@@RESUME_2026/Fred_Jabbari_Resume_
 FALLBACK_DOCX = REPO_ROOT / "Fred_Jabbari_Resume_synced_from_website.docx"
 
 
-def add_hyperlink(paragraph, url: str, text: str):
-    """Add a hyperlink run to a paragraph."""
-    try:
-        from docx.oxml import parse_xml
-        part = paragraph.part
-        r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-        hl = parse_xml(
-            f'<w:hyperlink r:id="{r_id}" xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-            f'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-            f'<w:r><w:rPr><w:color w:val="0563C1"/><w:u w:val="single"/></w:rPr><w:t>{text}</w:t></w:r></w:hyperlink>'
-        )
-        paragraph._p.append(hl)
-    except Exception:
-        paragraph.add_run(text)
-
-
-def add_inline_formatted(paragraph, line: str):
-    """Add a line with **bold** and [text](url) support."""
-    # Extract markdown links [text](url)
-    rest = line
-    while True:
-        m = re.search(r'\[([^\]]+)\]\(([^)]+)\)', rest)
-        if not m:
-            break
-        before = rest[:m.start()]
-        link_text, url = m.group(1), m.group(2)
-        rest = rest[m.end():]
-        # Add bold segments in before
-        for part in re.split(r'\*\*([^*]+)\*\*', before):
-            if part:
-                paragraph.add_run(part)
-        add_hyperlink(paragraph, url, link_text)
-    # Process remaining for **bold**
-    for i, part in enumerate(re.split(r'\*\*([^*]+)\*\*', rest)):
-        if not part:
-            continue
-        if i % 2 == 1:
-            r = paragraph.add_run(part)
-            r.bold = True
-        else:
-            # Handle *italic*
-            for j, seg in enumerate(re.split(r'\*([^*]+)\*', part)):
-                if not seg:
-                    continue
-                if j % 2 == 1:
-                    run = paragraph.add_run(seg)
-                    run.italic = True
-                else:
-                    paragraph.add_run(seg)
-
-
 def md_to_docx(md_path: Path, out_path: Path) -> bool:
     content = md_path.read_text(encoding="utf-8")
     lines = content.splitlines()
 
-    doc = Document()
-    in_list = False
+    doc = blocks_to_document(parse_blocks(lines))
+    doc.save(out_path)
+    write_section_hashes(out_path, split_sections(lines))
+    return True
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        raw = line
-        stripped = line.strip()
 
-        if stripped == "---":
-            if in_list:
-                in_list = False
-            doc.add_paragraph()
-            i += 1
-            continue
+# ---------------------------------------------------------------------------
+# Incremental sync: only rewrite the sections of the .docx whose markdown changed
+# ---------------------------------------------------------------------------
 
-        if stripped.startswith("# "):
-            if in_list:
-                in_list = False
-            p = doc.add_paragraph(stripped[2:].strip())
-            p.style = "Title"
-            i += 1
-            continue
+PREAMBLE_KEY = "__preamble__"
+SECTION_HEADING_RE = re.compile(r"^(##|###) +(.+?)\s*$")
 
-        if stripped.startswith("## "):
-            if in_list:
-                in_list = False
-            p = doc.add_paragraph(stripped[3:].strip())
-            p.style = "Heading 2"
-            i += 1
-            continue
 
-        if stripped.startswith("### "):
-            if in_list:
-                in_list = False
-            p = doc.add_paragraph(stripped[4:].strip())
-            p.style = "Heading 3"
-            i += 1
-            continue
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def sidecar_path(docx_path: Path) -> Path:
+    """Section hashes are stored next to the .docx as <name>.docx.sections.json."""
+    return docx_path.with_name(docx_path.name + ".sections.json")
+
+
+def split_sections(lines):
+    """
+    Split resume markdown into sections at every ## / ### heading.
+
+    Returns a list of dicts: key, heading (None for the preamble), lines, hash.
+    Keys are the heading text, suffixed with #n when a heading repeats.
+    """
+    sections = []
+    seen = {}
+    current = {"key": PREAMBLE_KEY, "heading": None, "lines": []}
+    for line in lines:
+        m = SECTION_HEADING_RE.match(line.strip())
+        if m:
+            sections.append(current)
+            heading = m.group(2)
+            n = seen.get(heading, 0)
+            seen[heading] = n + 1
+            key = heading if n == 0 else f"{heading}#{n}"
+            current = {"key": key, "heading": heading, "lines": [line]}
+        else:
+            current["lines"].append(line)
+    sections.append(current)
+
+    for section in sections:
+        body = "\n".join(section["lines"]).encode("utf-8")
+        section["hash"] = hashlib.sha256(body).hexdigest()
+    return sections
+
+
+def read_section_hashes(docx_path: Path):
+    """Return the sections recorded by the previous sync, or None if there is no sidecar."""
+    path = sidecar_path(docx_path)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data.get("sections", [])
+    except (ValueError, OSError):
+        return None
+
+
+def write_section_hashes(docx_path: Path, sections):
+    data = {
+        "source": os.path.relpath(MD_PATH, REPO_ROOT),
+        "sections": [
+            {"key": s["key"], "heading": s["heading"], "hash": s["hash"]} for s in sections
+        ],
+    }
+    sidecar_path(docx_path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def _element_text(el) -> str:
+    return "".join(t.text or "" for t in el.iter(qn("w:t")))
 
-        if stripped.startswith("- "):
-            if not in_list:
-                in_list = True
-            bullet_text = stripped[2:].strip()
-            p = doc.add_paragraph(style="List Bullet")
-            add_inline_formatted(p, bullet_text)
-            i += 1
-            continue
 
-        if stripped.startswith("  - "):
-            bullet_text = stripped[4:].strip()
-            p = doc.add_paragraph(style="List Bullet 2")
-            add_inline_formatted(p, bullet_text)
-            i += 1
+def _locate_sections(body, sections):
+    """
+    Map section keys to the body elements (paragraphs and tables) they own in the .docx.
+
+    Headings are matched by normalized text, in document order. A section runs from its
+    heading up to the next located heading; the preamble is everything before the first.
+    """
+    elements = [el for el in body.iterchildren() if el.tag != qn("w:sectPr")]
+    texts = [_normalize(_element_text(el)) if el.tag == qn("w:p") else None for el in elements]
+
+    anchors = []  # (element index, key)
+    pos = 0
+    for section in sections:
+        if section["heading"] is None:
             continue
+        target = _normalize(section["heading"])
+        for idx in range(pos, len(elements)):
+            if texts[idx] == target:
+                anchors.append((idx, section["key"]))
+                pos = idx + 1
+                break
+
+    ranges = {}
+    first = anchors[0][0] if anchors else len(elements)
+    ranges[PREAMBLE_KEY] = elements[:first]
+    for n, (idx, key) in enumerate(anchors):
+        stop = anchors[n + 1][0] if n + 1 < len(anchors) else len(elements)
+        ranges[key] = elements[idx:stop]
+    return ranges
+
+
+def _common_subsequence_length(a, b):
+    row = [0] * (len(b) + 1)
+    for x in a:
+        prev_diag = 0
+        for j, y in enumerate(b):
+            prev_diag, row[j + 1] = row[j + 1], prev_diag + 1 if x == y else max(row[j + 1], row[j])
+    return row[-1]
+
+
+def sync_sections(md_path: Path, docx_path: Path):
+    """
+    Patch `docx_path` in place with the sections of `md_path` that changed since the last sync.
 
-        if stripped.startswith("*") and stripped.endswith("*") and not stripped.startswith("**"):
-            if in_list:
-                in_list = False
-            p = doc.add_paragraph()
-            add_inline_formatted(p, stripped[1:-1].strip())
-            i += 1
+    Unchanged sections keep the template's paragraphs and formatting untouched; if the
+    markdown reorders sections, their existing paragraphs are moved into the new order.
+    Returns (changed, moved, total) section counts.
+    """
+    lines = md_path.read_text(encoding="utf-8").splitlines()
+    sections = split_sections(lines)
+    previous = read_section_hashes(docx_path)
+    old_hashes = {s["key"]: s["hash"] for s in previous} if previous is not None else {}
+
+    doc = Document(str(docx_path))
+    body = doc.element.body
+
+    # Locate using the previous heading layout when we have one, so renamed or
+    # removed headings can still be found in the document.
+    located = _locate_sections(body, previous if previous else sections)
+    new_keys = {s["key"] for s in sections}
+
+    # Sections that no longer exist in the markdown are removed outright.
+    for key, elements in located.items():
+        if key not in new_keys:
+            for el in elements:
+                body.remove(el)
+
+    # Kept sections outside the longest common subsequence of the two orders have moved
+    old_order = [s["key"] for s in previous or [] if s["key"] in new_keys and s["key"] in located]
+    new_order = [s["key"] for s in sections if s["key"] in set(old_order)]
+    moved = len(new_order) - _common_subsequence_length(old_order, new_order)
+    sect_pr = body.find(qn("w:sectPr"))
+
+    # Walk backwards so the section after the current one is already final and can
+    # serve as the insertion point.
+    changed = 0
+    next_start = None
+    for section in reversed(sections):
+        key = section["key"]
+        existing = located.get(key)
+        if existing is not None and old_hashes.get(key) == section["hash"]:
+            if existing and moved:
+                for el in existing:
+                    if next_start is not None:
+                        next_start.addprevious(el)
+                    elif sect_pr is not None:
+                        sect_pr.addprevious(el)
+                    else:
+                        body.append(el)
+            if existing:
+                next_start = existing[0]
             continue
 
-        if stripped:
-            if in_list:
-                in_list = False
-            p = doc.add_paragraph()
-            add_inline_formatted(p, stripped)
-        else:
-            if in_list:
-                in_list = False
-            doc.add_paragraph()
+        changed += 1
+        for el in existing or []:
+            body.remove(el)
 
-        i += 1
+        inserted = []
 
-    doc.save(out_path)
-    return True
+        def new_paragraph(style=None, _before=next_start, _inserted=inserted):
+            if _before is not None:
+                p_el = OxmlElement("w:p")
+                _before.addprevious(p_el)
+                p = Paragraph(p_el, doc._body)
+            else:
+                p = doc.add_paragraph()
+            set_style(p, style)
+            _inserted.append(p._p)
+            return p
+
+        render_markdown(section["lines"], new_paragraph)
+        if inserted:
+            next_start = inserted[0]
+
+    if changed or moved:
+        doc.save(str(docx_path))
+    write_section_hashes(docx_path, sections)
+    return changed, moved, len(sections)
+
+
+def sync(out_path: Path, full: bool = False):
+    """Patch an existing .docx section by section, or build it from scratch."""
+    if full or not out_path.exists():
+        md_to_docx(MD_PATH, out_path)
+        print("🔄 Full rebuild from resume.md")
+        return
+    changed, moved, total = sync_sections(MD_PATH, out_path)
+    if changed or moved:
+        print(f"🔄 Updated {changed} and moved {moved} of {total} section(s)")
+    else:
+        print(f"✅ No section changes ({total} sections up to date)")
+
+
+def sync_local_or_fallback(full: bool = False) -> Path:
+    """Sync LOCAL_DOCX, or FALLBACK_DOCX in the repo if the local path is missing/not writable."""
+    try:
+        if not LOCAL_DOCX.parent.exists():
+            raise FileNotFoundError(f"Folder does not exist: {LOCAL_DOCX.parent}")
+        sync(LOCAL_DOCX, full)
+        return LOCAL_DOCX
+    except (PermissionError, FileNotFoundError):
+        sync(FALLBACK_DOCX, full)
+        return FALLBACK_DOCX
 
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--full", action="store_true", help="Rebuild the whole .docx from resume.md")
+    args = ap.parse_args()
+
     print("=" * 60)
     print("Sync website resume (resume.md) → local Word (.docx)")
     print("=" * 60)
@@ -173,20 +283,16 @@ def main():
         print(f"❌ Resume markdown not found: {MD_PATH}")
         sys.exit(1)
 
-    out_path = LOCAL_DOCX
     try:
-        if not out_path.parent.exists():
-            raise FileNotFoundError(f"Folder does not exist: {out_path.parent}")
-        md_to_docx(MD_PATH, out_path)
-        print(f"✅ Resume synced successfully (in place).")
-        print(f"📄 Saved: {out_path}")
-    except (PermissionError, FileNotFoundError) as e:
-        out_path = FALLBACK_DOCX
-        md_to_docx(MD_PATH, out_path)
-        print(f"✅ Resume synced to repo.")
-        print(f"📄 Saved: {out_path}")
-        print(f"\nTo update your local resume in place, run:")
-        print(f'  cp "{out_path}" "{LOCAL_DOCX}"')
+        out_path = sync_local_or_fallback(args.full)
+        if out_path == LOCAL_DOCX:
+            print(f"✅ Resume synced successfully (in place).")
+            print(f"📄 Saved: {out_path}")
+        else:
+            print(f"✅ Resume synced to repo.")
+            print(f"📄 Saved: {out_path}")
+            print(f"\nTo update your local resume in place, run:")
+            print(f'  cp "{out_path}" "{LOCAL_DOCX}"')
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
@@ -0,0 +1,15 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from repo_scripts import load_script as _load_script  # noqa: E402
+
+
+@pytest.fixture
+def load_script():
+    """Import a hyphenated root-level script (e.g. "generate-resume-variants.py") as a module."""
+    return _load_script
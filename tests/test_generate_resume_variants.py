@@ -0,0 +1,53 @@
+import zipfile
+
+from lxml import etree
+
+SPEC = {"tags": {"genai": ["GenAI", "Bedrock", "Amazon Q", "Copilot", "Cursor", "Kiro"]}}
+
+
+def _paragraphs(variants, path):
+    root = etree.fromstring(zipfile.ZipFile(path).read(variants.DOCUMENT_PART))
+    return [variants._para_text(p) for p in root.find(variants.W + "body").iterchildren(variants.W + "p")]
+
+
+def test_exclude_tags_only_removes_bullets(load_script, tmp_path):
+    variants = load_script("generate-resume-variants.py")
+    variants._init_worker(variants.load_template(variants.TEMPLATE_DOCX), SPEC)
+    before = _paragraphs(variants, variants.TEMPLATE_DOCX)
+
+    _, path, removed, _ = variants.build_variant({"name": "no-genai", "exclude_tags": ["genai"]}, tmp_path)
+    after = _paragraphs(variants, path)
+
+    tagged = variants._TEMPLATE["tags"]["genai"]
+    assert removed > 0
+    assert len(after) == len(before) - removed
+    assert not [text for text in after if text.lstrip().startswith("•") and tagged.search(text)]
+    # Headline, headings, summary and the skills line mention GenAI/Bedrock but are not bullets
+    for text in before:
+        if not text.lstrip().startswith("•"):
+            assert text in after
+    assert "SUMMARY" in after and "KEY SKILLS" in after
+    assert any(text.startswith("GenAI:") for text in after)
+
+
+def test_partial_section_order_keeps_unlisted_sections_in_place(load_script, tmp_path):
+    variants = load_script("generate-resume-variants.py")
+    variants._init_worker(variants.load_template(variants.TEMPLATE_DOCX), SPEC)
+    headings = ["SUMMARY", "KEY SKILLS", "PROFESSIONAL EXPERIENCE", "CERTIFICATIONS", "EDUCATION",
+                "ADDITIONAL HIGHLIGHTS", "Additional Resources"]
+    before = _paragraphs(variants, variants.TEMPLATE_DOCX)
+    assert [text for text in before if text in headings] == headings
+
+    variant = {"name": "partial", "section_order": ["SUMMARY", "PROFESSIONAL EXPERIENCE", "KEY SKILLS"]}
+    _, path, _, _ = variants.build_variant(variant, tmp_path)
+    after = _paragraphs(variants, path)
+
+    assert [text for text in after if text in headings] == [
+        "SUMMARY", "PROFESSIONAL EXPERIENCE", "KEY SKILLS", "CERTIFICATIONS", "EDUCATION",
+        "ADDITIONAL HIGHLIGHTS", "Additional Resources",
+    ]
+    assert after[0] == "FRED JABBARI"
+    assert sorted(after) == sorted(before)
+    # Each section keeps its own body: the skills lines follow KEY SKILLS, the jobs follow EXPERIENCE
+    assert after[after.index("KEY SKILLS") + 1].startswith("AWS & Cloud:")
+    assert after.index("PROFESSIONAL EXPERIENCE") < after.index("Earlier Career (Selected)") < after.index("KEY SKILLS")
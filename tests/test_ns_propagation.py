@@ -0,0 +1,100 @@
+import asyncio
+
+import dns.message
+import dns.rdatatype
+import dns.rrset
+
+from ns_propagation import Target, check_round, watch
+
+DOMAIN = "example.com"
+NEW = ["ns1.new-dns.net", "ns2.new-dns.net"]
+OLD = ["ns1.old-dns.net", "ns2.old-dns.net"]
+TIMEOUT = 0.3
+
+
+class StandIn(asyncio.DatagramProtocol):
+    """
+    Local UDP DNS server. Answers NS queries with the next set in `answers`
+    (the last one repeats), as a referral in the authority section when
+    `referral` is set, like a TLD server. `answers=None` never replies.
+    """
+
+    def __init__(self, answers, referral=False):
+        self.answers = answers
+        self.referral = referral
+        self.ns_queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if self.answers is None:
+            return
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        response = dns.message.make_response(query)
+        if question.rdtype == dns.rdatatype.NS:
+            servers = self.answers[min(self.ns_queries, len(self.answers) - 1)]
+            self.ns_queries += 1
+            rrset = dns.rrset.from_text_list(question.name, 300, "IN", "NS", [s + "." for s in servers])
+            (response.authority if self.referral else response.answer).append(rrset)
+        elif question.rdtype == dns.rdatatype.SOA:
+            response.answer.append(dns.rrset.from_text(
+                question.name, 300, "IN", "SOA", "ns1.new-dns.net. admin.example.com. 42 7200 900 1209600 300"))
+        self.transport.sendto(response.to_wire(), addr)
+
+
+async def start(servers):
+    """Start each (name, kind, protocol) on 127.0.0.1 with an ephemeral port; returns (targets, transports)."""
+    loop = asyncio.get_running_loop()
+    targets, transports = [], []
+    for name, kind, protocol in servers:
+        transport, _ = await loop.create_datagram_endpoint(lambda p=protocol: p, local_addr=("127.0.0.1", 0))
+        targets.append(Target(name, "127.0.0.1", transport.get_extra_info("sockname")[1], kind))
+        transports.append(transport)
+    return targets, transports
+
+
+def test_check_round_rates_each_target():
+    async def run():
+        targets, transports = await start([
+            ("tld", "tld", StandIn([NEW], referral=True)),
+            ("match", "resolver", StandIn([NEW])),
+            ("partial", "resolver", StandIn([[NEW[0], OLD[1]]])),
+            ("old", "resolver", StandIn([OLD])),
+            ("silent", "resolver", StandIn(None)),
+        ])
+        try:
+            return await check_round(DOMAIN, NEW, targets, timeout=TIMEOUT)
+        finally:
+            for transport in transports:
+                transport.close()
+
+    result = asyncio.run(run())
+    statuses = {r.target.name: r.status for r in result.results}
+    assert statuses == {"tld": "MATCH", "match": "MATCH", "partial": "PARTIAL", "old": "OLD", "silent": "TIMEOUT"}
+    serials = {r.target.name: r.soa_serial for r in result.results}
+    assert serials["match"] == 42 and serials["tld"] is None
+    assert (result.matched, result.responding, result.percent) == (2, 4, 50.0)
+
+
+def test_watch_stops_once_every_responding_target_matches():
+    async def run():
+        lagging = StandIn([OLD, [NEW[0], OLD[1]], NEW])
+        targets, transports = await start([
+            ("tld", "tld", StandIn([NEW], referral=True)),
+            ("lagging", "resolver", lagging),
+            ("silent", "resolver", StandIn(None)),
+        ])
+        try:
+            rounds = [r async for r in watch(DOMAIN, NEW, targets, timeout=TIMEOUT, interval=0.01, deadline=10)]
+        finally:
+            for transport in transports:
+                transport.close()
+        return rounds, lagging.ns_queries
+
+    rounds, lagging_queries = asyncio.run(run())
+    assert [r.percent for r in rounds] == [50.0, 50.0, 100.0]
+    assert [r.number for r in rounds] == [1, 2, 3]
+    # No further round once the silent target is the only one not matching
+    assert lagging_queries == 3
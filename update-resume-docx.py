@@ -8,36 +8,18 @@ from pathlib import Path
 
 try:
     from docx import Document
-    from docx.oxml import parse_xml
-    from docx.oxml.ns import nsdecls
 except ImportError:
     print("Installing python-docx...")
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx", "--user", "--quiet"])
     from docx import Document
-    from docx.oxml import parse_xml
-    from docx.oxml.ns import nsdecls
+
+from resume_docx import add_hyperlink
 
 RESUME_PATH = "/Users/fjabbari/@@@PUBLIC/@@@RESUME_2026/Fred_Jabbari_Resume_Optimized_2026_with_Bedrock_BDAGood001.docx"
 WEBSITE_URL = "https://ffjconsultingllc.com"
 GITHUB_URL = "https://github.com/ffjabbari/FFJ-CONSULTING-LLC"
 
-def add_hyperlink(paragraph, url, text):
-    """Add a hyperlink to a paragraph"""
-    part = paragraph.part
-    r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-    
-    # Create the hyperlink XML with proper namespace declarations
-    hyperlink_xml = (
-        '<w:hyperlink r:id="%s" xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        '<w:r><w:rPr><w:color w:val="0563C1"/><w:u w:val="single"/></w:rPr><w:t>%s</w:t></w:r>'
-        '</w:hyperlink>' % (r_id, text)
-    )
-    
-    hyperlink = parse_xml(hyperlink_xml)
-    paragraph._p.append(hyperlink)
-
 def update_resume():
     """Add links section to the resume"""
     print(f"Opening resume: {RESUME_PATH}")
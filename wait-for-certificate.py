@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Wait for an ACM certificate to be issued, then optionally continue setup.
+
+Polls describe_certificate with backoff and jitter while checking that the DNS
+validation records resolve publicly, and stops the moment the certificate is
+ISSUED. Time-to-issue is recorded in build/acm/issue-history.jsonl.
+
+Usage:
+  python3 wait-for-certificate.py --cert-arn arn:aws:acm:...
+  python3 wait-for-certificate.py --domain ffjconsulting.com --then ./continue-cloudfront-setup.sh
+  python3 wait-for-certificate.py --history
+"""
+
+import argparse
+import asyncio
+import shlex
+import subprocess
+import sys
+import time
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from acm_waiter import (
+    DEFAULT_TIMEOUT, find_certificate, history_summary, load_history, record_history, wait_for_issued,
+)
+from dns_probe import parse_address
+
+PROFILE = "my-sso"
+REGION = "us-east-1"
+
+
+def print_history():
+    summary = history_summary(load_history())
+    if summary is None:
+        print("ℹ️  No certificate issue history yet")
+        return
+    count, median, longest = summary
+    print(f"ℹ️  {count} certificates: median {median / 60:.1f} min from request to issue, longest {longest / 60:.1f} min")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Wait for ACM certificate validation")
+    target = ap.add_mutually_exclusive_group()
+    target.add_argument("--cert-arn", help="Certificate ARN")
+    target.add_argument("--domain", help="Find the newest certificate for this domain")
+    ap.add_argument("--timeout-minutes", type=float, default=DEFAULT_TIMEOUT / 60, help="Give up after this long")
+    ap.add_argument("--resolver", help="Resolver ip[:port] for the validation CNAME check (default: system)")
+    ap.add_argument("--then", dest="then", help="Command to run once the certificate is issued")
+    ap.add_argument("--history", action="store_true", help="Show time-to-issue history and exit")
+    args = ap.parse_args()
+
+    if args.history:
+        print_history()
+        return
+    if not args.cert_arn and not args.domain:
+        ap.error("--cert-arn or --domain is required")
+
+    import boto3
+    try:
+        session = boto3.Session(profile_name=PROFILE)
+        acm = session.client("acm", region_name=REGION)
+        cert_arn = args.cert_arn or find_certificate(acm, args.domain)
+    except Exception as e:
+        print(f"❌ Error connecting to AWS: {e}")
+        sys.exit(1)
+    if not cert_arn:
+        print(f"❌ No certificate found for {args.domain}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Waiting for certificate validation")
+    print("=" * 60)
+    print(f"Certificate: {cert_arn}")
+    print_history()
+    print("")
+
+    nameserver, port = parse_address(args.resolver) if args.resolver else (None, 53)
+    start = time.monotonic()
+
+    def on_event(kind, message):
+        elapsed = time.monotonic() - start
+        icon = {"dns": "🌐", "error": "⚠️ "}.get(kind, "📜")
+        print(f"[{elapsed / 60:5.1f} min] {icon} {message}", flush=True)
+
+    try:
+        result = asyncio.run(wait_for_issued(acm, cert_arn, timeout=args.timeout_minutes * 60,
+                                             nameserver=nameserver, port=port, on_event=on_event))
+    except KeyboardInterrupt:
+        print("\n⚠️  Stopped waiting")
+        sys.exit(130)
+    except TimeoutError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except (ClientError, BotoCoreError) as e:
+        # Transient errors are retried inside the wait; this one cannot recover
+        print(f"❌ Stopped waiting: {e}")
+        sys.exit(1)
+
+    print("")
+    if result.status != "ISSUED":
+        print(f"❌ Certificate not issued: {result.status} after {result.waited / 60:.1f} min")
+        if result.dns_visible_after is None:
+            print("   The validation CNAMEs never resolved publicly; add them to the hosted zone")
+        sys.exit(1)
+
+    entry = record_history(result)
+    print(f"✅ Certificate issued after {result.waited / 60:.1f} min of waiting ({result.polls} status checks)")
+    if entry["seconds_to_issue"]:
+        print(f"   {entry['seconds_to_issue'] / 60:.1f} min from request to issue")
+    if args.then:
+        print(f"\n▶️  {args.then}\n", flush=True)
+        sys.exit(subprocess.call(shlex.split(args.then)))
+
+
+if __name__ == "__main__":
+    main()
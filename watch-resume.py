@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Keep the Word and website resumes in sync automatically.
+
+Watches frontend/src/content/resume.md and, after each burst of edits settles
+(debounced), regenerates the .docx via sync-resume-md-to-docx.py plus the other
+formats from build-resume-formats.py. Work only happens when the markdown's
+content hash actually changed, so saves without edits, editor swap files and
+touch(1) are ignored.
+
+  - Linux: inotify (via ctypes, no extra packages)
+  - macOS / other: stat polling of the file
+
+File events are read on the watcher thread; syncs run on a separate worker
+thread so a slow sync never drops events. Each sync logs its latency.
+
+Run from repo root:
+  python3 watch-resume.py                     # docx + html/txt/json
+  python3 watch-resume.py --formats ""        # docx only
+  python3 watch-resume.py --debounce 1.0 --sync-now
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from repo_scripts import load_script
+
+REPO_ROOT = Path(__file__).resolve().parent
+MD_PATH = REPO_ROOT / "frontend" / "src" / "content" / "resume.md"
+DEFAULT_DEBOUNCE = 0.5
+POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def log(text):
+    print(f"[{time.strftime('%H:%M:%S')}] {text}", flush=True)
+
+
+def content_hash(path):
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Watchers: call on_change() for every relevant file-system event
+# ---------------------------------------------------------------------------
+
+class InotifyWatcher:
+    """Watches the file's directory, since editors often save by writing a temp file and renaming it."""
+
+    def __init__(self, path, on_change):
+        self.path = Path(path)
+        self.on_change = on_change
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, str(self.path.parent).encode(), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {self.path.parent}")
+        self.stopped = threading.Event()
+
+    def run(self):
+        name = self.path.name.encode()
+        try:
+            while not self.stopped.is_set():
+                ready, _, _ = select.select([self.fd], [], [], 0.5)
+                if not ready:
+                    continue
+                data = os.read(self.fd, 64 * 1024)
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                    start = offset + EVENT_HEADER.size
+                    event_name = data[start:start + length].rstrip(b"\0")
+                    offset = start + length
+                    if event_name == name:
+                        self.on_change()
+        finally:
+            os.close(self.fd)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class PollingWatcher:
+    """Portable fallback: compare (mtime, size) every POLL_INTERVAL seconds."""
+
+    def __init__(self, path, on_change, interval=POLL_INTERVAL):
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def _stamp(self):
+        try:
+            st = self.path.stat()
+            return st.st_mtime_ns, st.st_size
+        except FileNotFoundError:
+            return None
+
+    def run(self):
+        last = self._stamp()
+        while not self.stopped.wait(self.interval):
+            stamp = self._stamp()
+            if stamp != last:
+                last = stamp
+                self.on_change()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def make_watcher(path, on_change):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path, on_change), "inotify"
+        except (OSError, AttributeError) as e:
+            log(f"⚠️  inotify unavailable ({e}); falling back to polling")
+    return PollingWatcher(path, on_change), "polling"
+
+
+# ---------------------------------------------------------------------------
+# Debounced sync
+# ---------------------------------------------------------------------------
+
+class ResumeSyncer:
+    """Collapses bursts of events into one sync, run on a single worker thread."""
+
+    def __init__(self, md_path, formats, debounce):
+        self.md_path = Path(md_path)
+        self.formats = formats
+        self.debounce = debounce
+        self.sync_script = load_script("sync-resume-md-to-docx.py")
+        self.sync_script.MD_PATH = self.md_path
+        self.build_script = load_script("build-resume-formats.py") if formats else None
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.lock = threading.Lock()
+        self.timer = None
+        self.first_event = None
+        self.last_hash = content_hash(self.md_path)
+
+    def on_change(self):
+        """Called on the watcher thread for each event; (re)starts the debounce timer."""
+        with self.lock:
+            if self.first_event is None:
+                self.first_event = time.perf_counter()
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self._flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _flush(self):
+        with self.lock:
+            first_event, self.first_event, self.timer = self.first_event, None, None
+        self.worker.submit(self.sync, first_event)
+
+    def sync(self, first_event=None, force=False):
+        digest = content_hash(self.md_path)
+        if digest is None:
+            log(f"⚠️  {self.md_path.name} is missing; waiting for it to reappear")
+            return
+        if digest == self.last_hash and not force:
+            log("ℹ️  Content unchanged; skipping sync")
+            return
+
+        start = time.perf_counter()
+        try:
+            out = self.sync_script.sync_local_or_fallback()
+            built = []
+            if self.build_script:
+                results = self.build_script.build(self.md_path, self.build_script.OUT_DIR, self.formats)
+                for name, (_, _, err) in results.items():
+                    if err:
+                        log(f"❌ {name} failed: {err}")
+                    else:
+                        built.append(name)
+        except Exception as e:
+            log(f"❌ Sync failed: {e}")
+            return
+        self.last_hash = digest
+
+        done = time.perf_counter()
+        latency = f"sync {(done - start) * 1000:.0f} ms"
+        if first_event is not None:
+            latency += f", {(done - first_event) * 1000:.0f} ms since first edit"
+        extra = f" + {', '.join(built)}" if built else ""
+        log(f"✅ Synced {out.name}{extra} ({latency})")
+
+    def close(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+        self.worker.shutdown(wait=True)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--md", default=str(MD_PATH), help="Resume markdown to watch")
+    ap.add_argument("--formats", default="html,txt,json",
+                    help="Extra formats from build-resume-formats.py (comma-separated, empty for docx only)")
+    ap.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="Seconds of quiet before syncing")
+    ap.add_argument("--sync-now", action="store_true", help="Sync once at startup even if nothing changed")
+    args = ap.parse_args()
+
+    md_path = Path(args.md).resolve()
+    if not md_path.exists():
+        print(f"❌ Resume markdown not found: {md_path}")
+        sys.exit(1)
+    formats = [f.strip() for f in args.formats.split(",") if f.strip() and f.strip() != "docx"]
+
+    syncer = ResumeSyncer(md_path, formats, args.debounce)
+    watcher, kind = make_watcher(md_path, syncer.on_change)
+
+    print("=" * 60)
+    print("Watching resume.md for changes")
+    print("=" * 60)
+    print(f"File     : {md_path}")
+    print(f"Watcher  : {kind}, debounce {args.debounce:.2f}s")
+    print(f"Outputs  : docx{''.join(', ' + f for f in formats)}")
+    print("Press Ctrl+C to stop.")
+    print("")
+
+    if args.sync_now:
+        syncer.worker.submit(syncer.sync, None, True)
+
+    thread = threading.Thread(target=watcher.run, name="resume-watcher", daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.5)
+    except KeyboardInterrupt:
+        print("")
+        log("Stopping...")
+    finally:
+        watcher.stop()
+        thread.join(2)
+        syncer.close()
+
+
+if __name__ == "__main__":
+    main()
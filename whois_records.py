@@ -0,0 +1,573 @@
+"""
+WHOIS / RDAP registration records: parsing, normalization and a local cache.
+
+parse_whois() makes one pass over the raw text. Each line is split once into
+label and value, and a dispatch table built at import maps every known label
+(ICANN gTLD layout, older registrar layouts, RIPE-style ccTLDs such as .de/.fr/.ru,
+.jp bracket labels and .uk indented blocks) to a canonical field. RDAP JSON goes
+through parse_rdap(). Both return the same normalized dict:
+
+  domain, registrar, registrar_url, registrant_name, registrant_org,
+  registrant_email (masked), creation_date, updated_date, expiry_date (ISO 8601, UTC),
+  nameservers (lowercased, deduplicated), status (list), dnssec,
+  registered (True / False / None if unknown), source ("whois" / "rdap")
+
+WhoisCache keeps parsed records in build/cache/whois.json with a TTL, so bulk
+checks across a portfolio only query domains whose record is missing or stale.
+lookup_many() runs the remaining lookups through a bounded pool of whois
+subprocesses, dispatched from per-server queues under politeness limits, with
+retry and backoff.
+
+  from whois_records import WhoisCache, lookup
+  cache = WhoisCache()
+  info = lookup("ffjconsulting.com", cache)
+  for domain, info in lookup_many(portfolio, cache):    # as results arrive
+      ...
+  cache.save()
+"""
+
+import heapq
+import itertools
+import json
+import os
+import random
+import re
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_PATH = REPO_ROOT / "build" / "cache" / "whois.json"
+WHOIS_TTL = 24 * 60 * 60
+WHOIS_TIMEOUT = 10
+RDAP_URL = "https://rdap.org/domain/{}"
+
+# Batch lookups: whois servers rate-limit per client address, often after a few
+# dozen quick queries, so each server gets a small concurrency cap and spacing
+DEFAULT_WORKERS = 16
+PER_SERVER_CONCURRENCY = 2
+SERVER_INTERVAL = 1.0
+MAX_SERVER_INTERVAL = 30.0
+MAX_RETRIES = 3
+BASE_BACKOFF = 2.0
+
+# Registry servers for common TLDs; others default to whois.nic.<tld>
+WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.pir.org",
+    "io": "whois.nic.io",
+    "ai": "whois.nic.ai",
+    "co": "whois.nic.co",
+    "us": "whois.nic.us",
+    "uk": "whois.nic.uk",
+    "de": "whois.denic.de",
+    "jp": "whois.jprs.jp",
+    "ru": "whois.tcinet.ru",
+    "fr": "whois.nic.fr",
+    "br": "whois.registro.br",
+    "dev": "whois.nic.google",
+    "app": "whois.nic.google",
+}
+
+# ---------------------------------------------------------------------------
+# Field dispatch table
+# ---------------------------------------------------------------------------
+
+FIELD_LABELS = {
+    "domain": ("domain name", "domain", "domain_name"),
+    "registrar": ("registrar", "sponsoring registrar", "registrar name", "registrar organization"),
+    "registrar_url": ("registrar url", "referral url", "url"),
+    "registrant_name": ("registrant name", "registrant", "registrant contact name", "owner", "holder"),
+    "registrant_org": ("registrant organization", "registrant organisation", "org", "organization"),
+    "registrant_email": ("registrant email", "registrant contact email"),
+    "creation_date": ("creation date", "created on", "created", "registered on", "registration time",
+                      "registration date", "domain registration date", "record created"),
+    "updated_date": ("updated date", "last updated on", "last updated", "last-update", "last modified",
+                     "changed", "modified"),
+    "expiry_date": ("registry expiry date", "registrar registration expiration date", "expiry date",
+                    "expiration date", "expiration time", "expires on", "expires", "paid-till",
+                    "record expires", "domain expiration date"),
+    "nameservers": ("name server", "name servers", "nameserver", "nameservers", "nserver"),
+    "status": ("domain status", "status", "state"),
+    "dnssec": ("dnssec",),
+}
+LIST_FIELDS = {"nameservers", "status"}
+# Labels whose values may continue on indented lines below them (.uk, .eu blocks)
+BLOCK_FIELDS = {"registrar", "registrant_name", "nameservers", "status", "domain"}
+FIELD_TABLE = {label: field for field, labels in FIELD_LABELS.items() for label in labels}
+
+NOT_FOUND_RE = re.compile(
+    r"^\W*(?:no match for|not found|no data found|no entries found|domain not found|no object found"
+    r"|the queried object does not exist|status:\s*(?:free|available)|this query returned 0 objects)",
+    re.I | re.M,
+)
+RATE_LIMIT_RE = re.compile(r"limit exceeded|exceeded the maximum|too many (?:queries|requests)|try again later", re.I)
+REGISTRAR_TAG_RE = re.compile(r"\s*\[Tag = [^\]]*\]\s*$")
+
+DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%d %H:%M:%S%z", "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d", "%d-%b-%Y", "%d-%b-%Y %H:%M:%S", "%Y/%m/%d", "%Y/%m/%d %H:%M:%S", "%Y.%m.%d",
+    "%d.%m.%Y", "%d/%m/%Y", "%Y%m%d", "%a %b %d %H:%M:%S %Z %Y", "%B %d %Y",
+)
+# Zone annotations registries append to local times: "2023/04/01 01:05:04 (JST)"
+ZONE_OFFSETS = {
+    "UTC": timezone.utc, "GMT": timezone.utc,
+    "JST": timezone(timedelta(hours=9)), "KST": timezone(timedelta(hours=9)),
+}
+ZONE_SUFFIX_RE = re.compile(r"\s*(?:\(([A-Z]{2,5})\)|(UTC|GMT))$")
+
+
+def parse_date(value):
+    """
+    ISO 8601 UTC string for the date formats registries use, or the original text if none
+    match. Times without an offset are UTC unless a known zone annotation (JST) follows them.
+    """
+    text = value.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Drop ".br" "#12345" suffixes; read a zone annotation ("(JST)", "UTC") as its offset
+    text = re.sub(r"\s*#\d+$", "", text)
+    zone = timezone.utc
+    m = ZONE_SUFFIX_RE.search(text)
+    if m:
+        zone = ZONE_OFFSETS.get(m.group(1) or m.group(2))
+        if zone is None:
+            return value.strip()  # unknown zone: better the original text than a wrong time
+        text = text[:m.start()]
+    if text.endswith("Z"):
+        text = text[:-1] + "+0000"
+    text = re.sub(r"([+-]\d\d):(\d\d)$", r"\1\2", text)
+    for fmt in DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=zone)
+        return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return value.strip()
+
+
+def _nameserver(value):
+    # "NS1.EXAMPLE.COM. 192.0.2.1" -> "ns1.example.com"
+    return value.split()[0].rstrip(".").lower() if value.split() else ""
+
+
+def mask_email(email):
+    """Show only the first two characters of the mailbox (idempotent)."""
+    user, at, host = email.partition("@")
+    if not at or user.endswith("***"):
+        return email
+    return (user[:2] if len(user) > 2 else "") + "***@" + host
+
+
+def _normalize(info):
+    for field in ("creation_date", "updated_date", "expiry_date"):
+        if field in info:
+            info[field] = parse_date(info[field])
+    if "registrar" in info:
+        info["registrar"] = REGISTRAR_TAG_RE.sub("", info["registrar"])
+    if "domain" in info:
+        info["domain"] = info["domain"].rstrip(".").lower()
+    # Registrant emails are never kept in full, not even in the cache
+    if "registrant_email" in info:
+        info["registrant_email"] = mask_email(info["registrant_email"])
+    servers = (_nameserver(ns) for ns in info.get("nameservers", ()))
+    info["nameservers"] = list(dict.fromkeys(ns for ns in servers if ns))
+    # "clientTransferProhibited https://icann.org/epp#..." -> "clientTransferProhibited";
+    # .ru "REGISTERED, DELEGATED" -> two entries
+    statuses = []
+    for value in info.get("status", ()):
+        parts = value.split()
+        if parts and parts[0].endswith(","):
+            statuses.extend(p for p in re.split(r"[\s,]+", value) if p)
+        elif parts:
+            statuses.append(parts[0])
+    info["status"] = list(dict.fromkeys(statuses))
+    return info
+
+
+def parse_whois(text):
+    """Normalized record from raw WHOIS output, or None for empty / rate-limited responses."""
+    if not text or not text.strip():
+        return None
+    if text.lstrip().startswith("{"):
+        try:
+            return parse_rdap(json.loads(text))
+        except ValueError:
+            pass
+
+    info = {}
+    pending = None
+    for line in text.splitlines():
+        if line.startswith(("%", "#", ">>>")):
+            pending = None
+            continue
+        # One split per line: "Label: value" or .jp "[Label] value"; the label picks the field
+        stripped = line.strip()
+        if stripped.startswith("["):
+            label, sep, value = stripped[1:].partition("]")
+        else:
+            label, sep, value = stripped.partition(":")
+        field = FIELD_TABLE.get(label.strip().lower()) if sep else None
+        if field is not None:
+            value = value.strip()
+            if value:
+                if field in LIST_FIELDS:
+                    info.setdefault(field, []).append(value)
+                else:
+                    info.setdefault(field, value)
+            pending = field if not value and field in BLOCK_FIELDS else None
+        elif pending and line[:1].isspace() and stripped:
+            # Continuation line inside a block; glue records like "ns1.x 2001:db8::1" land here too
+            if pending in LIST_FIELDS:
+                info.setdefault(pending, []).append(stripped)
+            else:
+                info.setdefault(pending, stripped)
+        elif not stripped or not line[:1].isspace():
+            pending = None
+
+    if info.get("creation_date") or info.get("nameservers") or info.get("registrar"):
+        registered = True
+    elif NOT_FOUND_RE.search(text):
+        registered = False
+    elif RATE_LIMIT_RE.search(text):
+        return None
+    else:
+        registered = None
+    info = _normalize(info)
+    info["registered"] = registered
+    info["source"] = "whois"
+    return info
+
+
+# ---------------------------------------------------------------------------
+# RDAP
+# ---------------------------------------------------------------------------
+
+RDAP_EVENTS = {"registration": "creation_date", "expiration": "expiry_date", "last changed": "updated_date"}
+
+
+def _epp_status(value):
+    first, *rest = value.split()
+    return first + "".join(word.capitalize() for word in rest)
+
+
+def _vcard(entity):
+    """{property: value} from an RDAP entity's jCard (fn, org, email, url)."""
+    card = entity.get("vcardArray") or [None, []]
+    values = {}
+    for prop in card[1] if len(card) > 1 else []:
+        if len(prop) >= 4 and prop[0] not in values:
+            value = prop[3]
+            values[prop[0]] = " ".join(value) if isinstance(value, list) else str(value)
+    return values
+
+
+def _entities(entities):
+    for entity in entities or []:
+        yield entity
+        yield from _entities(entity.get("entities"))
+
+
+def parse_rdap(data):
+    """Normalized record from an RDAP domain response (RFC 9083)."""
+    if data.get("errorCode") == 404:
+        return {"registered": False, "nameservers": [], "status": [], "source": "rdap"}
+    info = {}
+    if data.get("ldhName"):
+        info["domain"] = data["ldhName"]
+    for event in data.get("events", []):
+        field = RDAP_EVENTS.get(event.get("eventAction"))
+        if field and event.get("eventDate"):
+            info.setdefault(field, event["eventDate"])
+    info["nameservers"] = [ns.get("ldhName", "") for ns in data.get("nameservers", [])]
+    # RDAP "client transfer prohibited" -> EPP "clientTransferProhibited"
+    info["status"] = [_epp_status(s) for s in data.get("status", [])]
+    if "secureDNS" in data:
+        info["dnssec"] = "signed" if data["secureDNS"].get("delegationSigned") else "unsigned"
+    for entity in _entities(data.get("entities")):
+        card = _vcard(entity)
+        roles = entity.get("roles", [])
+        if "registrar" in roles and "registrar" not in info and card.get("fn"):
+            info["registrar"] = card["fn"]
+            for link in entity.get("links", []):
+                if link.get("rel") == "about" and link.get("href"):
+                    info["registrar_url"] = link["href"]
+        if "registrant" in roles:
+            for prop, field in (("fn", "registrant_name"), ("org", "registrant_org"), ("email", "registrant_email")):
+                if card.get(prop):
+                    info.setdefault(field, card[prop])
+    info = _normalize(info)
+    info["registered"] = True
+    info["source"] = "rdap"
+    return info
+
+
+# ---------------------------------------------------------------------------
+# Fetching and caching
+# ---------------------------------------------------------------------------
+
+def run_whois(domain, timeout=WHOIS_TIMEOUT):
+    """Raw `whois` output; raises FileNotFoundError if whois is missing, TimeoutExpired on timeout."""
+    result = subprocess.run(["whois", domain], capture_output=True, text=True, timeout=timeout)
+    return result.stdout
+
+
+def whois_server(domain):
+    """Registry WHOIS server a lookup for `domain` hits first; the politeness key for ServerGates."""
+    tld = domain.rstrip(".").rsplit(".", 1)[-1].lower()
+    return WHOIS_SERVERS.get(tld, f"whois.nic.{tld}")
+
+
+class ServerGates:
+    """
+    Per-server politeness for the lookup_many() dispatcher: at most
+    `per_server` lookups in flight against one WHOIS server, and starts spaced
+    at least `interval` seconds apart. A rate-limit reply doubles that server's
+    interval; successes walk it back. Only the dispatching thread uses it, so
+    pool workers never wait on a gate.
+    """
+
+    def __init__(self, per_server=PER_SERVER_CONCURRENCY, interval=SERVER_INTERVAL):
+        self.per_server = per_server
+        self.base_interval = interval
+        self.servers = {}
+
+    def _state(self, server):
+        if server not in self.servers:
+            self.servers[server] = {"in_flight": 0, "interval": self.base_interval, "next_start": 0.0}
+        return self.servers[server]
+
+    def wait_time(self, server, now):
+        """Seconds until a lookup against `server` may start, or None while all its slots are busy."""
+        state = self._state(server)
+        if state["in_flight"] >= self.per_server:
+            return None
+        return max(0.0, state["next_start"] - now)
+
+    def started(self, server, now):
+        state = self._state(server)
+        state["in_flight"] += 1
+        state["next_start"] = max(now, state["next_start"]) + state["interval"]
+
+    def finished(self, server):
+        self._state(server)["in_flight"] -= 1
+
+    def throttled(self, server):
+        state = self._state(server)
+        state["interval"] = min(MAX_SERVER_INTERVAL, state["interval"] * 2)
+        state["next_start"] = max(state["next_start"], time.monotonic() + state["interval"])
+
+    def succeeded(self, server):
+        state = self._state(server)
+        state["interval"] = max(self.base_interval, state["interval"] * 0.8)
+
+
+def fetch_rdap(domain, timeout=WHOIS_TIMEOUT):
+    """Parsed RDAP record via the rdap.org bootstrap redirector, or None on network errors."""
+    request = urllib.request.Request(RDAP_URL.format(domain), headers={"Accept": "application/rdap+json"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return parse_rdap(json.load(response))
+    except urllib.error.HTTPError as e:
+        return parse_rdap({"errorCode": 404}) if e.code == 404 else None
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+class WhoisCache:
+    """{domain: {"fetched_at": ts, "info": record}} persisted as JSON; entries older than the TTL are misses."""
+
+    def __init__(self, path=CACHE_PATH, ttl=WHOIS_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+        # Caches written before emails were masked are scrubbed on the next save()
+        for entry in self.entries.values():
+            if "registrant_email" in entry["info"]:
+                entry["info"]["registrant_email"] = mask_email(entry["info"]["registrant_email"])
+
+    def get(self, domain):
+        entry = self.entries.get(domain.lower())
+        if entry is None or time.time() - entry["fetched_at"] >= self.ttl:
+            return None
+        return entry["info"]
+
+    def put(self, domain, info):
+        self.entries[domain.lower()] = {"fetched_at": time.time(), "info": info}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text(json.dumps(self.entries, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def _backoff(attempt):
+    return BASE_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _conclusive(info):
+    return info is not None and info.get("registered") is not None
+
+
+def whois_attempt(domain, timeout=WHOIS_TIMEOUT):
+    """
+    One `whois` run: (record or None, retry) where retry is None when done,
+    "timeout" or "throttled" (rate-limit reply) when worth retrying. Raises
+    FileNotFoundError if whois is not installed.
+    """
+    try:
+        text = run_whois(domain, timeout)
+    except subprocess.TimeoutExpired:
+        return None, "timeout"
+    info = parse_whois(text)
+    if info is None and RATE_LIMIT_RE.search(text):
+        return None, "throttled"
+    return info, None
+
+
+def fetch(domain, timeout=WHOIS_TIMEOUT, max_retries=MAX_RETRIES):
+    """
+    Parsed record from `whois`, retried with jittered exponential backoff on
+    timeouts and rate-limit replies; RDAP when whois is not installed or gives
+    nothing usable. None when every attempt fails.
+    """
+    info = None
+    for attempt in range(max_retries + 1):
+        try:
+            info, retry = whois_attempt(domain, timeout)
+        except FileNotFoundError:
+            break
+        if retry is None:
+            break
+        if attempt < max_retries:
+            time.sleep(_backoff(attempt))
+    if not _conclusive(info):
+        info = fetch_rdap(domain, timeout) or info
+    return info
+
+
+def lookup(domain, cache=None, refresh=False, timeout=WHOIS_TIMEOUT):
+    """Cached record for `domain`, otherwise fetch(). Only conclusive records are cached."""
+    domain = domain.strip().lower()
+    if cache is not None and not refresh:
+        info = cache.get(domain)
+        if info is not None:
+            return info
+    info = fetch(domain, timeout)
+    if info is not None and info.get("registered") is not None and cache is not None:
+        cache.put(domain, info)
+    return info
+
+
+# One queued lookup step: kind is "whois" or "rdap"; `best` is the best record so far
+_Job = namedtuple("_Job", ["domain", "kind", "attempt", "best"])
+
+
+def _run_job(job, timeout):
+    """Pool worker: one whois attempt or one RDAP request; never waits on a gate."""
+    if job.kind == "rdap":
+        return fetch_rdap(job.domain, timeout), None
+    try:
+        return whois_attempt(job.domain, timeout)
+    except FileNotFoundError:
+        return None, "missing"
+
+
+def lookup_many(domains, cache=None, refresh=False, workers=DEFAULT_WORKERS, per_server=PER_SERVER_CONCURRENCY,
+                interval=SERVER_INTERVAL, timeout=WHOIS_TIMEOUT, max_retries=MAX_RETRIES):
+    """
+    Yield (domain, record) in completion order: cache hits first, then lookups
+    from a pool of up to `workers` concurrent whois subprocesses. Pending
+    lookups wait in one queue per registry server and are only handed to the
+    pool once that server's gate allows a start, so a .com-heavy batch cannot
+    tie up workers that other servers could use. Retries wait out their backoff
+    in a timer heap, not in a worker. Conclusive records are added to `cache`
+    as they arrive.
+    """
+    queues = defaultdict(deque)   # server -> jobs ready to start
+    for domain in dict.fromkeys(d.strip().lower() for d in domains if d.strip()):
+        info = cache.get(domain) if cache is not None and not refresh else None
+        if info is not None:
+            yield domain, info
+        else:
+            queues[whois_server(domain)].append(_Job(domain, "whois", 0, None))
+    if not queues:
+        return
+
+    gates = ServerGates(per_server, interval)
+    delayed = []                  # heap of (ready_at, seq, server, job) waiting out a backoff
+    running = {}                  # future -> (server, job)
+    seq = itertools.count()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            while queues or delayed or running:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    _, _, server, job = heapq.heappop(delayed)
+                    queues[server].appendleft(job)
+                wake = delayed[0][0] if delayed else None
+                for server in list(queues):
+                    queue = queues[server]
+                    while queue and len(running) < workers:
+                        wait_time = gates.wait_time(server, now)
+                        if wait_time is None:
+                            break
+                        if wait_time > 0:
+                            wake = min(wake, now + wait_time) if wake is not None else now + wait_time
+                            break
+                        job = queue.popleft()
+                        gates.started(server, now)
+                        running[pool.submit(_run_job, job, timeout)] = (server, job)
+                    if not queue:
+                        del queues[server]
+
+                if not running:
+                    time.sleep(max(0.0, wake - time.monotonic()))
+                    continue
+                done, _ = wait(running, timeout=None if wake is None else max(0.0, wake - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    server, job = running.pop(future)
+                    gates.finished(server)
+                    info, retry = future.result()
+                    if job.kind == "whois":
+                        if retry is None:
+                            gates.succeeded(server)
+                        elif retry != "missing" and job.attempt < max_retries:
+                            if retry == "throttled":
+                                gates.throttled(server)
+                            ready_at = time.monotonic() + _backoff(job.attempt)
+                            heapq.heappush(delayed, (ready_at, next(seq), server,
+                                                     job._replace(attempt=job.attempt + 1)))
+                            continue
+                        if not _conclusive(info):
+                            # Fall back to RDAP, gated like any other server
+                            queues["rdap.org"].append(_Job(job.domain, "rdap", 0, info or job.best))
+                            continue
+                    else:
+                        info = info or job.best
+                    if _conclusive(info) and cache is not None:
+                        cache.put(job.domain, info)
+                    yield job.domain, info
+        finally:
+            for future in running:
+                future.cancel()